@@ -13,9 +13,10 @@ class GitConfigValue(ConfigValue):
         default=None,
         description="Branch structure: canonical names with optional aliases to reconcile",
     )
-    ci_variables: list[str] | None = public_field(
+    ci_variables: list[str | dict] | None = public_field(
         default=None,
-        description="Env variable names to read locally and push as masked CI/CD variables on the remote",
+        description="Env variable names to read locally and push as masked CI/CD variables on the remote; "
+        'a {"name", "scope": "group", "group"} mapping places one on the group / organization instead',
     )
     main_branch: str | list[str] | None = public_field(
         default=None,
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import ClassVar
+
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+from wexample_helpers.exception.undefined_exception import UndefinedException
+
+
+@base_class
+class RemoteUnavailableException(UndefinedException):
+    """Raised instead of sending a request to a host known to be down."""
+
+    error_code: ClassVar[str] = "REMOTE_UNAVAILABLE"
+    failures: int = public_field(
+        default=0, description="Consecutive failures that opened the circuit"
+    )
+    host: str | None = public_field(default=None, description="Unavailable API host")
+    retry_in: float | None = public_field(
+        default=None, description="Seconds before the host is probed again"
+    )
+
+    def _build_message(self) -> str:
+        message = (
+            f"Remote host {self.host} is unavailable "
+            f"({self.failures} consecutive failures)"
+        )
+        if self.retry_in is not None:
+            message += f", next check in {self.retry_in:.0f}s"
+        return message
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def get_cache_dir() -> Path:
+    """Directory for state kept between runs (``$XDG_CACHE_HOME`` aware)."""
+    import os
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(base) / "wexample-filestate-git"
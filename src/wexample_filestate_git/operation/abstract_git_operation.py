@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 from wexample_filestate.operation.abstract_operation import AbstractOperation
 
@@ -12,7 +13,32 @@ if TYPE_CHECKING:
     from wexample_filestate.enum.scopes import Scope
 
 
+def _invalidate_git_repo_after(method: Callable[..., Any]) -> Callable[..., Any]:
+    import functools
+
+    @functools.wraps(method)
+    def wrapper(self: AbstractGitOperation, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._invalidate_target_git_repo()
+
+    wrapper.invalidates_git_repo = True
+    return wrapper
+
+
 class AbstractGitOperation(AbstractOperation):
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Whatever an operation changes (config, refs, a new .git directory),
+        # shared Repo handles opened before must not be served any longer.
+        for name in ("apply_operation", "undo"):
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(
+                method, "invalidates_git_repo", False
+            ):
+                setattr(cls, name, _invalidate_git_repo_after(method))
+
     @classmethod
     def get_scopes(cls) -> [Scope]:
         from wexample_filestate.enum.scopes import Scope
@@ -21,10 +47,15 @@ class AbstractGitOperation(AbstractOperation):
 
     # Shared Git helpers
     def _get_target_git_repo(self) -> Repo:
-        """Return the GitPython Repo for the target path."""
-        from git import Repo
+        """Return the shared GitPython Repo for the target path."""
+        from wexample_filestate_git.repo.git_repo_registry import GitRepoRegistry
+
+        return GitRepoRegistry.get_repo(self.target.get_path())
+
+    def _invalidate_target_git_repo(self) -> None:
+        from wexample_filestate_git.repo.git_repo_registry import GitRepoRegistry
 
-        return Repo(self.target.get_path())
+        GitRepoRegistry.invalidate(self.target.get_path())
 
     # Evaluate an 'active' flag consistently across operations.
     # Accepts raw values (bool, int, str, etc.) and treats missing as inactive.
@@ -25,13 +25,16 @@ class GitCreateBranchOperation(AbstractGitOperation):
         - If the repository has no commits yet, an initial empty commit is created first
           so that HEAD resolves to a valid object and the branch pointer can be set.
         """
+        from wexample_filestate_git.repo.ref_snapshot import RefSnapshot
+
+        snapshot = RefSnapshot.read(self.target.get_path())
+        if snapshot is not None and snapshot.has_branch(self.branch_name):
+            return  # Already exists
+
         repo = self._get_target_git_repo()
         if not repo:
             return
 
-        if any(h.name == self.branch_name for h in getattr(repo, "heads", [])):
-            return  # Already exists
-
         # A freshly-initialised repo (git init, no commits) has no HEAD to anchor
         # the branch pointer on.  Create an initial empty commit in that case.
         try:
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_filestate_git.operation.abstract_git_operation import AbstractGitOperation
+from wexample_filestate_git.remote.mixin.with_git_remote_mixin import WithGitRemoteMixin
+
+if TYPE_CHECKING:
+    from git import Repo
+
+    from wexample_filestate_git.repo.branch_reconciliation_plan import (
+        BranchReconciliationPlan,
+    )
+    from wexample_filestate_git.repo.branch_reconciliation_step import (
+        BranchReconciliationStep,
+    )
+    from wexample_filestate_git.repo.git_push_batcher import GitPushBatcher
+    from wexample_filestate_git.repo.ref_snapshot import RefSnapshot
+
+
+@base_class
+class GitReconcileBranchesOperation(WithGitRemoteMixin, AbstractGitOperation):
+    """Apply a whole branch reconciliation plan in one rectify pass.
+
+    Local renames and merges run first, in plan order. Each remote then gets
+    a single atomic push carrying every canonical branch and every alias
+    deletion; only when an alias is to be replaced as default branch by a
+    canonical branch the host does not know yet are updates pushed ahead of
+    deletions.
+    """
+
+    def __init__(
+        self, option, target, plan: BranchReconciliationPlan, description: str
+    ) -> None:
+        super().__init__(option=option, target=target, description=description)
+        self.plan = plan
+
+    def apply_operation(self) -> None:
+        from wexample_filestate_git.repo.branch_reconciliation_step import (
+            BRANCH_STEP_RENAME,
+        )
+        from wexample_filestate_git.repo.git_push_batcher import GitPushBatcher
+        from wexample_filestate_git.repo.ref_snapshot import RefSnapshot
+
+        repo = self._get_target_git_repo()
+
+        for step in self.plan.local_steps:
+            if step.action == BRANCH_STEP_RENAME:
+                self._rename_branch(repo, step)
+            else:
+                self._merge_branch(repo, step)
+
+        # Remote-tracking refs and URLs are not changed by local steps.
+        snapshot = RefSnapshot.read(self.target.get_path())
+        batcher = GitPushBatcher(repo=repo)
+        for remote_name in self.plan.get_remote_names():
+            if remote_name in snapshot.get_remote_names():
+                self._sync_remote(
+                    batcher,
+                    snapshot,
+                    remote_name,
+                    self.plan.get_remote_steps(remote_name),
+                )
+
+    def undo(self) -> None:
+        pass
+
+    def _merge_branch(self, repo: Repo, step: BranchReconciliationStep) -> None:
+        to_branch = next((h for h in repo.heads if h.name == step.to_branch), None)
+        from_branch = next((h for h in repo.heads if h.name == step.from_branch), None)
+        if not to_branch or not from_branch:
+            return
+
+        to_branch.checkout()
+        repo.git.merge(step.from_branch, "--no-edit")
+        repo.delete_head(step.from_branch, force=False)
+
+    def _rename_branch(self, repo: Repo, step: BranchReconciliationStep) -> None:
+        if any(h.name == step.to_branch for h in repo.heads):
+            return  # Already done
+
+        branch = next((h for h in repo.heads if h.name == step.from_branch), None)
+        if not branch:
+            return
+
+        was_active = repo.active_branch.name == step.from_branch
+        branch.rename(step.to_branch)
+
+        if was_active:
+            repo.heads[step.to_branch].checkout()
+
+    def _sync_remote(
+        self,
+        batcher: GitPushBatcher,
+        snapshot: RefSnapshot,
+        remote_name: str,
+        steps: list[BranchReconciliationStep],
+    ) -> None:
+        from wexample_filestate_git.repo.branch_reconciliation_step import (
+            BRANCH_STEP_DELETE_REMOTE,
+        )
+
+        self._push_branch_changes(
+            batcher,
+            snapshot,
+            remote_name,
+            branches=[
+                step.to_branch
+                for step in steps
+                if step.action != BRANCH_STEP_DELETE_REMOTE
+            ],
+            deletions={
+                step.from_branch: step.to_branch
+                for step in steps
+                if step.action == BRANCH_STEP_DELETE_REMOTE
+            },
+        )
@@ -1,14 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 from wexample_helpers.decorator.base_class import base_class
 
 from wexample_filestate_git.operation.abstract_git_operation import AbstractGitOperation
 
-if TYPE_CHECKING:
-    from git import Repo
-
 
 @base_class
 class GitRemoteAddOperation(AbstractGitOperation):
@@ -58,11 +53,6 @@ class GitRemoteAddOperation(AbstractGitOperation):
                     # Remote might already be deleted or not exist
                     pass
 
-    def _get_target_git_repo(self) -> Repo:
-        from git import Repo
-
-        return Repo(self.target.get_path())
-
     def _remotes_description(self) -> str:
         """Generate description for this remote add operation."""
         parts: list[str] = []
@@ -32,9 +32,7 @@ class GitRemoteCreateOperation(AbstractGitOperation):
 
     def apply_operation(self) -> None:
         """Create the remote repository using the configured parameters."""
-        from wexample_filestate_git.option._git.remote_option import (
-            _REMOTE_EXISTS_CACHE,
-        )
+        from wexample_filestate_git.option._git.remote_option import RemoteOption
 
         # Build remote instance with the provided parameters
         remote = self._build_remote_instance()
@@ -43,7 +41,7 @@ class GitRemoteCreateOperation(AbstractGitOperation):
             # Create repository directly from URL
             remote.create_repository_if_not_exists(self.remote_url)
             # Mark as existing so subsequent passes skip the API check
-            _REMOTE_EXISTS_CACHE.add(self.remote_url)
+            RemoteOption.remember_remote_exists(self.remote_url, True)
 
     def undo(self) -> None:
         # Note: We don't implement undo for remote repository creation
@@ -52,11 +50,14 @@ class GitRemoteCreateOperation(AbstractGitOperation):
 
     def _build_remote_instance(self) -> AbstractRemote | None:
         """Build remote instance with the configured parameters."""
-        # Instantiate the proper remote with required constructor args
-        return self.remote_type(
-            io=self.target.io,
+        from wexample_filestate_git.remote.remote_registry import RemoteRegistry
+
+        # Shared with the option that planned this operation: same connections.
+        return RemoteRegistry.get_remote(
+            remote_type=self.remote_type,
             api_token=self.api_token,
             base_url=self.remote_type.build_remote_api_url_from_repo(self.remote_url),
+            io=self.target.io,
         )
 
     def _create_remotes_description(self) -> str:
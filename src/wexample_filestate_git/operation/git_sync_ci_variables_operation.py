@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 from wexample_helpers.decorator.base_class import base_class
 
 from wexample_filestate_git.operation.abstract_git_operation import AbstractGitOperation
@@ -18,6 +20,9 @@ class GitSyncCiVariablesOperation(WithGitRemoteMixin, AbstractGitOperation):
         remote_type,
         variables: dict[str, str],
         description: str,
+        existing_variables: dict[str, dict[str, Any]] | None = None,
+        group_variables: dict[str, dict[str, str]] | None = None,
+        group_grants: dict[str, str] | None = None,
     ) -> None:
         super().__init__(option=option, target=target, description=description)
         self.remote_url = remote_url
@@ -25,34 +30,101 @@ class GitSyncCiVariablesOperation(WithGitRemoteMixin, AbstractGitOperation):
         self.repo_name = repo_name
         self.remote_type = remote_type
         self.variables = variables
+        self.existing_variables = existing_variables
+        self.group_variables = group_variables or {}
+        self.group_grants = group_grants or {}
 
     def apply_operation(self) -> None:
-        from wexample_filestate_git.option._git.ci_variables_option import (
-            _CI_VARIABLES_SYNCED_CACHE,
-        )
+        from wexample_filestate_git.remote.remote_registry import RemoteRegistry
 
         api_remote = self._build_remote_instance(
             self.remote_type, self.remote_url, self.target
         )
 
-        for var_name, value in self.variables.items():
+        ledger = RemoteRegistry.get_ci_variable_ledger()
+        if self.variables:
+            self._sync_project_variables(api_remote, ledger)
+        for group, variables in self.group_variables.items():
+            self._sync_group_variables(api_remote, ledger, group, variables)
+
+    def undo(self) -> None:
+        pass
+
+    def _sync_group_variables(
+        self, api_remote, ledger, group: str, variables: dict[str, str]
+    ) -> None:
+        from urllib.parse import urlsplit
+
+        # Shared by every repository of the group: the ledger is read again
+        # here so that the first operation of a run writes and the others
+        # only grant access.
+        group_id = f"group:{group}@{urlsplit(api_remote.get_base_url() or '').netloc}"
+        pending = {
+            var_name: value
+            for var_name, value in variables.items()
+            if not ledger.is_synced(group_id, var_name, value)
+        }
+        if pending:
             try:
-                success = api_remote.set_ci_variable(
-                    self.namespace, self.repo_name, var_name, value, masked=True
+                results = api_remote.set_group_ci_variables(group, pending, masked=True)
+            except Exception as e:
+                self.target.log(
+                    message=f"WARNING: could not sync CI variables of group {group}: {e}"
                 )
+                return
+
+            for var_name, success in results.items():
                 if success:
-                    _CI_VARIABLES_SYNCED_CACHE.add((self.remote_url, var_name))
+                    ledger.record(group_id, var_name, pending[var_name])
                     self.target.log(
-                        message=f"CI variable '{var_name}' synced on {self.namespace}/{self.repo_name}"
+                        message=f"CI variable '{var_name}' synced on group {group}"
                     )
                 else:
                     self.target.log(
-                        message=f"WARNING: could not sync CI variable '{var_name}'"
+                        message=f"WARNING: could not sync CI variable '{var_name}' on group {group}"
                     )
-            except Exception as e:
-                self.target.log(
-                    message=f"WARNING: could not sync CI variable '{var_name}': {e}"
+
+        synced = [
+            var_name
+            for var_name, value in variables.items()
+            if ledger.is_synced(group_id, var_name, value)
+        ]
+        if not synced:
+            return
+        if not api_remote.grant_group_ci_variables(
+            group, synced, self.namespace, self.repo_name
+        ):
+            self.target.log(
+                message=f"WARNING: could not grant {self.namespace}/{self.repo_name} "
+                f"access to CI variables of group {group}"
+            )
+            return
+        for var_name in synced:
+            if var_name in self.group_grants:
+                ledger.record(
+                    self.remote_url, f"{var_name}@group", self.group_grants[var_name]
                 )
 
-    def undo(self) -> None:
-        pass
+    def _sync_project_variables(self, api_remote, ledger) -> None:
+        try:
+            results = api_remote.set_ci_variables(
+                self.namespace,
+                self.repo_name,
+                self.variables,
+                masked=True,
+                existing=self.existing_variables,
+            )
+        except Exception as e:
+            self.target.log(message=f"WARNING: could not sync CI variables: {e}")
+            return
+
+        for var_name, success in results.items():
+            if success:
+                ledger.record(self.remote_url, var_name, self.variables[var_name])
+                self.target.log(
+                    message=f"CI variable '{var_name}' synced on {self.namespace}/{self.repo_name}"
+                )
+            else:
+                self.target.log(
+                    message=f"WARNING: could not sync CI variable '{var_name}'"
+                )
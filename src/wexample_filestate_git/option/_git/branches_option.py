@@ -25,104 +25,29 @@ class BranchesOption(OptionMixin, AbstractConfigOption):
     def create_required_operation(
         self, target: TargetFileOrDirectoryType, scopes: set[Scope]
     ) -> AbstractOperation | None:
-        repo = self._get_target_git_repo(target)
-        if not repo:
-            return None
-
-        existing_branches = {h.name for h in repo.heads}
-        value = self.get_value()
-        raw = value.get_dict_or_empty()
-
-        for canonical, config in raw.items():
-            if not isinstance(config, dict):
-                continue
-
-            aliases: list[str] = config.get("aliases", [])
-            if not isinstance(aliases, list):
-                aliases = []
-            on_conflict: str = config.get("on_alias_conflict", "merge")
-            canonical_exists = canonical in existing_branches
-
-            for alias in aliases:
-                if alias not in existing_branches:
-                    continue
-
-                if not canonical_exists:
-                    from wexample_filestate_git.operation.git_rename_branch_operation import (
-                        GitRenameBranchOperation,
-                    )
-
-                    return GitRenameBranchOperation(
-                        option=self,
-                        target=target,
-                        from_branch=alias,
-                        to_branch=canonical,
-                        description=f"Rename branch '{alias}' → '{canonical}'",
-                    )
-
-                # Both exist
-                if on_conflict == "merge":
-                    from wexample_filestate_git.operation.git_merge_branch_operation import (
-                        GitMergeBranchOperation,
-                    )
-
-                    return GitMergeBranchOperation(
-                        option=self,
-                        target=target,
-                        from_branch=alias,
-                        to_branch=canonical,
-                        description=f"Merge '{alias}' into '{canonical}' and remove alias",
-                    )
+        from wexample_filestate_git.repo.branch_reconciliation_plan import (
+            BranchReconciliationPlan,
+        )
+        from wexample_filestate_git.repo.ref_snapshot import RefSnapshot
 
-                if on_conflict == "error":
-                    raise ValueError(
-                        f"Both '{alias}' and '{canonical}' exist — manual resolution required."
-                    )
-
-                # skip: nothing to do
-
-        # Local aliases are clean — check if any alias still exists on a remote
-        for remote in repo.remotes:
-            try:
-                remote_heads = {ref.remote_head for ref in remote.refs}
-            except Exception:
-                continue
-
-            for canonical, config in raw.items():
-                if not isinstance(config, dict):
-                    continue
-
-                if not config.get("sync_remote", True):
-                    continue
-
-                aliases: list[str] = config.get("aliases", [])
-                if not isinstance(aliases, list):
-                    aliases = []
-
-                for alias in aliases:
-                    if alias in remote_heads:
-                        from wexample_filestate_git.operation.git_delete_remote_branch_operation import (
-                            GitDeleteRemoteBranchOperation,
-                        )
-
-                        return GitDeleteRemoteBranchOperation(
-                            option=self,
-                            target=target,
-                            branch_name=alias,
-                            canonical_branch=canonical,
-                            description=f"Delete remote alias '{alias}' (canonical is '{canonical}')",
-                        )
+        snapshot = RefSnapshot.read(target.get_path())
+        if snapshot is None:
+            return None
 
-        return None
+        # One plan covers every alias: no rectify pass per rename or deletion.
+        plan = BranchReconciliationPlan.build(
+            snapshot, self.get_value().get_dict_or_empty()
+        )
+        if plan.is_empty():
+            return None
 
-    def _get_target_git_repo(self, target: TargetFileOrDirectoryType):
-        try:
-            from git import Repo
-            from wexample_helpers.const.globals import DIR_GIT
+        from wexample_filestate_git.operation.git_reconcile_branches_operation import (
+            GitReconcileBranchesOperation,
+        )
 
-            git_dir = target.get_path() / DIR_GIT
-            if git_dir.exists():
-                return Repo(str(target.get_path()))
-        except Exception:
-            pass
-        return None
+        return GitReconcileBranchesOperation(
+            option=self,
+            target=target,
+            plan=plan,
+            description=f"Reconcile branches: {plan.describe()}",
+        )
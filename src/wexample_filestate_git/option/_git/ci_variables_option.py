@@ -13,10 +13,6 @@ if TYPE_CHECKING:
     from wexample_filestate.const.types_state_items import TargetFileOrDirectoryType
     from wexample_filestate.operation.abstract_operation import AbstractOperation
 
-# Process-level cache: (remote_url, var_name) pairs confirmed in sync this run.
-# Safe to cache permanently — a variable that matches won't un-match during the same run.
-_CI_VARIABLES_SYNCED_CACHE: set[tuple[str, str]] = set()
-
 
 @base_class
 class CiVariablesOption(WithGitRemoteMixin, OptionMixin, AbstractConfigOption):
@@ -31,17 +27,19 @@ class CiVariablesOption(WithGitRemoteMixin, OptionMixin, AbstractConfigOption):
     def create_required_operation(
         self, target: TargetFileOrDirectoryType, scopes: set[Scope]
     ) -> AbstractOperation | None:
-        value = self.get_value()
-        var_names: list[str] = [v.get_str() for v in value.get_list_or_empty()]
-        if not var_names:
+        project_names, group_names = self._parse_variable_names()
+        if not project_names and not group_names:
             return None
 
-        repo = self._get_target_git_repo(target)
-        if not repo or not repo.remotes:
+        from wexample_filestate_git.repo.ref_snapshot import RefSnapshot
+
+        snapshot = RefSnapshot.read(target.get_path())
+        if snapshot is None or not snapshot.remotes:
             return None
 
-        remote = repo.remotes[0]
-        remote_url = next(iter(remote.urls), None)
+        remote_url = next(
+            iter(snapshot.get_remote_urls(snapshot.get_remote_names()[0])), None
+        )
         if not remote_url:
             return None
 
@@ -49,6 +47,34 @@ class CiVariablesOption(WithGitRemoteMixin, OptionMixin, AbstractConfigOption):
         if not remote_type:
             return None
 
+        from wexample_filestate_git.remote.remote_registry import RemoteRegistry
+
+        # Values pushed by an earlier run are known from the ledger: those
+        # need no request at all.
+        ledger = RemoteRegistry.get_ci_variable_ledger()
+        local_values: dict[str, str] = {}
+        group_values: dict[str, tuple[str | None, str]] = {}
+        for var_name in [*project_names, *group_names]:
+            local_value = target.get_env_parameter_or_suite_fallback(var_name)
+            if not local_value:
+                target.log(
+                    message=f"WARNING: {var_name} not found in local env, skipping"
+                )
+                continue
+            if var_name in group_names:
+                group = group_names[var_name]
+                if not ledger.is_synced(
+                    remote_url,
+                    f"{var_name}@group",
+                    self._build_group_grant(group, local_value),
+                ):
+                    group_values[var_name] = (group, local_value)
+            elif not ledger.is_synced(remote_url, var_name, local_value):
+                local_values[var_name] = local_value
+
+        if not local_values and not group_values:
+            return None
+
         try:
             api_remote = self._build_remote_instance(remote_type, remote_url, target)
             repo_info = api_remote.parse_repository_url(remote_url)
@@ -59,27 +85,32 @@ class CiVariablesOption(WithGitRemoteMixin, OptionMixin, AbstractConfigOption):
         namespace = repo_info["namespace"]
         repo_name = repo_info["name"]
         vars_to_sync: dict[str, str] = {}
-
-        for var_name in var_names:
-            cache_key = (remote_url, var_name)
-            if cache_key in _CI_VARIABLES_SYNCED_CACHE:
-                continue
-
-            local_value = target.get_env_parameter_or_suite_fallback(var_name)
-            if not local_value:
-                target.log(
-                    message=f"WARNING: {var_name} not found in local env, skipping"
-                )
-                continue
-
-            existing = api_remote.get_ci_variable(namespace, repo_name, var_name)
+        existing_variables = None
+        if local_values:
+            # One listing answers every comparison below; None when the remote
+            # cannot list variables, in which case each one is fetched.
+            existing_variables = api_remote.list_ci_variables(namespace, repo_name)
+
+        for var_name, local_value in local_values.items():
+            if existing_variables is None:
+                existing = api_remote.get_ci_variable(namespace, repo_name, var_name)
+            else:
+                existing = existing_variables.get(var_name)
             if existing and existing.get("value") == local_value:
-                _CI_VARIABLES_SYNCED_CACHE.add(cache_key)
+                ledger.record(
+                    remote_url, var_name, local_value, existing.get("updated_at")
+                )
                 continue
 
             vars_to_sync[var_name] = local_value
 
-        if not vars_to_sync:
+        # Group values are compared (and written) by the operation, once per
+        # group, so that projects sharing a group do not repeat the work.
+        group_variables: dict[str, dict[str, str]] = {}
+        for var_name, (group, local_value) in group_values.items():
+            group_variables.setdefault(group or namespace, {})[var_name] = local_value
+
+        if not vars_to_sync and not group_variables:
             return None
 
         from wexample_filestate_git.operation.git_sync_ci_variables_operation import (
@@ -94,17 +125,35 @@ class CiVariablesOption(WithGitRemoteMixin, OptionMixin, AbstractConfigOption):
             repo_name=repo_name,
             remote_type=remote_type,
             variables=vars_to_sync,
-            description=f"Sync CI variables: {', '.join(vars_to_sync)}",
+            existing_variables=existing_variables,
+            group_variables=group_variables,
+            group_grants={
+                var_name: self._build_group_grant(group, local_value)
+                for var_name, (group, local_value) in group_values.items()
+            },
+            description="Sync CI variables: "
+            + ", ".join([*vars_to_sync, *group_values]),
         )
 
-    def _get_target_git_repo(self, target: TargetFileOrDirectoryType):
-        try:
-            from git import Repo
-            from wexample_helpers.const.globals import DIR_GIT
-
-            git_dir = target.get_path() / DIR_GIT
-            if git_dir.exists():
-                return Repo(str(target.get_path()))
-        except Exception:
-            pass
-        return None
+    def _build_group_grant(self, group: str | None, value: str) -> str:
+        """Ledger value recording that this repository reads ``value`` from ``group``."""
+        return f"{group or ''}\0{value}"
+
+    def _parse_variable_names(self) -> tuple[list[str], dict[str, str | None]]:
+        """Split entries into project variables and group variables.
+
+        Entries are either a variable name or a mapping such as
+        ``{"name": "PYPI_TOKEN", "scope": "group", "group": "wexample"}``;
+        the group defaults to the repository namespace (None here).
+        """
+        project_names: list[str] = []
+        group_names: dict[str, str | None] = {}
+        for entry in self.get_value().get_list_or_empty():
+            if isinstance(entry, dict):
+                if entry.get("scope") == "group":
+                    group_names[entry["name"]] = entry.get("group")
+                else:
+                    project_names.append(entry["name"])
+            else:
+                project_names.append(str(entry))
+        return project_names, group_names
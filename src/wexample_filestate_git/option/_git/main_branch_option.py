@@ -31,13 +31,15 @@ class MainBranchOption(OptionMixin, AbstractConfigOption):
         if not branch_name:
             return None
 
+        from wexample_filestate_git.repo.ref_snapshot import RefSnapshot
+
         # Check if Git repo exists
-        repo = self._get_target_git_repo(target)
-        if not repo:
+        snapshot = RefSnapshot.read(target.get_path())
+        if snapshot is None:
             return None
 
         # Check if branch already exists
-        if any(h.name == branch_name for h in getattr(repo, "heads", [])):
+        if snapshot.has_branch(branch_name):
             return None
 
         # Create operation with branch name parameter
@@ -81,16 +83,3 @@ class MainBranchOption(OptionMixin, AbstractConfigOption):
 
         # If the option exists but has no usable value, default to "main"
         return GIT_BRANCH_MAIN
-
-    def _get_target_git_repo(self, target):
-        """Get Git repository for the target."""
-        try:
-            from git import Repo
-            from wexample_helpers.const.globals import DIR_GIT
-
-            git_dir = target.get_path() / DIR_GIT
-            if git_dir.exists():
-                return Repo(str(target.get_path()))
-        except Exception:
-            pass
-        return None
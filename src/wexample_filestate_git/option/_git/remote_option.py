@@ -17,11 +17,13 @@ if TYPE_CHECKING:
     from wexample_filestate.const.types_state_items import TargetFileOrDirectoryType
     from wexample_filestate.operation.abstract_operation import AbstractOperation
 
-# Process-level cache: URLs confirmed to exist this run.
-# Keyed by remote URL. Avoids repeating API calls across rectify loop passes.
-# A given remote URL cannot be deleted during a run, so True is safe to cache permanently.
-# Updated by RemoteOption.create_required_operation and GitRemoteCreateOperation.apply_operation.
-_REMOTE_EXISTS_CACHE: set[str] = set()
+# Remote existence is kept in the shared cache store, so that rectify passes,
+# worker processes and later runs only call the API once an entry expired.
+# Repositories are seldom deleted: "exists" is trusted for long, "missing" only
+# briefly, as the repository is about to be created.
+# Updated by RemoteOption._check_remotes_exist and GitRemoteCreateOperation.apply_operation.
+REMOTE_EXISTS_TTL = 7 * 24 * 3600.0
+REMOTE_MISSING_TTL = 300.0
 
 
 @base_class
@@ -34,71 +36,48 @@ class RemoteOption(WithGitRemoteMixin, OptionMixin, AbstractListConfigOption):
     def get_raw_value_allowed_type() -> Any:
         return Union[list, dict]
 
+    @staticmethod
+    def remember_remote_exists(remote_url: str, exists: bool) -> None:
+        from wexample_filestate_git.remote.remote_registry import RemoteRegistry
+
+        RemoteRegistry.get_cache_store().set(
+            f"remote_exists:{remote_url}",
+            exists,
+            ttl=REMOTE_EXISTS_TTL if exists else REMOTE_MISSING_TTL,
+        )
+
     def create_required_operation(
         self, target: TargetFileOrDirectoryType, scopes: set[Scope]
     ) -> AbstractOperation | None:
         """Create GitRemoteCreateOperation or GitRemoteAddOperation as needed."""
-        from wexample_filestate_git.option._git.create_remote_option import (
-            CreateRemoteOption,
-        )
-        from wexample_filestate_git.option._git.url_option import UrlOption
+        self._declare_remote_types(target)
 
         # First priority: Check if any remote repository needs to be created
-        for remote_item_option in self.children:
-            # Check if creation is enabled
-            create_remote_option = remote_item_option.get_option(CreateRemoteOption)
-            create_enabled = (
-                create_remote_option is not None
-                and create_remote_option.get_value().is_true()
+        remotes_to_check = self._collect_remotes_to_create(target)
+        existing_urls = self._check_remotes_exist(remotes_to_check)
+
+        for remote_type, remote_url, _remote in remotes_to_check:
+            repository_exists = remote_url in existing_urls
+            target.log(
+                message=(
+                    f"{remote_type.get_snake_short_class_name()} repo "
+                    f"{'found' if repository_exists else 'missing'}: {remote_url}"
+                )
             )
+            if not repository_exists:
+                # Create operation with all necessary parameters
+                from wexample_filestate_git.operation.git_remote_create_operation import (
+                    GitRemoteCreateOperation,
+                )
 
-            if create_enabled:
-                # Check if we have URL
-                url_option = remote_item_option.get_option(UrlOption)
-                if url_option:
-                    # Resolve type and url
-                    resolved = self._resolve_remote_type_and_url(
-                        remote_item_option, target
-                    )
-                    if resolved:
-                        remote_type, remote_url = resolved
-                        # Check if remote repository exists
-                        remote = self._build_remote_instance(
-                            remote_type=remote_type,
-                            remote_url=remote_url,
-                            target=target,
-                        )
-                        if remote:
-                            if remote_url in _REMOTE_EXISTS_CACHE:
-                                repository_exists = True
-                            else:
-                                remote.connect()
-                                repo_info = remote.parse_repository_url(remote_url)
-                                repository_exists = remote.check_repository_exists(
-                                    repo_info["name"], repo_info["namespace"]
-                                )
-                                if repository_exists:
-                                    _REMOTE_EXISTS_CACHE.add(remote_url)
-                            target.log(
-                                message=(
-                                    f"{remote_type.get_snake_short_class_name()} repo "
-                                    f"{'found' if repository_exists else 'missing'}: {remote_url}"
-                                )
-                            )
-                            if not repository_exists:
-                                # Create operation with all necessary parameters
-                                from wexample_filestate_git.operation.git_remote_create_operation import (
-                                    GitRemoteCreateOperation,
-                                )
-
-                                return GitRemoteCreateOperation(
-                                    option=self,
-                                    description=f"The remote should exist: {remote_url}",
-                                    target=target,
-                                    remote_type=remote_type,
-                                    remote_url=remote_url,
-                                    api_token=self._get_api_token(remote_type, target),
-                                )
+                return GitRemoteCreateOperation(
+                    option=self,
+                    description=f"The remote should exist: {remote_url}",
+                    target=target,
+                    remote_type=remote_type,
+                    remote_url=remote_url,
+                    api_token=self._get_api_token(remote_type, target),
+                )
 
         # Second priority: Check if any remote needs to be added locally
         remotes_to_add_map = self._collect_remotes_to_add(target)
@@ -147,13 +126,41 @@ class RemoteOption(WithGitRemoteMixin, OptionMixin, AbstractListConfigOption):
 
         return remotes
 
+    def _check_remotes_exist(self, remotes: list[tuple]) -> set[str]:
+        """Return the URLs that exist remotely, one batch call per remote API."""
+        from wexample_filestate_git.remote.remote_registry import RemoteRegistry
+
+        cache_store = RemoteRegistry.get_cache_store()
+        existing_urls: set[str] = set()
+        pending_by_remote: dict[int, tuple[Any, list[str]]] = {}
+        for _remote_type, remote_url, remote in remotes:
+            cached = cache_store.get(f"remote_exists:{remote_url}")
+            if cached is True:
+                existing_urls.add(remote_url)
+            elif cached is None:
+                pending_by_remote.setdefault(id(remote), (remote, []))[1].append(
+                    remote_url
+                )
+
+        for remote, remote_urls in pending_by_remote.values():
+            remote.connect()
+            for remote_url, repository in remote.check_repositories_exist(
+                remote_urls
+            ).items():
+                self.remember_remote_exists(remote_url, repository is not None)
+                if repository is not None:
+                    existing_urls.add(remote_url)
+
+        return existing_urls
+
     def _collect_remotes_to_add(self, target) -> dict[str, str]:
         """Return remotes that need to be added or updated locally."""
         from wexample_filestate_git.option._git.url_option import UrlOption
+        from wexample_filestate_git.repo.ref_snapshot import RefSnapshot
 
         # Check if Git repo exists
-        repo = self._get_target_git_repo(target)
-        if not repo:
+        snapshot = RefSnapshot.read(target.get_path())
+        if snapshot is None:
             expected_remotes = self._build_expected_remote_map(target)
             if expected_remotes:
                 target.log(
@@ -166,8 +173,6 @@ class RemoteOption(WithGitRemoteMixin, OptionMixin, AbstractListConfigOption):
             return expected_remotes
 
         # Git repo exists, check if remotes match
-        # Get existing remotes by name
-        existing_by_name = {r.name: r for r in repo.remotes}
         remotes_to_add: dict[str, str] = {}
 
         for remote_item_option in self.children:
@@ -181,8 +186,7 @@ class RemoteOption(WithGitRemoteMixin, OptionMixin, AbstractListConfigOption):
             if not desired_name or not desired_url:
                 continue
 
-            existing = existing_by_name.get(desired_name)
-            if existing is None:
+            if desired_name not in snapshot.remotes:
                 target.log(
                     message=(
                         f"Remote '{desired_name}' missing locally "
@@ -193,7 +197,7 @@ class RemoteOption(WithGitRemoteMixin, OptionMixin, AbstractListConfigOption):
                 continue
 
             # Check if URL matches
-            existing_urls = set(existing.urls)
+            existing_urls = set(snapshot.get_remote_urls(desired_name))
             if desired_url not in existing_urls:
                 target.log(
                     message=(
@@ -208,6 +212,60 @@ class RemoteOption(WithGitRemoteMixin, OptionMixin, AbstractListConfigOption):
 
         return remotes_to_add
 
+    def _collect_remotes_to_create(self, target) -> list[tuple]:
+        """Return (remote_type, remote_url, remote) for items with create_remote enabled."""
+        from wexample_filestate_git.option._git.create_remote_option import (
+            CreateRemoteOption,
+        )
+        from wexample_filestate_git.option._git.url_option import UrlOption
+
+        remotes: list[tuple] = []
+        for remote_item_option in self.children:
+            create_remote_option = remote_item_option.get_option(CreateRemoteOption)
+            if (
+                create_remote_option is None
+                or not create_remote_option.get_value().is_true()
+            ):
+                continue
+
+            if not remote_item_option.get_option(UrlOption):
+                continue
+
+            resolved = self._resolve_remote_type_and_url(remote_item_option, target)
+            if not resolved:
+                continue
+
+            remote_type, remote_url = resolved
+            remote = self._build_remote_instance(
+                remote_type=remote_type,
+                remote_url=remote_url,
+                target=target,
+            )
+            if remote:
+                remotes.append((remote_type, remote_url, remote))
+
+        return remotes
+
+    def _declare_remote_types(self, target) -> None:
+        """Declare the host of every remote configured with a ``type``, so
+        remotes of that host are detected without probing it."""
+        from wexample_filestate_git.option._git.type_option import TypeOption
+        from wexample_filestate_git.option._git.url_option import UrlOption
+        from wexample_filestate_git.remote.remote_type_registry import (
+            RemoteTypeRegistry,
+        )
+
+        for remote_item_option in self.children:
+            type_option = remote_item_option.get_option(TypeOption)
+            url_option = remote_item_option.get_option(UrlOption)
+            if not type_option or not url_option:
+                continue
+            remote_url = url_option.get_url(target=target)
+            if remote_url:
+                RemoteTypeRegistry.declare(
+                    remote_url, type_option.get_value().get_str()
+                )
+
     def _get_remote_name(self, remote_item_option) -> str:
         """Get remote name from option or default to 'origin'."""
         from wexample_filestate.option.name_option import NameOption
@@ -221,19 +279,6 @@ class RemoteOption(WithGitRemoteMixin, OptionMixin, AbstractListConfigOption):
         # Default to "origin" if no name specified
         return "origin"
 
-    def _get_target_git_repo(self, target):
-        """Get Git repository for the target."""
-        try:
-            from git import Repo
-            from wexample_helpers.const.globals import DIR_GIT
-
-            git_dir = target.get_path() / DIR_GIT
-            if git_dir.exists():
-                return Repo(str(target.get_path()))
-        except Exception:
-            pass
-        return None
-
     def _has_remotes_configured(self) -> bool:
         """Check if there are any remotes configured."""
         return bool(self.children)
@@ -242,15 +287,11 @@ class RemoteOption(WithGitRemoteMixin, OptionMixin, AbstractListConfigOption):
         self, remote_item_option, target: TargetFileOrDirectoryType
     ):
         """Resolve remote type and URL from remote item option."""
-        from wexample_helpers_git.const.common import (
-            GIT_PROVIDER_GITHUB,
-            GIT_PROVIDER_GITLAB,
-        )
-
         from wexample_filestate_git.option._git.type_option import TypeOption
         from wexample_filestate_git.option._git.url_option import UrlOption
-        from wexample_filestate_git.remote.github_remote import GithubRemote
-        from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+        from wexample_filestate_git.remote.remote_type_registry import (
+            RemoteTypeRegistry,
+        )
 
         url_option = remote_item_option.get_option(UrlOption)
         type_option = remote_item_option.get_option(TypeOption)
@@ -261,11 +302,7 @@ class RemoteOption(WithGitRemoteMixin, OptionMixin, AbstractListConfigOption):
         remote_url = url_option.get_url(target=target)
 
         if type_option:
-            type_map = {
-                GIT_PROVIDER_GITHUB: GithubRemote,
-                GIT_PROVIDER_GITLAB: GitlabRemote,
-            }
-            remote_type = type_map.get(type_option.get_value().get_str().lower())
+            remote_type = RemoteTypeRegistry.get_type(type_option.get_value().get_str())
         else:
             remote_type = self._detect_remote_type(remote_url)
 
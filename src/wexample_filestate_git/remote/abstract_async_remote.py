@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.abstract_method import abstract_method
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.io_manager import IoManager
+
+    from wexample_filestate_git.remote.abstract_remote import AbstractRemote
+
+
+@base_class
+class AbstractAsyncRemote(BaseClass):
+    """
+    Asyncio counterpart of ``AbstractRemote``.
+
+    Exposes the repository, merge proposal, pipeline and CI variable methods
+    of ``AbstractRemote`` as coroutines, so many repositories can be driven
+    from one event loop; paginated iterators and transport helpers (circuit
+    breaker, rate limits) are used on ``remote`` directly. HTTP calls are
+    delegated to a synchronous remote (and its pooled keep-alive client) on
+    worker threads, bounded by ``max_concurrency``. Waiting in
+    ``poll_pipeline`` happens on the loop and costs no thread, webhook
+    receiver or not.
+    """
+
+    max_concurrency: int = public_field(
+        default=32,
+        description="Maximum number of API calls in flight at once for this remote",
+    )
+    remote: AbstractRemote = public_field(
+        description="Synchronous remote performing the underlying HTTP calls"
+    )
+    _semaphore: asyncio.Semaphore | None = private_field(
+        default=None, description="Bounds concurrent calls; created on first use"
+    )
+
+    @classmethod
+    def create(
+        cls,
+        api_token: str,
+        io: IoManager,
+        base_url: str | None = None,
+        max_concurrency: int = 32,
+    ) -> AbstractAsyncRemote:
+        """Build an async remote on top of the shared, pooled synchronous one."""
+        from wexample_filestate_git.remote.remote_registry import RemoteRegistry
+
+        return cls(
+            max_concurrency=max_concurrency,
+            remote=RemoteRegistry.get_remote(
+                remote_type=cls.get_remote_class(),
+                api_token=api_token,
+                base_url=base_url,
+                io=io,
+            ),
+        )
+
+    @classmethod
+    def detect_remote_type(cls, remote_url: str) -> bool:
+        return cls.get_remote_class().detect_remote_type(remote_url)
+
+    @classmethod
+    @abstract_method
+    def get_remote_class(cls) -> type[AbstractRemote]:
+        """Return the synchronous remote class this one wraps."""
+
+    # ------------------------------------------------------------------
+    # Repositories
+    # ------------------------------------------------------------------
+    async def check_repositories_exist(
+        self, remote_urls: list[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        return await self._call(self.remote.check_repositories_exist, remote_urls)
+
+    async def check_repository_exists(self, name: str, namespace: str) -> bool:
+        return await self._call(self.remote.check_repository_exists, name, namespace)
+
+    # ------------------------------------------------------------------
+    # Merge proposals (MR on GitLab, PR on GitHub)
+    # ------------------------------------------------------------------
+    async def create_merge_proposal(
+        self,
+        namespace: str,
+        name: str,
+        source_branch: str,
+        target_branch: str,
+        title: str,
+        remove_source_branch: bool = True,
+        squash: bool = False,
+    ) -> dict[str, Any]:
+        return await self._call(
+            self.remote.create_merge_proposal,
+            namespace,
+            name,
+            source_branch,
+            target_branch,
+            title,
+            remove_source_branch=remove_source_branch,
+            squash=squash,
+        )
+
+    async def create_repository(
+        self, name: str, namespace: str, description: str = "", private: bool = False
+    ) -> dict:
+        return await self._call(
+            self.remote.create_repository,
+            name,
+            namespace,
+            description=description,
+            private=private,
+        )
+
+    async def create_repository_if_not_exists(
+        self, remote_url: str, description: str = "", private: bool = False
+    ) -> dict:
+        return await self._call(
+            self.remote.create_repository_if_not_exists,
+            remote_url,
+            description=description,
+            private=private,
+        )
+
+    async def get_branch_pipelines(
+        self, namespace: str, name: str, branch: str, limit: int | None = 5
+    ) -> list[dict[str, Any]]:
+        return await self._call(
+            self.remote.get_branch_pipelines, namespace, name, branch, limit=limit
+        )
+
+    async def get_ci_variable(self, namespace: str, name: str, key: str) -> dict | None:
+        return await self._call(self.remote.get_ci_variable, namespace, name, key)
+
+    async def get_default_branch(self, namespace: str, name: str) -> str | None:
+        return await self._call(self.remote.get_default_branch, namespace, name)
+
+    def get_merge_proposal_id(self, proposal: dict[str, Any]) -> int:
+        return self.remote.get_merge_proposal_id(proposal)
+
+    async def get_merge_proposal_pipelines(
+        self, namespace: str, name: str, proposal_id: int
+    ) -> list[dict[str, Any]]:
+        return await self._call(
+            self.remote.get_merge_proposal_pipelines, namespace, name, proposal_id
+        )
+
+    # ------------------------------------------------------------------
+    # Pipelines / workflow runs
+    # ------------------------------------------------------------------
+    async def get_pipeline(
+        self, namespace: str, name: str, pipeline_id: int
+    ) -> dict[str, Any]:
+        return await self._call(self.remote.get_pipeline, namespace, name, pipeline_id)
+
+    async def grant_group_ci_variables(
+        self, group: str, keys: list[str], namespace: str, name: str
+    ) -> bool:
+        return await self._call(
+            self.remote.grant_group_ci_variables, group, keys, namespace, name
+        )
+
+    async def list_ci_variables(
+        self, namespace: str, name: str
+    ) -> dict[str, dict[str, Any]] | None:
+        return await self._call(self.remote.list_ci_variables, namespace, name)
+
+    async def list_group_ci_variables(
+        self, group: str
+    ) -> dict[str, dict[str, Any]] | None:
+        return await self._call(self.remote.list_group_ci_variables, group)
+
+    async def merge_merge_proposal(
+        self, namespace: str, name: str, proposal_id: int
+    ) -> dict[str, Any]:
+        return await self._call(
+            self.remote.merge_merge_proposal, namespace, name, proposal_id
+        )
+
+    def parse_repository_url(self, remote_url: str) -> dict[str, str]:
+        return self.remote.parse_repository_url(remote_url)
+
+    async def poll_pipeline(
+        self,
+        namespace: str,
+        name: str,
+        pipeline_id: int,
+        timeout: int = 600,
+        interval: int = 10,
+        on_tick: Callable[[str, int], None] | None = None,
+    ) -> str:
+        """Poll until a terminal status is reached. Returns the final status string.
+
+        Pipeline events of the remote's ``webhook_receiver`` replace the sleeps,
+        as in ``AbstractRemote.poll_pipeline``.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            pipeline = await self.get_pipeline(namespace, name, pipeline_id)
+            while pipeline is not None:
+                status = self.remote.get_pipeline_status(pipeline)
+                elapsed = int(timeout - (deadline - loop.time()))
+                if on_tick:
+                    on_tick(status, elapsed)
+                if self.remote.is_pipeline_terminal(pipeline):
+                    return status
+                pipeline = await self._wait_for_pipeline_event(
+                    namespace, name, pipeline_id, interval, deadline
+                )
+        raise TimeoutError(f"Pipeline {pipeline_id} did not complete within {timeout}s")
+
+    async def set_ci_variable(
+        self,
+        namespace: str,
+        name: str,
+        key: str,
+        value: str,
+        masked: bool = True,
+        exists: bool | None = None,
+    ) -> bool:
+        return await self._call(
+            self.remote.set_ci_variable,
+            namespace,
+            name,
+            key,
+            value,
+            masked=masked,
+            exists=exists,
+        )
+
+    async def set_ci_variables(
+        self,
+        namespace: str,
+        name: str,
+        variables: dict[str, str],
+        masked: bool = True,
+        existing: dict[str, dict[str, Any]] | None = None,
+    ) -> dict[str, bool]:
+        return await self._call(
+            self.remote.set_ci_variables,
+            namespace,
+            name,
+            variables,
+            masked=masked,
+            existing=existing,
+        )
+
+    async def set_default_branch(
+        self, namespace: str, name: str, branch_name: str
+    ) -> bool:
+        return await self._call(
+            self.remote.set_default_branch, namespace, name, branch_name
+        )
+
+    async def set_group_ci_variable(
+        self,
+        group: str,
+        key: str,
+        value: str,
+        masked: bool = True,
+        exists: bool | None = None,
+    ) -> bool:
+        return await self._call(
+            self.remote.set_group_ci_variable,
+            group,
+            key,
+            value,
+            masked=masked,
+            exists=exists,
+        )
+
+    async def set_group_ci_variables(
+        self,
+        group: str,
+        variables: dict[str, str],
+        masked: bool = True,
+        existing: dict[str, dict[str, Any]] | None = None,
+    ) -> dict[str, bool]:
+        return await self._call(
+            self.remote.set_group_ci_variables,
+            group,
+            variables,
+            masked=masked,
+            existing=existing,
+        )
+
+    async def unprotect_branch(
+        self, namespace: str, name: str, branch_name: str
+    ) -> bool:
+        return await self._call(
+            self.remote.unprotect_branch, namespace, name, branch_name
+        )
+
+    async def _call(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def _wait_for_pipeline_event(
+        self,
+        namespace: str,
+        name: str,
+        pipeline_id: int,
+        interval: int,
+        deadline: float,
+    ) -> dict[str, Any] | None:
+        """Return the pipeline pushed by a webhook, or None once it is time to poll."""
+        receiver = self.remote.webhook_receiver
+        if receiver is None:
+            await asyncio.sleep(interval)
+            return None
+        remaining = max(deadline - asyncio.get_running_loop().time(), 0)
+        return await receiver.wait_for_pipeline_async(
+            receiver.build_event_key(self.remote, namespace, name, pipeline_id),
+            min(self.remote.webhook_fallback_timeout, remaining),
+        )
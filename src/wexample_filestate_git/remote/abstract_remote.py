@@ -1,22 +1,74 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any
 
 from wexample_api.common.abstract_gateway import AbstractGateway
+from wexample_api.enums.http import HttpMethod
 from wexample_helpers.classes.abstract_method import abstract_method
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
 
+from wexample_filestate_git.remote.http.single_flight import SingleFlight
 
+if TYPE_CHECKING:
+    import requests
+
+    from wexample_filestate_git.remote.http.circuit_breaker import CircuitBreaker
+    from wexample_filestate_git.remote.http.rate_limit_scheduler import (
+        RateLimitScheduler,
+    )
+    from wexample_filestate_git.remote.http.remote_http_client import (
+        RemoteHttpClient,
+    )
+    from wexample_filestate_git.remote.http.response_cache import ResponseCache
+    from wexample_filestate_git.remote.pipeline.pipeline_webhook_receiver import (
+        PipelineWebhookReceiver,
+    )
+
+
+@base_class
 class AbstractRemote(AbstractGateway):
     """
     Abstract base class for Git repository hosting services (GitHub, GitLab, etc.).
     Provides a common interface for interacting with remote repositories and CI pipelines.
     """
 
+    http_client: RemoteHttpClient | None = public_field(
+        default=None,
+        description="Shared keep-alive HTTP client; when None each request opens its own connection",
+    )
+    rate_limit_retries: int = public_field(
+        default=2,
+        description="How many times a rate-limited (429) request is retried once the host allows it",
+    )
+    response_cache: ResponseCache | None = public_field(
+        default=None,
+        description="ETag / Last-Modified cache used to turn GETs into conditional requests",
+    )
+    webhook_fallback_timeout: float = public_field(
+        default=120.0,
+        description="Seconds to wait for a pipeline webhook before fetching the pipeline anyway",
+    )
+    webhook_receiver: PipelineWebhookReceiver | None = public_field(
+        default=None,
+        description="Pipeline webhook listener; when set, poll_pipeline waits for events instead of sleeping",
+    )
+    _in_flight: SingleFlight = private_field(
+        factory=SingleFlight,
+        description="Identical GETs in flight, sent once for every concurrent caller",
+    )
+
     # ------------------------------------------------------------------
     # Remote detection
     # ------------------------------------------------------------------
+    @classmethod
+    def build_registry_kwargs(cls) -> dict[str, Any]:
+        """Extra shared resources ``RemoteRegistry`` passes when building this remote."""
+        return {}
+
     @classmethod
     @abstract_method
     def build_remote_api_url_from_repo(cls, remote_url: str) -> str | None:
@@ -35,9 +87,43 @@ class AbstractRemote(AbstractGateway):
     def get_class_name_suffix(cls) -> str | None:
         return "Remote"
 
+    @classmethod
+    def probe_host(cls, host: str) -> bool:
+        """Return True if an unknown host answers like this service's API.
+
+        Called once per host when its URL matches no known pattern; the
+        answer is persisted by ``RemoteTypeRegistry``.
+        """
+        return False
+
+    # ------------------------------------------------------------------
+    # Connectivity
+    # ------------------------------------------------------------------
+    @abstract_method
+    def check_connection(self) -> bool:
+        """Send a cheap authenticated request; also the circuit breaker's probe."""
+
     # ------------------------------------------------------------------
     # Repositories
     # ------------------------------------------------------------------
+    def check_repositories_exist(
+        self, remote_urls: list[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        """Check many repositories at once.
+
+        Maps every URL to repository metadata (at least ``name`` and
+        ``namespace``) when it exists, or None when it does not. Services with
+        a batch API override this; the default issues one check per URL.
+        """
+        results: dict[str, dict[str, Any] | None] = {}
+        for remote_url in remote_urls:
+            repo_info = self.parse_repository_url(remote_url)
+            exists = self.check_repository_exists(
+                repo_info["name"], repo_info["namespace"]
+            )
+            results[remote_url] = dict(repo_info) if exists else None
+        return results
+
     @abstract_method
     def check_repository_exists(self, name: str, namespace: str) -> bool:
         """Return True if the repository exists on the remote service."""
@@ -80,14 +166,37 @@ class AbstractRemote(AbstractGateway):
         namespace: str,
         name: str,
         branch: str,
+        limit: int | None = 5,
     ) -> list[dict[str, Any]]:
-        """Return pipelines for a branch, most recent first. No-op by default."""
-        return []
+        """Return up to ``limit`` pipelines for a branch, most recent first."""
+        from itertools import islice
+
+        return list(
+            islice(
+                self.iter_branch_pipelines(
+                    namespace, name, branch, per_page=min(limit or 100, 100)
+                ),
+                limit,
+            )
+        )
 
     def get_ci_variable(self, namespace: str, name: str, key: str) -> dict | None:
         """Return the CI/CD variable dict for the given key, or None if not found/supported."""
         return None
 
+    def get_circuit_breaker(self) -> CircuitBreaker:
+        from urllib.parse import urlsplit
+
+        from wexample_filestate_git.remote.http.circuit_breaker import (
+            CircuitBreaker,
+        )
+
+        return CircuitBreaker.get_for_host(urlsplit(self.get_base_url() or "").netloc)
+
+    def get_default_branch(self, namespace: str, name: str) -> str | None:
+        """Return the repository's default branch, or None if unknown/not supported."""
+        return None
+
     def get_merge_proposal_id(self, proposal: dict[str, Any]) -> int:
         """Extract the provider-specific numeric identifier from a proposal dict."""
         return proposal.get("iid") or proposal.get("number")
@@ -113,6 +222,115 @@ class AbstractRemote(AbstractGateway):
     ) -> dict[str, Any]:
         """Return the pipeline/workflow-run dict for the given ID."""
 
+    def get_pipeline_status(self, pipeline: dict[str, Any]) -> str:
+        """Normalized status of a pipeline dict, as ``get_pipeline`` returns it."""
+        return self._extract_pipeline_status(pipeline)
+
+    def get_rate_limit_budget(self, resource: str = "core") -> dict[str, Any]:
+        """Return what is known about the host's remaining request budget."""
+        return self.get_rate_limit_scheduler(resource).get_budget()
+
+    def get_rate_limit_scheduler(self, resource: str = "core") -> RateLimitScheduler:
+        from urllib.parse import urlsplit
+
+        from wexample_filestate_git.remote.http.rate_limit_scheduler import (
+            RateLimitScheduler,
+        )
+
+        host = urlsplit(self.get_base_url() or "").netloc
+        return RateLimitScheduler.get_for_host(f"{host}#{resource}")
+
+    def grant_group_ci_variables(
+        self, group: str, keys: list[str], namespace: str, name: str
+    ) -> bool:
+        """Make group-level variables visible to one repository.
+
+        GitLab projects inherit their groups' variables, so this is a no-op
+        by default; GitHub restricts organization secrets to selected
+        repositories.
+        """
+        return True
+
+    def is_pipeline_terminal(self, pipeline: dict[str, Any]) -> bool:
+        """Whether a pipeline dict has reached a final status."""
+        return self._is_pipeline_terminal(pipeline)
+
+    def iter_branch_pipelines(
+        self,
+        namespace: str,
+        name: str,
+        branch: str,
+        per_page: int = 20,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily yield pipelines for a branch, most recent first. Empty by default."""
+        return iter(())
+
+    def iter_paginated(
+        self,
+        endpoint: str,
+        query_params: dict[str, Any] | None = None,
+        items_key: str | None = None,
+        per_page: int | None = 100,
+        **request_kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the items of a list endpoint, fetching the next page only when needed.
+
+        Follows ``Link: rel="next"`` headers (GitHub, GitLab keyset and
+        offset) and falls back to GitLab's ``X-Next-Page``. ``items_key``
+        names the list inside an object payload (e.g. ``check_runs``).
+        Stopping the iteration stops the fetching. Pages that fail are
+        treated as the end of the list unless ``raise_exceptions=True``.
+        """
+        if per_page:
+            query_params = {**(query_params or {}), "per_page": per_page}
+        request_kwargs = {
+            "call_origin": __file__,
+            "expected_status_codes": [200],
+            "fatal_if_unexpected": False,
+            "quiet": True,
+            **request_kwargs,
+        }
+
+        while endpoint:
+            response = self.make_request(
+                endpoint=endpoint, query_params=query_params, **request_kwargs
+            )
+            if response is None or response.status_code != 200:
+                return
+
+            payload = response.json()
+            items = (payload or {}).get(items_key, []) if items_key else payload
+            yield from items or []
+
+            endpoint, query_params = self._get_next_page(
+                response, endpoint, query_params
+            )
+
+    def list_ci_variables(
+        self, namespace: str, name: str
+    ) -> dict[str, dict[str, Any]] | None:
+        """Return every CI/CD variable by key, or None if listing is not supported."""
+        return None
+
+    def list_group_ci_variables(self, group: str) -> dict[str, dict[str, Any]] | None:
+        """Return every group / organization level variable by key, or None if not supported."""
+        return None
+
+    def make_request(self, endpoint: str, **kwargs: Any) -> requests.Response | None:
+        # Retries are orchestrated by the gateway, which calls back into this
+        # method once per attempt with retries=0.
+        if kwargs.get("retries", 0) > 0:
+            return super().make_request(endpoint=endpoint, **kwargs)
+        if not self._is_cacheable_request(kwargs):
+            return self._send_request(endpoint=endpoint, **kwargs)
+
+        # Concurrent callers asking for the same resource (same options too,
+        # so error handling is identical) share a single request.
+        return self._in_flight.do(
+            self._build_request_key(endpoint, kwargs),
+            lambda: self._make_read_request(endpoint=endpoint, **kwargs),
+        )
+
     @abstract_method
     def merge_merge_proposal(
         self,
@@ -135,37 +353,202 @@ class AbstractRemote(AbstractGateway):
         interval: int = 10,
         on_tick: Callable[[str, int], None] | None = None,
     ) -> str:
-        """Poll until a terminal status is reached. Returns the final status string."""
+        """Poll until a terminal status is reached. Returns the final status string.
+
+        With a ``webhook_receiver``, pipeline events replace the sleeps and
+        the pipeline is only fetched again when no event arrived within
+        ``webhook_fallback_timeout``.
+        """
         deadline = time.monotonic() + timeout
         while time.monotonic() < deadline:
             pipeline = self.get_pipeline(namespace, name, pipeline_id)
-            status = self._extract_pipeline_status(pipeline)
-            elapsed = int(timeout - (deadline - time.monotonic()))
-            if on_tick:
-                on_tick(status, elapsed)
-            if self._is_pipeline_terminal(pipeline):
-                return status
-            time.sleep(interval)
+            while pipeline is not None:
+                status = self._extract_pipeline_status(pipeline)
+                elapsed = int(timeout - (deadline - time.monotonic()))
+                if on_tick:
+                    on_tick(status, elapsed)
+                if self._is_pipeline_terminal(pipeline):
+                    return status
+                pipeline = self._wait_for_pipeline_event(
+                    namespace, name, pipeline_id, interval, deadline
+                )
         raise TimeoutError(f"Pipeline {pipeline_id} did not complete within {timeout}s")
 
     def set_ci_variable(
-        self, namespace: str, name: str, key: str, value: str, masked: bool = True
+        self,
+        namespace: str,
+        name: str,
+        key: str,
+        value: str,
+        masked: bool = True,
+        exists: bool | None = None,
     ) -> bool:
-        """Create or update a CI/CD variable. Returns True if successful, False if not supported."""
+        """Create or update a CI/CD variable. Returns True if successful, False if not supported.
+
+        ``exists`` tells whether the variable is already defined, when the
+        caller knows it, sparing the lookup.
+        """
         return False
 
+    def set_ci_variables(
+        self,
+        namespace: str,
+        name: str,
+        variables: dict[str, str],
+        masked: bool = True,
+        existing: dict[str, dict[str, Any]] | None = None,
+        max_workers: int = 8,
+    ) -> dict[str, bool]:
+        """Bring many CI/CD variables to the given values; returns success per key.
+
+        Current values come from ``existing`` or a single listing; only
+        variables that differ are written, concurrently.
+        """
+        if existing is None:
+            existing = self.list_ci_variables(namespace, name)
+
+        return self._write_changed_variables(
+            variables,
+            existing,
+            lambda key, value, exists: self.set_ci_variable(
+                namespace, name, key, value, masked=masked, exists=exists
+            ),
+            max_workers=max_workers,
+        )
+
     def set_default_branch(self, namespace: str, name: str, branch_name: str) -> bool:
         """Set the default branch. Returns True if successful, False if not supported."""
         return False
 
+    def set_group_ci_variable(
+        self,
+        group: str,
+        key: str,
+        value: str,
+        masked: bool = True,
+        exists: bool | None = None,
+    ) -> bool:
+        """Create or update a group / organization level variable. False if not supported."""
+        return False
+
+    def set_group_ci_variables(
+        self,
+        group: str,
+        variables: dict[str, str],
+        masked: bool = True,
+        existing: dict[str, dict[str, Any]] | None = None,
+        max_workers: int = 8,
+    ) -> dict[str, bool]:
+        """Group counterpart of ``set_ci_variables``."""
+        if existing is None:
+            existing = self.list_group_ci_variables(group)
+
+        return self._write_changed_variables(
+            variables,
+            existing,
+            lambda key, value, exists: self.set_group_ci_variable(
+                group, key, value, masked=masked, exists=exists
+            ),
+            max_workers=max_workers,
+        )
+
     def unprotect_branch(self, namespace: str, name: str, branch_name: str) -> bool:
         """Remove branch protection. Returns True if successful, False if not supported."""
         return False
 
+    def _build_request_key(self, endpoint: str, request_kwargs: dict[str, Any]) -> str:
+        import json
+
+        return json.dumps(
+            {"endpoint": endpoint, **request_kwargs}, default=str, sort_keys=True
+        )
+
+    def _check_expected_status_code(
+        self,
+        endpoint: str,
+        response: requests.Response,
+        request_kwargs: dict[str, Any],
+    ) -> requests.Response | None:
+        """Report ``response`` as the gateway would have, had it been sent with
+        ``request_kwargs`` rather than with a status code tolerated on top."""
+        from wexample_api.common.http_request_payload import HttpRequestPayload
+        from wexample_helpers.error.gateway_error import GatewayError
+
+        expected = request_kwargs.get("expected_status_codes")
+        if expected is None:
+            return response
+        expected = [expected] if isinstance(expected, int) else list(expected)
+        if response.status_code in expected:
+            return response
+
+        exception = GatewayError(self._extract_error_message(response))
+        exception.response = response
+        if request_kwargs.get("raise_exceptions", False):
+            raise exception
+        return self.handle_api_response(
+            response=response,
+            request_context=HttpRequestPayload.from_endpoint(
+                base_url=self.get_base_url(),
+                endpoint=endpoint,
+                method=request_kwargs.get("method", HttpMethod.GET),
+                data=request_kwargs.get("data"),
+                query_params=request_kwargs.get("query_params"),
+                headers={
+                    **self.default_headers,
+                    **(request_kwargs.get("headers") or {}),
+                },
+                call_origin=request_kwargs.get("call_origin"),
+                expected_status_codes=expected,
+            ),
+            exception=exception,
+            fatal_on_error=request_kwargs.get("fatal_if_unexpected", False),
+            quiet=request_kwargs.get("quiet", False),
+        )
+
     def _extract_pipeline_status(self, pipeline: dict[str, Any]) -> str:
         """Extract the human-readable status string from a pipeline dict."""
         return pipeline.get("status", "")
 
+    def _get_next_page(
+        self,
+        response: requests.Response,
+        endpoint: str,
+        query_params: dict[str, Any] | None,
+    ) -> tuple[str | None, dict[str, Any] | None]:
+        """Follow the ``Link: rel="next"`` header, else GitLab's ``X-Next-Page``."""
+        from urllib.parse import parse_qsl, urlsplit
+
+        next_link = (response.links or {}).get("next", {}).get("url")
+        if isinstance(next_link, str) and next_link:
+            parts = urlsplit(next_link)
+            base_path = urlsplit(self.get_base_url() or "").path.rstrip("/")
+            next_endpoint = parts.path
+            if next_endpoint.startswith(base_path):
+                next_endpoint = next_endpoint[len(base_path) :]
+            return next_endpoint.lstrip("/"), dict(parse_qsl(parts.query))
+
+        next_page = response.headers.get("X-Next-Page")
+        if isinstance(next_page, str) and next_page:
+            return endpoint, {**(query_params or {}), "page": next_page}
+
+        return None, None
+
+    def _get_rate_limit_resource(self, endpoint: str) -> str:
+        """Name of the rate limit budget an endpoint draws from."""
+        return "core"
+
+    def _is_cacheable_request(self, request_kwargs: dict[str, Any]) -> bool:
+        return request_kwargs.get(
+            "method", HttpMethod.GET
+        ) == HttpMethod.GET and not request_kwargs.get("stream", False)
+
+    def _is_persistable_endpoint(self, endpoint: str) -> bool:
+        """Whether a response may be written to disk; secrets stay in memory."""
+        return not any(
+            part in ("variables", "secrets")
+            for part in endpoint.split("?")[0].split("/")
+        )
+
     def _is_pipeline_terminal(self, pipeline: dict[str, Any]) -> bool:
         """Return True if the pipeline has reached a terminal state."""
         return self._extract_pipeline_status(pipeline) in {
@@ -174,3 +557,153 @@ class AbstractRemote(AbstractGateway):
             "canceled",
             "skipped",
         }
+
+    def _make_conditional_request(
+        self, endpoint: str, **kwargs: Any
+    ) -> requests.Response | None:
+        """Send a GET with the stored validators and serve a 304 from cache."""
+        url = f"{(self.get_base_url() or '').rstrip('/')}/{endpoint.lstrip('/')}"
+        key = self.response_cache.build_key(
+            url=url,
+            query_params=kwargs.get("query_params"),
+            headers={**self.default_headers, **(kwargs.get("headers") or {})},
+        )
+        entry = self.response_cache.get(key)
+
+        if entry is not None:
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                **entry.get_validator_headers(),
+            }
+            kwargs = self._tolerate_status_code(kwargs, 304)
+
+        response = self._send_request(endpoint=endpoint, **kwargs)
+
+        if response is None:
+            return None
+        if response.status_code == 304 and entry is not None:
+            return entry.to_response()
+        if response.status_code == 200:
+            self.response_cache.store(
+                key, response, persist=self._is_persistable_endpoint(endpoint)
+            )
+        elif response.status_code in (404, 410):
+            self.response_cache.invalidate(key)
+        return response
+
+    def _make_read_request(
+        self, endpoint: str, **kwargs: Any
+    ) -> requests.Response | None:
+        if self.response_cache is not None:
+            return self._make_conditional_request(endpoint=endpoint, **kwargs)
+        return self._send_request(endpoint=endpoint, **kwargs)
+
+    def _send_http_request(self, **request_kwargs: Any) -> requests.Response:
+        """Transport hook of ``AbstractGateway.make_request``: send the built
+        request through the pooled client (see ``GatewayTransport``)."""
+        if self.http_client is None:
+            import requests
+
+            return requests.request(**request_kwargs)
+        return self.http_client.request(**request_kwargs)
+
+    def _send_request(self, endpoint: str, **kwargs: Any) -> requests.Response | None:
+        """Send through the host's circuit breaker and rate limit scheduler,
+        retrying on 429."""
+        from wexample_helpers.error.gateway_error import GatewayError
+
+        from wexample_filestate_git.remote.http.gateway_transport import (
+            GatewayTransport,
+        )
+
+        breaker = self.get_circuit_breaker()
+        breaker.allow_request(probe=self.check_connection)
+        scheduler = self.get_rate_limit_scheduler(
+            self._get_rate_limit_resource(endpoint)
+        )
+
+        for attempt in range(self.rate_limit_retries + 1):
+            is_last_attempt = attempt == self.rate_limit_retries
+            attempt_kwargs = kwargs
+            if not is_last_attempt:
+                # A 429 is retried below, so it must not be reported (or be
+                # fatal) on intermediate attempts.
+                attempt_kwargs = self._tolerate_status_code(kwargs, 429)
+
+            scheduler.acquire()
+            try:
+                with GatewayTransport.use(self):
+                    response = super().make_request(endpoint=endpoint, **attempt_kwargs)
+            except GatewayError as e:
+                breaker.record_response(getattr(e, "response", None))
+                raise
+            breaker.record_response(response)
+
+            if response is None:
+                return None
+            scheduler.update_from_response(response)
+            if is_last_attempt or not scheduler.is_rate_limited_response(response):
+                return response
+
+            self.io.log(
+                f"Rate limited by {scheduler.host}, retry {attempt + 1}/{self.rate_limit_retries}…"
+            )
+
+        return response
+
+    def _tolerate_status_code(
+        self, request_kwargs: dict[str, Any], status_code: int
+    ) -> dict[str, Any]:
+        expected = request_kwargs.get("expected_status_codes")
+        if expected is None:
+            return request_kwargs
+        expected = [expected] if isinstance(expected, int) else list(expected)
+        return {**request_kwargs, "expected_status_codes": [*expected, status_code]}
+
+    def _wait_for_pipeline_event(
+        self,
+        namespace: str,
+        name: str,
+        pipeline_id: int,
+        interval: int,
+        deadline: float,
+    ) -> dict[str, Any] | None:
+        """Return the pipeline pushed by a webhook, or None once it is time to poll."""
+        if self.webhook_receiver is None:
+            time.sleep(interval)
+            return None
+        return self.webhook_receiver.wait_for_pipeline(
+            self.webhook_receiver.build_event_key(self, namespace, name, pipeline_id),
+            timeout=min(
+                self.webhook_fallback_timeout, max(deadline - time.monotonic(), 0)
+            ),
+        )
+
+    def _write_changed_variables(
+        self,
+        variables: dict[str, str],
+        existing: dict[str, dict[str, Any]] | None,
+        write: Callable[[str, str, bool | None], bool],
+        max_workers: int,
+    ) -> dict[str, bool]:
+        """Write, concurrently, the variables whose value differs from ``existing``."""
+        from wexample_helpers.helper.parallel import parallel_map
+
+        results: dict[str, bool] = {}
+        to_write: list[tuple[str, str]] = []
+        for key, value in variables.items():
+            current = existing.get(key) if existing is not None else None
+            if current is not None and current.get("value") == value:
+                results[key] = True
+            else:
+                to_write.append((key, value))
+
+        written = parallel_map(
+            to_write,
+            lambda item: write(
+                item[0], item[1], None if existing is None else item[0] in existing
+            ),
+            max_workers=max_workers,
+        )
+        results.update(zip((key for key, _ in to_write), written))
+        return results
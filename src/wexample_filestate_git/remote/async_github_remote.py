@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_helpers.decorator.base_class import base_class
+
+from .abstract_async_remote import AbstractAsyncRemote
+
+if TYPE_CHECKING:
+    from .github_remote import GithubRemote
+
+
+@base_class
+class AsyncGithubRemote(AbstractAsyncRemote):
+    @classmethod
+    def get_remote_class(cls) -> type[GithubRemote]:
+        from .github_remote import GithubRemote
+
+        return GithubRemote
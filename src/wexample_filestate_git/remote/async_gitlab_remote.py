@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_helpers.decorator.base_class import base_class
+
+from .abstract_async_remote import AbstractAsyncRemote
+
+if TYPE_CHECKING:
+    from .gitlab_remote import GitlabRemote
+
+
+@base_class
+class AsyncGitlabRemote(AbstractAsyncRemote):
+    @classmethod
+    def get_remote_class(cls) -> type[GitlabRemote]:
+        from .gitlab_remote import GitlabRemote
+
+        return GitlabRemote
+
+    async def prefetch_group(
+        self, group_path: str, include_subgroups: bool = True
+    ) -> int:
+        return await self._call(
+            self.remote.prefetch_group, group_path, include_subgroups
+        )
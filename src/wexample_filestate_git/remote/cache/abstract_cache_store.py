@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from wexample_helpers.classes.abstract_method import abstract_method
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class AbstractCacheStore(BaseClass):
+    """Key / value store with a time to live per entry.
+
+    Values must be JSON serializable and not None: ``get`` returns None for
+    missing and expired entries alike. Entries set without a TTL never
+    expire, but can still be invalidated.
+    """
+
+    @abstract_method
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstract_method
+    def delete(self, key: str) -> None:
+        """Invalidate one entry."""
+
+    @abstract_method
+    def delete_prefix(self, prefix: str) -> int:
+        """Invalidate every entry whose key starts with ``prefix``; returns their count."""
+
+    @abstract_method
+    def get(self, key: str) -> Any | None:
+        """Return the value of a live entry, or None."""
+
+    @abstract_method
+    def purge_expired(self) -> int:
+        """Drop expired entries; returns their count."""
+
+    @abstract_method
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store ``value`` for ``ttl`` seconds (forever when None)."""
+
+    def _get_expires_at(self, ttl: float | None) -> float | None:
+        return None if ttl is None else time.time() + ttl
+
+    def _is_expired(self, expires_at: float | None) -> bool:
+        return expires_at is not None and expires_at <= time.time()
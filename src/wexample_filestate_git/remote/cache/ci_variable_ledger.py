@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class CiVariableLedger(BaseClass):
+    """Remembers which CI variable values were last pushed to which remote.
+
+    Remotes do not reliably give values back (masked GitLab variables,
+    GitHub secrets), so comparing against the remote costs a request and
+    may still be inconclusive. The ledger keeps, per (remote URL, variable),
+    a salted hash of the last value pushed and the remote ``updated_at`` when
+    known; a matching local value needs no request at all. Values are never
+    stored: the salt is random per ledger file.
+
+    Several processes may share the file: every change re-reads it under an
+    exclusive lock (a ``.lock`` sibling), applies itself and writes the
+    result back, so concurrent runs merge their entries instead of
+    overwriting each other.
+    """
+
+    path: Path | None = public_field(
+        default=None,
+        description="JSON file where entries are persisted; in memory only when None",
+    )
+    _data: dict[str, Any] | None = private_field(
+        default=None, description="Loaded ledger content"
+    )
+    _lock: threading.RLock = private_field(
+        factory=threading.RLock, description="Guards entries and file writes"
+    )
+
+    def forget(self, remote_url: str, var_name: str) -> None:
+        key = self._build_key(remote_url, var_name)
+        self._update(lambda data: data["entries"].pop(key, None) is not None)
+
+    def get_entry(self, remote_url: str, var_name: str) -> dict[str, Any] | None:
+        with self._lock:
+            return self._load()["entries"].get(self._build_key(remote_url, var_name))
+
+    def is_synced(self, remote_url: str, var_name: str, value: str) -> bool:
+        """True if ``value`` is the one last pushed for this variable."""
+        entry = self.get_entry(remote_url, var_name)
+        return entry is not None and entry.get("hash") == self._hash(
+            remote_url, var_name, value
+        )
+
+    def record(
+        self,
+        remote_url: str,
+        var_name: str,
+        value: str,
+        updated_at: str | None = None,
+    ) -> None:
+        """Remember ``value`` as the one currently set on the remote."""
+        import time
+
+        key = self._build_key(remote_url, var_name)
+
+        def apply(data: dict[str, Any]) -> bool:
+            # Hash with the salt of the file as it is now, which another
+            # process may have created since this ledger was loaded.
+            data["entries"][key] = {
+                "hash": self._hash_with_salt(data["salt"], remote_url, var_name, value),
+                "synced_at": time.time(),
+                "updated_at": updated_at,
+            }
+            return True
+
+        self._update(apply)
+
+    def _build_key(self, remote_url: str, var_name: str) -> str:
+        return f"{remote_url}|{var_name}"
+
+    def _hash(self, remote_url: str, var_name: str, value: str) -> str:
+        with self._lock:
+            salt = self._load()["salt"]
+        return self._hash_with_salt(salt, remote_url, var_name, value)
+
+    def _hash_with_salt(
+        self, salt: str, remote_url: str, var_name: str, value: str
+    ) -> str:
+        import hashlib
+        import hmac
+
+        message = "\0".join((remote_url, var_name, value)).encode("utf-8")
+        return hmac.new(bytes.fromhex(salt), message, hashlib.sha256).hexdigest()
+
+    def _load(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = self._read()
+        return self._data
+
+    @contextmanager
+    def _lock_file(self) -> Iterator[None]:
+        """Hold an exclusive lock on the ledger file across processes."""
+        if self.path is None:
+            yield
+            return
+        try:
+            import fcntl
+        except ImportError:
+            # No flock (Windows): concurrent runs may lose entries, which
+            # only costs requests.
+            yield
+            return
+
+        path = Path(self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path.with_name(f"{path.name}.lock"), "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _read(self) -> dict[str, Any]:
+        import json
+        import secrets
+
+        data: dict[str, Any] = {}
+        if self.path is not None and Path(self.path).exists():
+            try:
+                data = json.loads(Path(self.path).read_text())
+            except (OSError, ValueError):
+                # Unreadable ledger: start over, values will be pushed again.
+                data = {}
+        if not data.get("salt"):
+            # A new salt invalidates any entry that might be left.
+            data = {"salt": secrets.token_hex(16), "entries": {}}
+        data.setdefault("entries", {})
+        return data
+
+    def _save(self, data: dict[str, Any]) -> None:
+        import json
+        import os
+        import tempfile
+
+        if self.path is None:
+            return
+        path = Path(self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write then rename so concurrent readers never see a partial file;
+        # the ledger holds hashes only, but keep it private anyway.
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as handle:
+                json.dump(data, handle)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, path)
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+
+    def _update(self, change: Callable[[dict[str, Any]], bool]) -> None:
+        """Apply ``change`` to the current file content and write it back if
+        it reports a modification."""
+        with self._lock, self._lock_file():
+            # In memory only, the loaded copy is the ledger itself.
+            data = self._read() if self.path is not None else self._load()
+            if change(data):
+                self._save(data)
+            self._data = data
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_filestate_git.remote.cache.abstract_cache_store import (
+    AbstractCacheStore,
+)
+from wexample_filestate_git.remote.cache.memory_cache_store import MemoryCacheStore
+
+
+@base_class
+class GitlabIdCache(BaseClass):
+    """Maps GitLab namespace and project paths to their numeric IDs.
+
+    GitLab resolves URL-encoded paths on every request and namespace IDs need
+    a search to be found; once known, IDs are stable until the namespace or
+    project is deleted, so they are kept in ``store`` (the shared SQLite
+    store survives between runs and is safe to share between processes).
+    Entries are keyed by API base URL so several instances can share it.
+    """
+
+    store: AbstractCacheStore = public_field(
+        factory=MemoryCacheStore,
+        description="Store the IDs are kept in; in memory only by default",
+    )
+
+    def get_namespace_id(self, base_url: str, namespace_path: str) -> int | None:
+        return self.store.get(self._build_key("namespaces", base_url, namespace_path))
+
+    def get_project_id(self, base_url: str, project_path: str) -> int | None:
+        return self.store.get(self._build_key("projects", base_url, project_path))
+
+    def get_project_path(self, base_url: str, project_id: int) -> str | None:
+        """Reverse lookup, used to fall back to the path when an ID went stale."""
+        project_path = self.store.get(
+            self._build_key("project_paths", base_url, str(project_id))
+        )
+        # The path may have been given to another project since.
+        if project_path is None or (
+            self.get_project_id(base_url, project_path) != project_id
+        ):
+            return None
+        return project_path
+
+    def invalidate_namespace(self, base_url: str, namespace_path: str) -> None:
+        self.store.delete(self._build_key("namespaces", base_url, namespace_path))
+
+    def invalidate_project(self, base_url: str, project_path: str) -> None:
+        project_id = self.get_project_id(base_url, project_path)
+        self.store.delete(self._build_key("projects", base_url, project_path))
+        if project_id is not None:
+            self.store.delete(
+                self._build_key("project_paths", base_url, str(project_id))
+            )
+
+    def set_namespace_id(
+        self, base_url: str, namespace_path: str, namespace_id: int
+    ) -> None:
+        self.store.set(
+            self._build_key("namespaces", base_url, namespace_path), namespace_id
+        )
+
+    def set_project_id(self, base_url: str, project_path: str, project_id: int) -> None:
+        self.store.set(self._build_key("projects", base_url, project_path), project_id)
+        self.store.set(
+            self._build_key("project_paths", base_url, str(project_id)), project_path
+        )
+
+    def _build_key(self, kind: str, base_url: str, path: str) -> str:
+        return f"gitlab_id:{kind}:{base_url.rstrip('/')}|{path}"
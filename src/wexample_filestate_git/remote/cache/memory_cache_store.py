@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_filestate_git.remote.cache.abstract_cache_store import (
+    AbstractCacheStore,
+)
+
+
+@base_class
+class MemoryCacheStore(AbstractCacheStore):
+    """Cache store local to the process, lost when it exits."""
+
+    _entries: dict[str, tuple[Any, float | None]] = private_field(
+        factory=dict, description="Value and expiry time, by key"
+    )
+    _lock: threading.Lock = private_field(
+        factory=threading.Lock, description="Guards entries"
+    )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._is_expired(entry[1]):
+                del self._entries[key]
+                return None
+            return entry[0]
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            keys = [
+                key
+                for key, (_, expires_at) in self._entries.items()
+                if self._is_expired(expires_at)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        with self._lock:
+            self._entries[key] = (value, self._get_expires_at(ttl))
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_filestate_git.remote.cache.abstract_cache_store import (
+    AbstractCacheStore,
+)
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+@base_class
+class SqliteCacheStore(AbstractCacheStore):
+    """Cache store in a SQLite file, shared by threads, processes and runs.
+
+    Every operation is a single statement on its own connection, so updates
+    are atomic without holding a lock in this process; concurrent writers
+    wait for each other (``busy_timeout``). The cache is an optimization:
+    when the file cannot be used, reads miss and writes are dropped.
+    """
+
+    busy_timeout: float = public_field(
+        default=30.0, description="Seconds to wait for a concurrent writer"
+    )
+    path: Path = public_field(description="SQLite database file")
+    _initialized: bool = private_field(
+        default=False, description="Whether the schema was created"
+    )
+
+    def clear(self) -> None:
+        self._execute("DELETE FROM entries")
+
+    def delete(self, key: str) -> None:
+        self._execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> int:
+        # substr() rather than LIKE: keys may contain % and _.
+        return self._execute(
+            "DELETE FROM entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+        )
+
+    def get(self, key: str) -> Any | None:
+        import json
+
+        row = self._fetch_one(
+            "SELECT value FROM entries WHERE key = ? "
+            "AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time()),
+        )
+        return None if row is None else json.loads(row[0])
+
+    def purge_expired(self) -> int:
+        return self._execute(
+            "DELETE FROM entries WHERE expires_at <= ?", (time.time(),)
+        )
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        import json
+
+        self._execute(
+            "INSERT INTO entries (key, value, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE "
+            "SET value = excluded.value, expires_at = excluded.expires_at",
+            (key, json.dumps(value), self._get_expires_at(ttl)),
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        import sqlite3
+
+        path = Path(self.path)
+        if not self._initialized:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            path, timeout=self.busy_timeout, isolation_level=None
+        )
+        if not self._initialized:
+            # WAL lets readers proceed while another process writes.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            self._initialized = True
+        return connection
+
+    def _execute(self, statement: str, parameters: tuple = ()) -> int:
+        import sqlite3
+        from contextlib import closing
+
+        try:
+            with closing(self._connect()) as connection:
+                return connection.execute(statement, parameters).rowcount
+        except (OSError, sqlite3.Error):
+            return 0
+
+    def _fetch_one(self, statement: str, parameters: tuple = ()) -> tuple | None:
+        import sqlite3
+        from contextlib import closing
+
+        try:
+            with closing(self._connect()) as connection:
+                return connection.execute(statement, parameters).fetchone()
+        except (OSError, sqlite3.Error):
+            return None
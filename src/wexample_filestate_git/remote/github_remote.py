@@ -1,13 +1,35 @@
 from __future__ import annotations
 
 import re
+import threading
+from collections.abc import Iterator
 from typing import Any
 
 from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 
+from wexample_filestate_git.remote.http.single_flight import SingleFlight
+
 from .abstract_remote import AbstractRemote
 
+# GraphQL caps a query's complexity; 100 aliased repository fields stay well
+# below it while keeping the number of round-trips minimal.
+GITHUB_GRAPHQL_BATCH_SIZE = 100
+
+_GITHUB_URL_PATTERN = re.compile(r"github\.com[:/]")
+
+_REPOSITORY_GRAPHQL_FIELDS = """
+    databaseId
+    id
+    isArchived
+    isPrivate
+    name
+    owner { login }
+    defaultBranchRef { name branchProtectionRule { pattern } }
+    branchProtectionRules(first: 100) { nodes { pattern } }
+"""
+
 
 @base_class
 class GithubRemote(AbstractRemote):
@@ -15,6 +37,21 @@ class GithubRemote(AbstractRemote):
     base_url: str = public_field(
         default="https://api.github.com", description="GitHub API base URL"
     )
+    _org_secret_repository_ids: dict[str, set[int]] = private_field(
+        factory=dict,
+        description="Repository IDs allowed to read each organization secret",
+    )
+    _public_keys: dict[str, dict[str, str]] = private_field(
+        factory=dict,
+        description="Actions secrets public key (key_id, key) per repository or organization",
+    )
+    _secrets_flight: SingleFlight = private_field(
+        factory=SingleFlight,
+        description="Shares key and access listings between concurrent writers",
+    )
+    _secrets_lock: threading.Lock = private_field(
+        factory=threading.Lock, description="Guards the public key and access caches"
+    )
 
     def __attrs_post_init__(self) -> None:
         self.default_headers.update(
@@ -34,10 +71,10 @@ class GithubRemote(AbstractRemote):
         Returns https://api.github.com for github.com,
         or https://{host}/api/v3 for GitHub Enterprise.
         """
-        m = re.search(r"^(?:https://|git@)([^/:]+)", remote_url)
-        if not m:
+        split = cls._split_repository_url(remote_url)
+        if split is None:
             return None
-        host = m.group(1)
+        host = split[0]
         return (
             "https://api.github.com"
             if host == "github.com"
@@ -46,23 +83,90 @@ class GithubRemote(AbstractRemote):
 
     @classmethod
     def detect_remote_type(cls, remote_url: str) -> bool:
-        return bool(re.search(r"github\.com[:/]", remote_url))
+        return bool(_GITHUB_URL_PATTERN.search(remote_url))
 
     @classmethod
     def is_github_repo(cls, remote_url: str) -> bool:
-        return bool(re.search(r"github\.com[:/]", remote_url))
+        return bool(_GITHUB_URL_PATTERN.search(remote_url))
+
+    @classmethod
+    def probe_host(cls, host: str) -> bool:
+        """GitHub Enterprise serves its version from the unauthenticated meta endpoint."""
+        import requests
+
+        try:
+            response = requests.get(f"https://{host}/api/v3/meta", timeout=5)
+            return response.status_code == 200 and "installed_version" in (
+                response.json() or {}
+            )
+        except (requests.RequestException, ValueError):
+            return False
 
     @classmethod
     def resolve_url_from_repo_url(cls, remote_url: str) -> str | None:
-        """Normalize any GitHub remote URL into a clean HTTPS repository URL."""
-        if not cls.is_github_repo(remote_url):
+        """Normalize a github.com or GitHub Enterprise remote URL into a clean
+        HTTPS repository URL."""
+        split = cls._split_repository_url(remote_url)
+        if split is None or not split[1]:
             return None
-        m = re.search(r"github\.com[:/](.+?)(?:\.git)?$", remote_url)
-        return f"https://github.com/{m.group(1)}" if m else None
+        return f"https://{split[0]}/{split[1]}"
+
+    @classmethod
+    def _split_repository_url(cls, remote_url: str) -> tuple[str, str] | None:
+        """Return the host and repository path of an https://, ssh:// or
+        scp-like (git@host:owner/repo.git) remote URL, on any host."""
+        from urllib.parse import urlsplit
+
+        from wexample_filestate_git.remote.remote_type_registry import (
+            RemoteTypeRegistry,
+        )
+
+        remote_url = remote_url.strip()
+        host = RemoteTypeRegistry.get_host(remote_url)
+        if host is None:
+            return None
+        if "://" in remote_url:
+            path = urlsplit(remote_url).path
+        else:
+            path = remote_url.partition(":")[2]
+        return host, path.strip("/").removesuffix(".git")
+
+    # ------------------------------------------------------------------
+    # Connectivity
+    # ------------------------------------------------------------------
+    def check_connection(self) -> bool:
+        from wexample_api.enums.http import HttpMethod
+
+        response = self.make_request(
+            method=HttpMethod.HEAD,
+            endpoint="user",
+            call_origin=__file__,
+            expected_status_codes=[200],
+            fatal_if_unexpected=False,
+            quiet=True,
+        )
+        return response is not None and response.status_code == 200
 
     # ------------------------------------------------------------------
     # Repositories
     # ------------------------------------------------------------------
+    def check_repositories_exist(
+        self, remote_urls: list[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        """Resolve repositories through GraphQL, up to 100 per request.
+
+        Besides existence, each entry carries the numeric ``id``, the default
+        branch and branch protection metadata from the same response.
+        """
+        results: dict[str, dict[str, Any] | None] = {}
+        for start in range(0, len(remote_urls), GITHUB_GRAPHQL_BATCH_SIZE):
+            results.update(
+                self._check_repositories_exist_batch(
+                    remote_urls[start : start + GITHUB_GRAPHQL_BATCH_SIZE]
+                )
+            )
+        return results
+
     def check_repository_exists(self, name: str, namespace: str) -> bool:
         response = self.make_request(
             endpoint=f"repos/{namespace}/{name}",
@@ -150,6 +254,33 @@ class GithubRemote(AbstractRemote):
             )
         return {}
 
+    # ------------------------------------------------------------------
+    # CI/CD variables (GitHub: Actions secrets)
+    # ------------------------------------------------------------------
+    def get_ci_variable(self, namespace: str, name: str, key: str) -> dict | None:
+        """Return the secret's metadata; GitHub never returns secret values."""
+        response = self.make_request(
+            endpoint=f"repos/{namespace}/{name}/actions/secrets/{key}",
+            call_origin=__file__,
+            expected_status_codes=[200, 404],
+            fatal_if_unexpected=False,
+        )
+        if response and response.status_code == 200:
+            return response.json()
+        return None
+
+    def get_default_branch(self, namespace: str, name: str) -> str | None:
+        response = self.make_request(
+            endpoint=f"repos/{namespace}/{name}",
+            call_origin=__file__,
+            expected_status_codes=[200, 404],
+            fatal_if_unexpected=False,
+            quiet=True,
+        )
+        if response is None or response.status_code != 200:
+            return None
+        return response.json().get("default_branch")
+
     def get_merge_proposal_pipelines(
         self,
         namespace: str,
@@ -167,12 +298,14 @@ class GithubRemote(AbstractRemote):
         head_sha = pr.json().get("head", {}).get("sha", "")
         if not head_sha:
             return []
-        response = self.make_request(
-            endpoint=f"repos/{namespace}/{name}/commits/{head_sha}/check-runs",
-            call_origin=__file__,
-            expected_status_codes=[200],
+        return list(
+            self.iter_paginated(
+                endpoint=f"repos/{namespace}/{name}/commits/{head_sha}/check-runs",
+                items_key="check_runs",
+                call_origin=__file__,
+                quiet=False,
+            )
         )
-        return response.json().get("check_runs", []) if response else []
 
     # ------------------------------------------------------------------
     # Pipelines (GitHub: workflow runs)
@@ -190,6 +323,67 @@ class GithubRemote(AbstractRemote):
         )
         return response.json() if response else {}
 
+    def grant_group_ci_variables(
+        self, group: str, keys: list[str], namespace: str, name: str
+    ) -> bool:
+        from wexample_api.enums.http import HttpMethod
+
+        repository = self.make_request(
+            endpoint=f"repos/{namespace}/{name}",
+            call_origin=__file__,
+            expected_status_codes=[200],
+            fatal_if_unexpected=False,
+        )
+        if repository is None or repository.status_code != 200:
+            return False
+        repository_id = repository.json()["id"]
+
+        granted = True
+        for key in keys:
+            repository_ids = self._get_org_secret_repository_ids(group, key)
+            if repository_ids is None:
+                granted = False
+                continue
+            if repository_id in repository_ids:
+                continue
+            response = self.make_request(
+                method=HttpMethod.PUT,
+                endpoint=f"orgs/{group}/actions/secrets/{key}/repositories/{repository_id}",
+                call_origin=__file__,
+                expected_status_codes=[204],
+                fatal_if_unexpected=False,
+            )
+            if response is not None and response.status_code == 204:
+                with self._secrets_lock:
+                    self._org_secret_repository_ids[f"{group}/{key}"].add(repository_id)
+            else:
+                granted = False
+        return granted
+
+    def iter_branch_pipelines(
+        self,
+        namespace: str,
+        name: str,
+        branch: str,
+        per_page: int = 20,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield workflow runs for a branch, most recent first."""
+        return self.iter_paginated(
+            endpoint=f"repos/{namespace}/{name}/actions/runs",
+            query_params={"branch": branch},
+            items_key="workflow_runs",
+            per_page=per_page,
+            call_origin=__file__,
+        )
+
+    def list_ci_variables(
+        self, namespace: str, name: str
+    ) -> dict[str, dict[str, Any]] | None:
+        return self._list_secrets(f"repos/{namespace}/{name}")
+
+    def list_group_ci_variables(self, group: str) -> dict[str, dict[str, Any]] | None:
+        return self._list_secrets(f"orgs/{group}")
+
     def merge_merge_proposal(
         self,
         namespace: str,
@@ -209,18 +403,265 @@ class GithubRemote(AbstractRemote):
         return response.json()
 
     def parse_repository_url(self, remote_url: str) -> dict[str, str]:
-        path = re.sub(r"^(https://github\.com/|git@github\.com:)", "", remote_url)
-        path = path.replace(".git", "")
-        parts = path.split("/")
+        split = self._split_repository_url(remote_url)
+        parts = (split[1] if split else remote_url).split("/")
         if len(parts) >= 2:
             return {"name": parts[-1], "namespace": parts[-2]}
         return {"name": parts[0], "namespace": ""}
 
+    def set_ci_variable(
+        self,
+        namespace: str,
+        name: str,
+        key: str,
+        value: str,
+        masked: bool = True,
+        exists: bool | None = None,
+    ) -> bool:
+        """Create or update an Actions secret (always masked; the PUT is an upsert)."""
+        return self._put_secret(f"repos/{namespace}/{name}", key, value)
+
+    def set_group_ci_variable(
+        self,
+        group: str,
+        key: str,
+        value: str,
+        masked: bool = True,
+        exists: bool | None = None,
+    ) -> bool:
+        """Create or update an organization secret, readable by selected repositories.
+
+        Repositories granted so far are kept; ``grant_group_ci_variables``
+        adds the others. When they cannot be listed, the secret is left
+        untouched rather than written with an incomplete selection.
+        """
+        data: dict[str, Any] = {"visibility": "selected"}
+        if exists is not False:
+            repository_ids = self._get_org_secret_repository_ids(group, key)
+            if repository_ids is None:
+                return False
+            if repository_ids:
+                data["selected_repository_ids"] = sorted(repository_ids)
+        return self._put_secret(f"orgs/{group}", key, value, data)
+
+    def _check_repositories_exist_batch(
+        self, remote_urls: list[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        from wexample_api.enums.http import HttpMethod
+
+        variables: dict[str, str] = {}
+        declarations: list[str] = []
+        selections: list[str] = []
+        for index, remote_url in enumerate(remote_urls):
+            repo_info = self.parse_repository_url(remote_url)
+            variables[f"o{index}"] = repo_info["namespace"]
+            variables[f"n{index}"] = repo_info["name"]
+            declarations.append(f"$o{index}: String!, $n{index}: String!")
+            selections.append(
+                f"r{index}: repository(owner: $o{index}, name: $n{index}) "
+                f"{{{_REPOSITORY_GRAPHQL_FIELDS}}}"
+            )
+
+        response = self.make_request(
+            method=HttpMethod.POST,
+            endpoint=self._get_graphql_endpoint(),
+            data={
+                "query": f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}",
+                "variables": variables,
+            },
+            call_origin=__file__,
+            expected_status_codes=[200],
+            fatal_if_unexpected=True,
+        )
+        payload = response.json() or {}
+        data = payload.get("data") or {}
+
+        # Unknown repositories come back as null with a NOT_FOUND error; any
+        # other error (e.g. no permission on protection rules) leaves the
+        # repository itself resolved.
+        missing = {
+            error["path"][0]
+            for error in payload.get("errors") or []
+            if error.get("type") == "NOT_FOUND" and error.get("path")
+        }
+
+        results: dict[str, dict[str, Any] | None] = {}
+        for index, remote_url in enumerate(remote_urls):
+            alias = f"r{index}"
+            repository = data.get(alias)
+            if alias in missing or not repository:
+                results[remote_url] = None
+                continue
+            results[remote_url] = self._normalize_graphql_repository(repository)
+        return results
+
+    def _encrypt_secret(self, public_key: str, value: str) -> str:
+        """Seal a value with the repository public key, as the Actions API expects."""
+        import base64
+
+        try:
+            from nacl.public import PublicKey, SealedBox
+        except ImportError as exc:
+            raise RuntimeError(
+                "Syncing GitHub Actions secrets requires PyNaCl: "
+                "pip install 'wexample-filestate-git[github-secrets]'"
+            ) from exc
+
+        sealed_box = SealedBox(PublicKey(base64.b64decode(public_key)))
+        return base64.b64encode(sealed_box.encrypt(value.encode("utf-8"))).decode(
+            "ascii"
+        )
+
     def _extract_pipeline_status(self, pipeline: dict[str, Any]) -> str:
         """GitHub: return conclusion when completed, otherwise status."""
         if pipeline.get("status") == "completed":
             return pipeline.get("conclusion") or "completed"
         return pipeline.get("status", "")
 
+    def _get_graphql_endpoint(self) -> str:
+        # github.com serves GraphQL next to REST; Enterprise serves it at
+        # /api/graphql, a sibling of the /api/v3 REST base URL.
+        if self.get_base_url().rstrip("/").endswith("/api/v3"):
+            return "../graphql"
+        return "graphql"
+
+    def _fetch_public_key(self, owner: str) -> dict[str, str] | None:
+        response = self.make_request(
+            endpoint=f"{owner}/actions/secrets/public-key",
+            call_origin=__file__,
+            expected_status_codes=[200],
+            fatal_if_unexpected=False,
+        )
+        with self._secrets_lock:
+            if response is None or response.status_code != 200:
+                self._public_keys.pop(owner, None)
+                return None
+            self._public_keys[owner] = response.json()
+            return self._public_keys[owner]
+
+    def _get_org_secret_repository_ids(self, org: str, key: str) -> set[int] | None:
+        """Repositories selected for an organization secret, listed once per
+        process; None when the listing failed, which is not cached."""
+        from wexample_helpers.error.gateway_error import GatewayError
+
+        cache_key = f"{org}/{key}"
+        with self._secrets_lock:
+            if cache_key in self._org_secret_repository_ids:
+                return self._org_secret_repository_ids[cache_key]
+
+        def list_repository_ids() -> set[int]:
+            # 404: the secret does not exist yet, so nothing is selected.
+            return {
+                repository["id"]
+                for repository in self.iter_paginated(
+                    endpoint=f"orgs/{org}/actions/secrets/{key}/repositories",
+                    items_key="repositories",
+                    call_origin=__file__,
+                    expected_status_codes=[200, 404],
+                    raise_exceptions=True,
+                )
+            }
+
+        try:
+            repository_ids = self._secrets_flight.do(
+                f"repositories:{cache_key}", list_repository_ids
+            )
+        except GatewayError:
+            return None
+        with self._secrets_lock:
+            return self._org_secret_repository_ids.setdefault(cache_key, repository_ids)
+
+    def _get_public_key(
+        self, owner: str, refresh: bool = False
+    ) -> dict[str, str] | None:
+        """Return the Actions public key of a repository or organization, fetched once."""
+        with self._secrets_lock:
+            if not refresh and owner in self._public_keys:
+                return self._public_keys[owner]
+        # Concurrent writers to one owner share a single request; other
+        # owners are not held up by it.
+        return self._secrets_flight.do(
+            f"public-key:{owner}", lambda: self._fetch_public_key(owner)
+        )
+
+    def _get_rate_limit_resource(self, endpoint: str) -> str:
+        # GitHub meters GraphQL separately from the REST "core" budget.
+        return "graphql" if endpoint.endswith("graphql") else "core"
+
     def _is_pipeline_terminal(self, pipeline: dict[str, Any]) -> bool:
         return pipeline.get("status") == "completed"
+
+    def _list_secrets(self, owner: str) -> dict[str, dict[str, Any]] | None:
+        from wexample_helpers.error.gateway_error import GatewayError
+
+        try:
+            return {
+                secret["name"]: secret
+                for secret in self.iter_paginated(
+                    endpoint=f"{owner}/actions/secrets",
+                    items_key="secrets",
+                    call_origin=__file__,
+                    raise_exceptions=True,
+                )
+            }
+        except GatewayError:
+            return None
+
+    def _normalize_graphql_repository(
+        self, repository: dict[str, Any]
+    ) -> dict[str, Any]:
+        default_branch_ref = repository.get("defaultBranchRef") or {}
+        protection_rules = (repository.get("branchProtectionRules") or {}).get(
+            "nodes"
+        ) or []
+
+        return {
+            "name": repository.get("name"),
+            "namespace": (repository.get("owner") or {}).get("login"),
+            "id": repository.get("databaseId"),
+            "node_id": repository.get("id"),
+            "default_branch": default_branch_ref.get("name"),
+            "default_branch_protected": bool(
+                default_branch_ref.get("branchProtectionRule")
+            ),
+            "protected_branch_patterns": [
+                rule["pattern"] for rule in protection_rules if rule
+            ],
+            "is_archived": repository.get("isArchived", False),
+            "is_private": repository.get("isPrivate", False),
+        }
+
+    def _put_secret(
+        self,
+        owner: str,
+        key: str,
+        value: str,
+        data: dict[str, Any] | None = None,
+    ) -> bool:
+        from wexample_api.enums.http import HttpMethod
+
+        public_key = self._get_public_key(owner)
+        for attempt in range(2):
+            if public_key is None:
+                return False
+            response = self.make_request(
+                method=HttpMethod.PUT,
+                endpoint=f"{owner}/actions/secrets/{key}",
+                data={
+                    **(data or {}),
+                    "encrypted_value": self._encrypt_secret(public_key["key"], value),
+                    "key_id": public_key["key_id"],
+                },
+                call_origin=__file__,
+                expected_status_codes=[201, 204] if attempt else [201, 204, 422],
+                fatal_if_unexpected=False,
+            )
+            if response is None or response.status_code != 422:
+                break
+            # The key was rotated since it was cached: fetch it again, and
+            # retry only if it actually changed.
+            stale_key_id = public_key["key_id"]
+            public_key = self._get_public_key(owner, refresh=True)
+            if public_key is not None and public_key["key_id"] == stale_key_id:
+                break
+        return response is not None and response.status_code in (201, 204)
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+import threading
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
 from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 
 from .abstract_remote import AbstractRemote
 
+if TYPE_CHECKING:
+    import requests
+
+    from .cache.gitlab_id_cache import GitlabIdCache
+
+_GITLAB_URL_PATTERN = re.compile(r"gitlab\.[a-zA-Z0-9.-]+[:/]")
+
 
 @base_class
 class GitlabRemote(AbstractRemote):
@@ -15,6 +25,32 @@ class GitlabRemote(AbstractRemote):
     base_url: str = public_field(
         default="https://gitlab.com/api/v4", description="GitLab API base URL"
     )
+    group_prefetch: bool = public_field(
+        default=False,
+        description="List a whole group's projects on first lookup and answer later lookups from that index",
+    )
+    group_prefetch_ttl: float = public_field(
+        default=300.0,
+        description="Seconds a group index (or a failed listing) is trusted before the group is listed again",
+    )
+    id_cache: GitlabIdCache | None = public_field(
+        default=None,
+        description="Namespace / project ID cache; when set, project endpoints use numeric IDs",
+    )
+    _prefetch_lock: threading.Lock = private_field(
+        factory=threading.Lock, description="Guards the group project index"
+    )
+    _prefetched_groups: dict[str, tuple[bool, float]] = private_field(
+        factory=dict,
+        description="Full paths of indexed groups, mapped to whether subgroups were included and when",
+    )
+    _project_index: dict[str, dict[str, Any]] = private_field(
+        factory=dict, description="Prefetched projects keyed by path with namespace"
+    )
+    _unindexable_namespaces: dict[str, float] = private_field(
+        factory=dict,
+        description="Namespaces whose project listing failed (e.g. user namespaces), and when",
+    )
 
     def __attrs_post_init__(self) -> None:
         self.default_headers.update({"PRIVATE-TOKEN": self.api_token})
@@ -22,6 +58,17 @@ class GitlabRemote(AbstractRemote):
     # ------------------------------------------------------------------
     # Remote detection
     # ------------------------------------------------------------------
+    @classmethod
+    def build_registry_kwargs(cls) -> dict[str, Any]:
+        from .remote_registry import RemoteRegistry
+
+        # Pooled remotes serve whole-group reconciliations: one listing per
+        # group answers the lookups of all its repositories.
+        return {
+            "group_prefetch": True,
+            "id_cache": RemoteRegistry.get_gitlab_id_cache(),
+        }
+
     @classmethod
     def build_remote_api_url_from_repo(cls, remote_url: str) -> str | None:
         """Build API base URL from a GitLab remote URL.
@@ -45,7 +92,20 @@ class GitlabRemote(AbstractRemote):
 
     @classmethod
     def detect_remote_type(cls, remote_url: str) -> bool:
-        return bool(re.search(r"gitlab\.[a-zA-Z0-9.-]+[:/]", remote_url))
+        return bool(_GITLAB_URL_PATTERN.search(remote_url))
+
+    @classmethod
+    def probe_host(cls, host: str) -> bool:
+        """GitLab answers its version endpoint with JSON, even unauthenticated (401)."""
+        import requests
+
+        try:
+            response = requests.get(f"https://{host}/api/v4/version", timeout=5)
+            return response.status_code in (200, 401) and isinstance(
+                response.json(), dict
+            )
+        except (requests.RequestException, ValueError):
+            return False
 
     # ------------------------------------------------------------------
     # Connectivity
@@ -67,13 +127,20 @@ class GitlabRemote(AbstractRemote):
     # Repositories
     # ------------------------------------------------------------------
     def check_repository_exists(self, name: str, namespace: str) -> bool:
+        project = self._get_prefetched_project(namespace, name)
+        if project is not None:
+            return bool(project)
+
         response = self.make_request(
             endpoint=self._project_endpoint(namespace, name),
             call_origin=__file__,
             expected_status_codes=[200, 404],
             fatal_if_unexpected=True,
         )
-        return response.status_code == 200
+        if response.status_code == 200:
+            self._remember_project_ids(response.json())
+            return True
+        return False
 
     # ------------------------------------------------------------------
     # Merge proposals (GitLab: merge requests)
@@ -127,6 +194,7 @@ class GitlabRemote(AbstractRemote):
     ) -> dict:
         from wexample_api.enums.http import HttpMethod
 
+        namespace_id = self._get_namespace_id(namespace)
         response = self.make_request(
             method=HttpMethod.POST,
             endpoint="projects",
@@ -136,11 +204,16 @@ class GitlabRemote(AbstractRemote):
                 "description": description,
                 "visibility": "private" if private else "public",
                 "initialize_with_readme": False,
-                "namespace_id": self._get_namespace_id(namespace),
+                "namespace_id": namespace_id,
             },
             call_origin=__file__,
         )
-        return response.json()
+        if response is None or response.status_code != 201:
+            # The cached namespace may be gone or renamed: look it up next time.
+            self._forget_namespace_id(namespace)
+        project = response.json()
+        self._index_project(project)
+        return project
 
     def create_repository_if_not_exists(
         self, remote_url: str, description: str = "", private: bool = False
@@ -155,41 +228,27 @@ class GitlabRemote(AbstractRemote):
             )
         return {}
 
-    def get_branch_pipelines(
-        self,
-        namespace: str,
-        name: str,
-        branch: str,
-    ) -> list[dict[str, Any]]:
-        project = self._project_endpoint(namespace, name)
-        response = self.make_request(
-            endpoint=f"{project}/pipelines",
-            call_origin=__file__,
-            expected_status_codes=[200],
-            query_params={
-                "ref": branch,
-                "order_by": "id",
-                "sort": "desc",
-                "per_page": 5,
-            },
-            quiet=True,
-        )
-        return response.json() if response else []
-
     # ------------------------------------------------------------------
     # CI/CD variables
     # ------------------------------------------------------------------
     def get_ci_variable(self, namespace: str, name: str, key: str) -> dict | None:
-        project = self._project_endpoint(namespace, name)
-        response = self.make_request(
-            endpoint=f"{project}/variables/{key}",
-            call_origin=__file__,
-            expected_status_codes=[200, 404],
-            fatal_if_unexpected=False,
-        )
-        if response and response.status_code == 200:
-            return response.json()
-        return None
+        return self._get_variable(self._project_endpoint(namespace, name), key)
+
+    def get_default_branch(self, namespace: str, name: str) -> str | None:
+        project = self._get_prefetched_project(namespace, name)
+        if project is None:
+            response = self.make_request(
+                endpoint=self._project_endpoint(namespace, name),
+                call_origin=__file__,
+                expected_status_codes=[200, 404],
+                fatal_if_unexpected=False,
+                quiet=True,
+            )
+            project = (
+                response.json() if response and response.status_code == 200 else {}
+            )
+            self._remember_project_ids(project)
+        return project.get("default_branch") if project else None
 
     def get_merge_proposal_pipelines(
         self,
@@ -198,12 +257,13 @@ class GitlabRemote(AbstractRemote):
         proposal_id: int,
     ) -> list[dict[str, Any]]:
         project = self._project_endpoint(namespace, name)
-        response = self.make_request(
-            endpoint=f"{project}/merge_requests/{proposal_id}/pipelines",
-            call_origin=__file__,
-            expected_status_codes=[200],
+        return list(
+            self.iter_paginated(
+                endpoint=f"{project}/merge_requests/{proposal_id}/pipelines",
+                call_origin=__file__,
+                quiet=False,
+            )
         )
-        return response.json() if response else []
 
     # ------------------------------------------------------------------
     # Pipelines
@@ -223,6 +283,58 @@ class GitlabRemote(AbstractRemote):
         )
         return response.json() if response else {}
 
+    def iter_branch_pipelines(
+        self,
+        namespace: str,
+        name: str,
+        branch: str,
+        per_page: int = 20,
+    ) -> Iterator[dict[str, Any]]:
+        return self.iter_paginated(
+            endpoint=f"{self._project_endpoint(namespace, name)}/pipelines",
+            query_params={"ref": branch, "order_by": "id", "sort": "desc"},
+            per_page=per_page,
+            call_origin=__file__,
+        )
+
+    def list_ci_variables(
+        self, namespace: str, name: str
+    ) -> dict[str, dict[str, Any]] | None:
+        return self._list_variables(self._project_endpoint(namespace, name))
+
+    def list_group_ci_variables(self, group: str) -> dict[str, dict[str, Any]] | None:
+        return self._list_variables(self._group_endpoint(group))
+
+    def make_request(self, endpoint: str, **kwargs: Any) -> requests.Response | None:
+        project_id = self._get_endpoint_project_id(endpoint)
+        if project_id is None or kwargs.get("retries", 0) > 0:
+            return super().make_request(endpoint=endpoint, **kwargs)
+
+        # A cached project ID goes stale when the project is deleted or
+        # recreated: drop it and replay the request against the path. Any
+        # other 404 (a missing variable, pipeline, protected branch) is an
+        # answer about a sub-resource and leaves the ID alone.
+        response = super().make_request(
+            endpoint=endpoint, **self._tolerate_status_code(kwargs, 404)
+        )
+        if response is None or response.status_code != 404:
+            return response
+        if not self._is_project_not_found(endpoint, response):
+            return self._check_expected_status_code(endpoint, response, kwargs)
+
+        base_url = self.get_base_url()
+        project_path = self.id_cache.get_project_path(base_url, project_id)
+        if project_path is None:
+            return self._check_expected_status_code(endpoint, response, kwargs)
+        self.id_cache.invalidate_project(base_url, project_path)
+        namespace, _, name = project_path.rpartition("/")
+        return super().make_request(
+            endpoint=re.sub(
+                r"^projects/\d+", self._project_endpoint(namespace, name), endpoint
+            ),
+            **kwargs,
+        )
+
     def merge_merge_proposal(
         self,
         namespace: str,
@@ -273,34 +385,66 @@ class GitlabRemote(AbstractRemote):
             return {"name": url_parts[-1], "namespace": url_parts[-2]}
         return {"name": url_parts[0], "namespace": ""}
 
-    def set_ci_variable(
-        self, namespace: str, name: str, key: str, value: str, masked: bool = True
-    ) -> bool:
-        from wexample_api.enums.http import HttpMethod
+    def prefetch_group(self, group_path: str, include_subgroups: bool = True) -> int:
+        """Index every project of a group with a few paged requests.
 
-        project = self._project_endpoint(namespace, name)
-        existing = self.get_ci_variable(namespace, name, key)
+        Later existence checks, namespace IDs and default branches for
+        projects under this group are answered from the index, for
+        ``group_prefetch_ttl`` seconds. Returns the number of indexed projects.
+        """
+        import time
 
-        if existing:
-            response = self.make_request(
-                method=HttpMethod.PUT,
-                endpoint=f"{project}/variables/{key}",
-                data={"value": value, "masked": masked, "protected": False},
-                call_origin=__file__,
-                expected_status_codes=[200],
-                fatal_if_unexpected=False,
-            )
-            return response is not None and response.status_code == 200
-        else:
-            response = self.make_request(
-                method=HttpMethod.POST,
-                endpoint=f"{project}/variables",
-                data={"key": key, "value": value, "masked": masked, "protected": False},
-                call_origin=__file__,
-                expected_status_codes=[201],
-                fatal_if_unexpected=False,
+        from wexample_helpers.error.gateway_error import GatewayError
+
+        try:
+            projects = list(
+                self.iter_paginated(
+                    endpoint=f"{self._group_endpoint(group_path)}/projects",
+                    query_params={
+                        "include_subgroups": include_subgroups,
+                        "order_by": "id",
+                        "pagination": "keyset",
+                        "sort": "asc",
+                        "with_shared": False,
+                    },
+                    call_origin=__file__,
+                    raise_exceptions=True,
+                )
             )
-            return response is not None and response.status_code == 201
+        except GatewayError:
+            # Not a group (e.g. a user namespace) or unreachable: leave it
+            # unindexed so lookups go to the API, without listing it again.
+            with self._prefetch_lock:
+                self._unindexable_namespaces[group_path] = time.monotonic()
+            return 0
+
+        with self._prefetch_lock:
+            # Projects deleted since an earlier listing must not linger.
+            for path, project in list(self._project_index.items()):
+                project_namespace = (project.get("namespace") or {}).get("full_path")
+                if project_namespace == group_path or (
+                    include_subgroups and path.startswith(f"{group_path}/")
+                ):
+                    del self._project_index[path]
+            for project in projects:
+                self._index_project(project)
+            self._prefetched_groups[group_path] = (include_subgroups, time.monotonic())
+            self._unindexable_namespaces.pop(group_path, None)
+
+        return len(projects)
+
+    def set_ci_variable(
+        self,
+        namespace: str,
+        name: str,
+        key: str,
+        value: str,
+        masked: bool = True,
+        exists: bool | None = None,
+    ) -> bool:
+        return self._set_variable(
+            self._project_endpoint(namespace, name), key, value, masked, exists
+        )
 
     def set_default_branch(self, namespace: str, name: str, branch_name: str) -> bool:
         from wexample_api.enums.http import HttpMethod
@@ -316,6 +460,19 @@ class GitlabRemote(AbstractRemote):
         )
         return response is not None and response.status_code == 200
 
+    def set_group_ci_variable(
+        self,
+        group: str,
+        key: str,
+        value: str,
+        masked: bool = True,
+        exists: bool | None = None,
+    ) -> bool:
+        """Group variables are inherited by every project below the group."""
+        return self._set_variable(
+            self._group_endpoint(group), key, value, masked, exists
+        )
+
     # ------------------------------------------------------------------
     # Branch protection
     # ------------------------------------------------------------------
@@ -332,6 +489,43 @@ class GitlabRemote(AbstractRemote):
         )
         return response is not None and response.status_code in (204, 404)
 
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _ensure_group_prefetched(self, namespace: str) -> None:
+        if not self.group_prefetch or self._is_group_prefetched(namespace):
+            return
+        failed_at = self._unindexable_namespaces.get(namespace)
+        if failed_at is None or self._is_expired(failed_at):
+            self.prefetch_group(namespace)
+
+    def _find_namespace_id(self, namespace_path: str) -> int | None:
+        self._ensure_group_prefetched(namespace_path)
+        for project in list(self._project_index.values()):
+            project_namespace = project.get("namespace") or {}
+            if project_namespace.get("full_path") == namespace_path:
+                return project_namespace.get("id")
+
+        # Stop at the first match instead of reading every search page.
+        for ns in self.iter_paginated(
+            endpoint="namespaces",
+            query_params={"search": namespace_path},
+            call_origin=__file__,
+        ):
+            if namespace_path in (ns.get("full_path"), ns.get("path")):
+                return ns["id"]
+        return None
+
+    def _forget_namespace_id(self, namespace_path: str) -> None:
+        if self.id_cache is not None:
+            self.id_cache.invalidate_namespace(self.get_base_url(), namespace_path)
+
+    def _get_endpoint_project_id(self, endpoint: str) -> int | None:
+        if self.id_cache is None:
+            return None
+        match = re.match(r"projects/(\d+)(?:/|$)", endpoint)
+        return int(match.group(1)) if match else None
+
     def _get_merge_proposal_state(
         self, project: str, proposal_id: int
     ) -> dict[str, Any]:
@@ -347,27 +541,159 @@ class GitlabRemote(AbstractRemote):
         return response.json() if response else {}
 
     def _get_namespace_id(self, namespace_path: str) -> int | None:
+        if self.id_cache is not None:
+            namespace_id = self.id_cache.get_namespace_id(
+                self.get_base_url(), namespace_path
+            )
+            if namespace_id is not None:
+                return namespace_id
+
+        namespace_id = self._find_namespace_id(namespace_path)
+        if namespace_id is not None and self.id_cache is not None:
+            self.id_cache.set_namespace_id(
+                self.get_base_url(), namespace_path, namespace_id
+            )
+        return namespace_id
+
+    def _get_prefetched_project(
+        self, namespace: str, name: str
+    ) -> dict[str, Any] | None:
+        """Return the indexed project, ``{}`` if its group is indexed but it is
+        absent, or None when the index cannot answer."""
+        self._ensure_group_prefetched(namespace)
+        if not self._is_group_prefetched(namespace):
+            return None
+        return self._project_index.get(f"{namespace}/{name}", {})
+
+    def _get_variable(self, owner: str, key: str) -> dict | None:
         response = self.make_request(
-            endpoint="namespaces",
-            query_params={"search": namespace_path},
+            endpoint=f"{owner}/variables/{key}",
             call_origin=__file__,
-            expected_status_codes=[200],
+            expected_status_codes=[200, 404],
             fatal_if_unexpected=False,
-            quiet=True,
         )
-        if response is None or response.status_code != 200:
-            return None
-        for ns in response.json():
-            if ns["path"] == namespace_path:
-                return ns["id"]
+        if response and response.status_code == 200:
+            return response.json()
         return None
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
+    def _group_endpoint(self, group: str) -> str:
+        from urllib.parse import quote
+
+        return f"groups/{quote(group, safe='')}"
+
+    def _index_project(self, project: dict[str, Any]) -> None:
+        path = project.get("path_with_namespace")
+        if path:
+            self._project_index[path] = project
+        self._remember_project_ids(project)
+
+    def _is_expired(self, indexed_at: float) -> bool:
+        import time
+
+        return time.monotonic() - indexed_at >= self.group_prefetch_ttl
+
+    def _is_group_prefetched(self, namespace: str) -> bool:
+        return any(
+            (
+                namespace == group
+                or (include_subgroups and namespace.startswith(f"{group}/"))
+            )
+            and not self._is_expired(indexed_at)
+            for group, (include_subgroups, indexed_at) in list(
+                self._prefetched_groups.items()
+            )
+        )
+
+    def _is_project_not_found(self, endpoint: str, response: requests.Response) -> bool:
+        if re.fullmatch(r"projects/\d+/?", endpoint):
+            return True
+        try:
+            body = response.json()
+        except ValueError:
+            return False
+        return isinstance(body, dict) and body.get("message") == "404 Project Not Found"
+
+    def _list_variables(self, owner: str) -> dict[str, dict[str, Any]] | None:
+        """List the variables of a project or group endpoint, by key."""
+        from wexample_helpers.error.gateway_error import GatewayError
+
+        variables: dict[str, dict[str, Any]] = {}
+        try:
+            for variable in self.iter_paginated(
+                endpoint=f"{owner}/variables",
+                call_origin=__file__,
+                raise_exceptions=True,
+            ):
+                # A key may be defined once per environment scope; the
+                # catch-all scope is the one _set_variable manages.
+                if (
+                    variable["key"] not in variables
+                    or variable.get("environment_scope", "*") == "*"
+                ):
+                    variables[variable["key"]] = variable
+        except GatewayError:
+            # Unreadable listing (e.g. missing permission): callers fall back
+            # to per-variable lookups rather than assume nothing exists.
+            return None
+        return variables
+
     def _project_endpoint(self, namespace: str, name: str) -> str:
+        if self.id_cache is not None:
+            project_id = self.id_cache.get_project_id(
+                self.get_base_url(), f"{namespace}/{name}"
+            )
+            if project_id is not None:
+                return f"projects/{project_id}"
         return f"projects/{namespace}%2F{name}"
 
+    def _remember_project_ids(self, project: dict[str, Any]) -> None:
+        """Keep the numeric IDs of a project (and its namespace) returned by the API."""
+        if self.id_cache is None or not isinstance(project, dict):
+            return
+        base_url = self.get_base_url()
+        path = project.get("path_with_namespace")
+        if path and isinstance(project.get("id"), int):
+            self.id_cache.set_project_id(base_url, path, project["id"])
+        namespace = project.get("namespace") or {}
+        if namespace.get("full_path") and isinstance(namespace.get("id"), int):
+            self.id_cache.set_namespace_id(
+                base_url, namespace["full_path"], namespace["id"]
+            )
+
+    def _set_variable(
+        self,
+        owner: str,
+        key: str,
+        value: str,
+        masked: bool,
+        exists: bool | None,
+    ) -> bool:
+        from wexample_api.enums.http import HttpMethod
+
+        if exists is None:
+            exists = self._get_variable(owner, key) is not None
+
+        if exists:
+            response = self.make_request(
+                method=HttpMethod.PUT,
+                endpoint=f"{owner}/variables/{key}",
+                data={"value": value, "masked": masked, "protected": False},
+                call_origin=__file__,
+                expected_status_codes=[200],
+                fatal_if_unexpected=False,
+            )
+            return response is not None and response.status_code == 200
+        else:
+            response = self.make_request(
+                method=HttpMethod.POST,
+                endpoint=f"{owner}/variables",
+                data={"key": key, "value": value, "masked": masked, "protected": False},
+                call_origin=__file__,
+                expected_status_codes=[201],
+                fatal_if_unexpected=False,
+            )
+            return response is not None and response.status_code == 201
+
     def _wait_for_mergeable(
         self,
         project: str,
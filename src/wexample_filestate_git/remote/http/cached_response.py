@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import base64
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    import requests
+
+
+@base_class
+class CachedResponse(BaseClass):
+    """A response body kept alongside the validators needed to revalidate it."""
+
+    content: bytes = public_field(description="Raw response body")
+    etag: str | None = public_field(default=None, description="ETag validator")
+    headers: dict[str, str] = public_field(
+        factory=dict, description="Response headers at the time it was stored"
+    )
+    last_modified: str | None = public_field(
+        default=None, description="Last-Modified validator"
+    )
+    status_code: int = public_field(default=200, description="Original status code")
+    url: str = public_field(default="", description="Request URL")
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CachedResponse:
+        return cls(
+            content=base64.b64decode(data["content"]),
+            etag=data.get("etag"),
+            headers=data.get("headers") or {},
+            last_modified=data.get("last_modified"),
+            status_code=data.get("status_code", 200),
+            url=data.get("url", ""),
+        )
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> CachedResponse | None:
+        """Capture a response, or return None if it carries no validator."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return None
+
+        return cls(
+            content=response.content,
+            etag=etag,
+            headers=dict(response.headers),
+            last_modified=last_modified,
+            status_code=response.status_code,
+            url=response.url or "",
+        )
+
+    def get_validator_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "content": base64.b64encode(self.content).decode("ascii"),
+            "etag": self.etag,
+            "headers": self.headers,
+            "last_modified": self.last_modified,
+            "status_code": self.status_code,
+            "url": self.url,
+        }
+
+    def to_response(self) -> requests.Response:
+        """Rebuild a response object equivalent to the one originally stored."""
+        import requests
+        from requests.structures import CaseInsensitiveDict
+
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.url = self.url
+        response.encoding = "utf-8"
+        response._content = self.content
+        return response
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    import requests
+
+    from wexample_filestate_git.exception.remote_unavailable_exception import (
+        RemoteUnavailableException,
+    )
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_HALF_OPEN = "half_open"
+CIRCUIT_OPEN = "open"
+
+
+@base_class
+class CircuitBreaker(BaseClass):
+    """Stops sending requests to an API host that keeps failing.
+
+    After ``failure_threshold`` consecutive connection failures or 5xx
+    responses the circuit opens: requests raise ``RemoteUnavailableException``
+    at once instead of waiting out timeouts and retries. Once
+    ``reset_timeout`` has elapsed, a single caller runs a probe request
+    (half-open) while the others keep failing fast; any answer from the host
+    closes the circuit, no answer opens it again. One breaker exists per host
+    and is shared by every remote and thread talking to it, so other hosts are
+    never slowed down.
+    """
+
+    failure_threshold: int = public_field(
+        default=5, description="Consecutive failures after which the circuit opens"
+    )
+    host: str = public_field(description="API host this breaker watches")
+    reset_timeout: float = public_field(
+        default=30.0, description="Seconds the circuit stays open before a probe"
+    )
+    _failures: int = private_field(
+        default=0, description="Consecutive failures since the last success"
+    )
+    _lock: threading.Lock = private_field(
+        factory=threading.Lock, description="Guards the circuit state"
+    )
+    _opened_at: float = private_field(
+        default=0.0, description="Monotonic time at which the circuit last opened"
+    )
+    _probe_thread: int | None = private_field(
+        default=None, description="Thread running the half-open probe"
+    )
+    _state: str = private_field(
+        default=CIRCUIT_CLOSED, description="closed, open or half_open"
+    )
+
+    _defaults: ClassVar[dict[str, Any]] = {}
+    _instances: ClassVar[dict[str, CircuitBreaker]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def configure(
+        cls,
+        failure_threshold: int | None = None,
+        reset_timeout: float | None = None,
+    ) -> None:
+        """Change the settings of breakers created afterwards."""
+        options = {
+            "failure_threshold": failure_threshold,
+            "reset_timeout": reset_timeout,
+        }
+        with cls._instances_lock:
+            cls._defaults.update(
+                {key: value for key, value in options.items() if value is not None}
+            )
+            cls._instances.clear()
+
+    @classmethod
+    def get_for_host(cls, host: str) -> CircuitBreaker:
+        with cls._instances_lock:
+            breaker = cls._instances.get(host)
+            if breaker is None:
+                breaker = cls(host=host, **cls._defaults)
+                cls._instances[host] = breaker
+            return breaker
+
+    @classmethod
+    def reset_all(cls) -> None:
+        with cls._instances_lock:
+            cls._instances.clear()
+
+    @staticmethod
+    def is_failure_response(response: requests.Response | None) -> bool:
+        """No answer at all, or a server-side error."""
+        return response is None or response.status_code in range(500, 600)
+
+    def allow_request(self, probe: Callable[[], Any]) -> None:
+        """Return if a request may be sent, raise ``RemoteUnavailableException``
+        otherwise. When the circuit is due for a check, the calling thread
+        runs ``probe`` first; its own requests are let through."""
+        thread = threading.get_ident()
+        with self._lock:
+            if self._state == CIRCUIT_CLOSED or self._probe_thread == thread:
+                return
+            now = time.monotonic()
+            if self._state == CIRCUIT_HALF_OPEN or now < self._get_retry_at():
+                raise self._create_exception(now)
+            self._state = CIRCUIT_HALF_OPEN
+            self._probe_thread = thread
+
+        try:
+            probe()
+        finally:
+            with self._lock:
+                self._probe_thread = None
+                if self._state == CIRCUIT_HALF_OPEN:
+                    # The probe did not reach the host.
+                    self._open(time.monotonic())
+                state = self._state
+
+        if state != CIRCUIT_CLOSED:
+            raise self._create_exception(time.monotonic())
+
+    def get_state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == CIRCUIT_HALF_OPEN:
+                # Only the probe decides; older requests failing prove nothing new.
+                if self._probe_thread == threading.get_ident():
+                    self._open(time.monotonic())
+                return
+            self._failures += 1
+            if self._state == CIRCUIT_CLOSED and (
+                self._failures >= self.failure_threshold
+            ):
+                self._open(time.monotonic())
+
+    def record_response(self, response: requests.Response | None) -> None:
+        if self.is_failure_response(response):
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._state = CIRCUIT_CLOSED
+
+    def _create_exception(self, now: float) -> RemoteUnavailableException:
+        from wexample_filestate_git.exception.remote_unavailable_exception import (
+            RemoteUnavailableException,
+        )
+
+        return RemoteUnavailableException(
+            failures=self._failures,
+            host=self.host,
+            retry_in=max(self._get_retry_at() - now, 0.0),
+        )
+
+    def _get_retry_at(self) -> float:
+        return self._opened_at + self.reset_timeout
+
+    def _open(self, now: float) -> None:
+        self._opened_at = now
+        self._state = CIRCUIT_OPEN
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import requests
+    from wexample_api.common.abstract_gateway import AbstractGateway
+
+# Name of the transport hook gateways implement: ``make_request`` hands it
+# the keyword arguments of ``requests.request`` once the request is built.
+SEND_HOOK_NAME = "_send_http_request"
+
+_gateway: ContextVar[AbstractGateway | None] = ContextVar(
+    "gateway_transport_gateway", default=None
+)
+
+
+class GatewayTransport:
+    """Sends the requests of ``AbstractGateway`` through its transport hook.
+
+    Remotes implement ``_send_http_request`` to use their pooled client.
+    Releases of wexample-api whose ``make_request`` calls that hook need
+    nothing more, and ``use`` does nothing. Older releases send with the
+    module-level ``requests.request``: for them, the gateway module's
+    ``requests`` name is replaced, once, by this proxy, which forwards every
+    attribute to the real module except ``request``, sent through the hook
+    of the gateway bound with ``use`` in the current context (thread or
+    task). Installing it checks that the module still sends that way and
+    raises otherwise, so pooling cannot be lost silently.
+    """
+
+    _installed: bool = False
+    _lock = threading.Lock()
+
+    def __init__(self, module: ModuleType) -> None:
+        self._module = module
+
+    @classmethod
+    def install(cls) -> None:
+        import requests
+        import wexample_api.common.abstract_gateway as gateway_module
+
+        with cls._lock:
+            if cls._installed:
+                return
+            # No code object when make_request is replaced (e.g. mocked).
+            make_request_code = getattr(
+                gateway_module.AbstractGateway.make_request, "__code__", None
+            )
+            if (
+                gateway_module.__dict__.get("requests") is not requests
+                or "request" in gateway_module.__dict__
+                or (
+                    make_request_code is not None
+                    and "request" not in make_request_code.co_names
+                )
+            ):
+                raise RuntimeError(
+                    "wexample_api.common.abstract_gateway neither calls "
+                    f"{SEND_HOOK_NAME} nor sends with requests.request: "
+                    "GatewayTransport cannot route its requests"
+                )
+            gateway_module.requests = cls(requests)
+            cls._installed = True
+
+    @classmethod
+    def is_hook_native(cls) -> bool:
+        """Whether ``AbstractGateway.make_request`` calls the hook itself."""
+        from wexample_api.common.abstract_gateway import AbstractGateway
+
+        return SEND_HOOK_NAME in vars(AbstractGateway)
+
+    @classmethod
+    @contextmanager
+    def use(cls, gateway: AbstractGateway) -> Iterator[None]:
+        """Send the requests ``gateway`` makes in this context through its hook."""
+        if cls.is_hook_native():
+            yield
+            return
+        cls.install()
+        token = _gateway.set(gateway)
+        try:
+            yield
+        finally:
+            _gateway.reset(token)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._module, name)
+
+    def request(self, **request_kwargs: Any) -> requests.Response:
+        gateway = _gateway.get()
+        if gateway is None:
+            return self._module.request(**request_kwargs)
+        return getattr(gateway, SEND_HOOK_NAME)(**request_kwargs)
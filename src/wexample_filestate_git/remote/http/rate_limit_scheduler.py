@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    import requests
+
+
+@base_class
+class RateLimitScheduler(BaseClass):
+    """Paces requests to one API host from the budget it advertises.
+
+    The bucket holds the ``remaining`` requests of the current window and is
+    refilled to ``limit`` at ``reset_at``; both are learned from the
+    ``X-RateLimit-*`` (GitHub) / ``RateLimit-*`` (GitLab) response headers.
+    Requests go out freely while the budget is comfortable, are spread over
+    the rest of the window once it drops under ``reserve_ratio``, and wait for
+    the reset (or ``Retry-After``) once it is exhausted. One scheduler exists
+    per host and is shared by every remote and thread talking to it.
+    """
+
+    host: str = public_field(
+        description="API host (and rate limit resource) this scheduler paces"
+    )
+    reserve_ratio: float = public_field(
+        default=0.05,
+        description="Fraction of the window budget below which requests are spread until the reset",
+    )
+    _blocked_until: float = private_field(
+        default=0.0, description="Wall-clock time before which nothing may be sent"
+    )
+    _last_sent_at: float = private_field(
+        default=0.0, description="Wall-clock time of the last paced request"
+    )
+    _limit: int | None = private_field(
+        default=None, description="Window budget advertised by the host"
+    )
+    _lock: threading.Lock = private_field(
+        factory=threading.Lock, description="Guards the bucket state"
+    )
+    _remaining: int | None = private_field(
+        default=None, description="Requests left in the current window"
+    )
+    _reset_at: float | None = private_field(
+        default=None, description="Wall-clock time at which the window refills"
+    )
+
+    _instances: ClassVar[dict[str, RateLimitScheduler]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def get_for_host(cls, host: str) -> RateLimitScheduler:
+        with cls._instances_lock:
+            scheduler = cls._instances.get(host)
+            if scheduler is None:
+                scheduler = cls(host=host)
+                cls._instances[host] = scheduler
+            return scheduler
+
+    @classmethod
+    def reset_all(cls) -> None:
+        with cls._instances_lock:
+            cls._instances.clear()
+
+    @staticmethod
+    def _parse_retry_after(value: str | None, now: float) -> float | None:
+        """Return the wall-clock time a ``Retry-After`` header points to."""
+        if not value:
+            return None
+        try:
+            return now + float(value)
+        except (TypeError, ValueError):
+            pass
+        try:
+            from email.utils import parsedate_to_datetime
+
+            return parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            return None
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; returns the number of seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.time()
+                delay = self._get_delay(now)
+                if delay <= 0:
+                    self._last_sent_at = now
+                    if self._remaining is not None:
+                        self._remaining -= 1
+                    return waited
+            time.sleep(delay)
+            waited += delay
+
+    def get_budget(self) -> dict[str, Any]:
+        """Snapshot of what is known about the host's budget, for planning bulk runs."""
+        with self._lock:
+            self._refill(time.time())
+            return {
+                "host": self.host,
+                "limit": self._limit,
+                "remaining": self._remaining,
+                "reset_at": self._reset_at,
+                "blocked_until": self._blocked_until or None,
+            }
+
+    def get_remaining(self) -> int | None:
+        """Requests left in the current window, or None while nothing is known."""
+        return self.get_budget()["remaining"]
+
+    def is_rate_limited_response(self, response: requests.Response) -> bool:
+        if response.status_code == 429:
+            return True
+        # GitHub reports an exhausted primary budget as a 403.
+        return response.status_code == 403 and (
+            self._get_header(response, "RateLimit-Remaining") == "0"
+            or "Retry-After" in response.headers
+        )
+
+    def update_from_response(self, response: requests.Response) -> None:
+        """Learn the budget from the response headers."""
+        now = time.time()
+        limit = self._get_int_header(response, "RateLimit-Limit")
+        remaining = self._get_int_header(response, "RateLimit-Remaining")
+        reset_at = self._get_int_header(response, "RateLimit-Reset")
+        retry_at = self._parse_retry_after(response.headers.get("Retry-After"), now)
+
+        with self._lock:
+            if limit is not None:
+                self._limit = limit
+            if remaining is not None:
+                # Responses to concurrent requests may arrive out of order;
+                # within a window the smallest value is the freshest one.
+                same_window = reset_at is None or reset_at == self._reset_at
+                if self._remaining is None or not same_window:
+                    self._remaining = remaining
+                else:
+                    self._remaining = min(self._remaining, remaining)
+            if reset_at is not None:
+                self._reset_at = float(reset_at)
+
+            if retry_at is not None:
+                self._blocked_until = max(self._blocked_until, retry_at)
+            elif self.is_rate_limited_response(response):
+                # Rate limited without a hint: wait for the window reset, or
+                # back off for a minute when even that is unknown.
+                self._blocked_until = max(
+                    self._blocked_until, self._reset_at or now + 60
+                )
+
+    def _get_delay(self, now: float) -> float:
+        if self._blocked_until > now:
+            return self._blocked_until - now
+
+        self._refill(now)
+        if self._remaining is None or self._reset_at is None:
+            return 0.0
+
+        if self._remaining <= 0:
+            return max(self._reset_at - now, 0.0) or 0.1
+
+        reserve = max(1, int((self._limit or self._remaining) * self.reserve_ratio))
+        if self._remaining > reserve:
+            return 0.0
+
+        # Low budget: spread what is left over the rest of the window.
+        interval = max(self._reset_at - now, 0.0) / self._remaining
+        return max(self._last_sent_at + interval - now, 0.0)
+
+    def _get_header(self, response: requests.Response, name: str) -> str | None:
+        headers = response.headers
+        return headers.get(f"X-{name}") or headers.get(name)
+
+    def _get_int_header(self, response: requests.Response, name: str) -> int | None:
+        value = self._get_header(response, name)
+        try:
+            return int(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def _refill(self, now: float) -> None:
+        if self._reset_at is not None and now >= self._reset_at:
+            self._remaining = self._limit
+            self._reset_at = None
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+# Methods safe to send again when a connection drops after the request went out.
+_REPLAYABLE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@base_class
+class RemoteHttpClient(BaseClass):
+    """Keep-alive HTTP transport shared by remote API clients.
+
+    Wraps a single ``requests.Session`` so TCP/TLS connections are reused
+    across requests instead of being negotiated again for every call.
+    Connection pools are sized per host: ``per_host_maxsize`` overrides
+    ``pool_maxsize`` for the listed hostnames.
+
+    Hosts listed in ``http2_hosts`` are reached through httpx over HTTP/2
+    when it is installed (``wexample-filestate-git[http2]``), so concurrent
+    requests share one multiplexed connection. HTTPS hosts negotiate the
+    protocol and may still answer over HTTP/1.1; plain HTTP hosts are spoken
+    to in HTTP/2 directly, and fall back to the pooled session for good if
+    they refuse the connection preface before ever answering over HTTP/2.
+    A connection lost later (e.g. on GOAWAY) is a transport error: only
+    GET, HEAD and OPTIONS are sent again, once. Responses are returned as
+    ``requests.Response`` either way.
+    """
+
+    http2_hosts: set[str] = public_field(
+        factory=set,
+        description="Hostnames to reach over HTTP/2; '*' selects every host",
+    )
+
+    per_host_maxsize: dict[str, int] = public_field(
+        factory=dict,
+        description="Maximum number of kept-alive connections for specific hosts",
+    )
+    pool_block: bool = public_field(
+        default=True,
+        description="Wait for a free pooled connection instead of opening a throwaway one",
+    )
+    pool_connections: int = public_field(
+        default=10,
+        description="Number of per-host connection pools kept in memory",
+    )
+    pool_maxsize: int = public_field(
+        default=10,
+        description="Default maximum number of kept-alive connections per host",
+    )
+    _http1_hosts: set[str] = private_field(
+        factory=set, description="Selected hosts that turned out not to speak HTTP/2"
+    )
+    _http2_confirmed_hosts: set[str] = private_field(
+        factory=set, description="Hosts which answered at least once through httpx"
+    )
+    _http2_clients: dict[str, httpx.Client] = private_field(
+        factory=dict, description="HTTP/2 clients by URL scheme, created on first use"
+    )
+    _lock: threading.Lock = private_field(
+        factory=threading.Lock,
+        description="Guards the lazy session and client creation",
+    )
+    _session: requests.Session | None = private_field(
+        default=None,
+        description="Underlying pooled session, created on first use",
+    )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            for client in self._http2_clients.values():
+                client.close()
+            self._http2_clients.clear()
+
+    def get_session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    def is_http2_host(self, host: str | None) -> bool:
+        """Whether requests to ``host`` go through the HTTP/2 transport."""
+        from importlib.util import find_spec
+
+        if not host or host in self._http1_hosts:
+            return False
+        if host not in self.http2_hosts and "*" not in self.http2_hosts:
+            return False
+        return find_spec("httpx") is not None and find_spec("h2") is not None
+
+    def request(self, **request_kwargs: Any) -> requests.Response:
+        """Send a request; accepts the same arguments as ``requests.request``."""
+        from urllib.parse import urlsplit
+
+        host = urlsplit(request_kwargs["url"]).hostname
+        if self.is_http2_host(host):
+            response = self._request_http2(host, **request_kwargs)
+            if response is not None:
+                return response
+        return self.get_session().request(**request_kwargs)
+
+    def _create_adapter(self, maxsize: int):
+        from requests.adapters import HTTPAdapter
+
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=maxsize,
+            pool_block=self.pool_block,
+        )
+
+    def _create_http2_client(self, scheme: str) -> httpx.Client:
+        import httpx
+
+        return httpx.Client(
+            http2=True,
+            # No TLS negotiation on plain HTTP: HTTP/2 is spoken directly.
+            http1=scheme == "https",
+            limits=httpx.Limits(
+                max_connections=self.pool_maxsize,
+                max_keepalive_connections=self.pool_maxsize,
+            ),
+        )
+
+    def _create_session(self) -> requests.Session:
+        import requests
+
+        session = requests.Session()
+        session.mount("https://", self._create_adapter(self.pool_maxsize))
+        session.mount("http://", self._create_adapter(self.pool_maxsize))
+
+        # Longest prefix wins in requests, so host-specific adapters take
+        # precedence over the scheme-wide defaults mounted above.
+        for host, maxsize in self.per_host_maxsize.items():
+            adapter = self._create_adapter(maxsize)
+            session.mount(f"https://{host}/", adapter)
+            session.mount(f"http://{host}/", adapter)
+
+        return session
+
+    def _get_http2_client(self, scheme: str) -> httpx.Client:
+        with self._lock:
+            if scheme not in self._http2_clients:
+                self._http2_clients[scheme] = self._create_http2_client(scheme)
+            return self._http2_clients[scheme]
+
+    def _request_http2(
+        self, host: str, **request_kwargs: Any
+    ) -> requests.Response | None:
+        """Send through httpx; None when the host must fall back to HTTP/1.1."""
+        from urllib.parse import urlsplit
+
+        import httpx
+        import requests
+
+        data = request_kwargs.get("data")
+        params = request_kwargs.get("params") or {}
+        scheme = urlsplit(request_kwargs["url"]).scheme
+        client = self._get_http2_client(scheme)
+        for attempt in range(2):
+            try:
+                response = client.request(
+                    method=request_kwargs["method"],
+                    url=request_kwargs["url"],
+                    # requests drops None parameters; httpx would send them empty.
+                    params={k: v for k, v in params.items() if v is not None},
+                    headers=request_kwargs.get("headers"),
+                    json=request_kwargs.get("json"),
+                    content=data if isinstance(data, (bytes, str)) else None,
+                    data=data if isinstance(data, dict) else None,
+                    files=request_kwargs.get("files"),
+                    timeout=request_kwargs.get("timeout"),
+                )
+            except httpx.RemoteProtocolError as exc:
+                with self._lock:
+                    confirmed = host in self._http2_confirmed_hosts
+                    if scheme == "http" and not confirmed:
+                        # The prior knowledge preface was refused: not an
+                        # HTTP/2 server, use the HTTP/1.1 session from now on.
+                        self._http1_hosts.add(host)
+                        return None
+                # The request may have reached the server: only replay it
+                # when running it twice is harmless.
+                method = request_kwargs["method"].upper()
+                if attempt == 0 and method in _REPLAYABLE_METHODS:
+                    continue
+                raise requests.exceptions.ConnectionError(str(exc)) from exc
+            except httpx.TimeoutException as exc:
+                raise requests.exceptions.Timeout(str(exc)) from exc
+            except httpx.HTTPError as exc:
+                raise requests.exceptions.ConnectionError(str(exc)) from exc
+
+            with self._lock:
+                self._http2_confirmed_hosts.add(host)
+            return self._to_requests_response(response)
+
+    def _to_requests_response(self, response: httpx.Response) -> requests.Response:
+        import requests
+        from requests.structures import CaseInsensitiveDict
+
+        converted = requests.Response()
+        converted.status_code = response.status_code
+        converted.headers = CaseInsensitiveDict(response.headers)
+        converted.url = str(response.url)
+        converted.reason = response.reason_phrase
+        converted.encoding = response.encoding
+        converted._content = response.content
+        return converted
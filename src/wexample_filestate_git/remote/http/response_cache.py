@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    import requests
+
+    from wexample_filestate_git.remote.http.cached_response import CachedResponse
+
+
+@base_class
+class ResponseCache(BaseClass):
+    """Validator-based cache for remote GET responses.
+
+    Stores ETag / Last-Modified per request so the next identical GET can be
+    sent as a conditional request; a ``304 Not Modified`` is then answered
+    from the stored body. Entries live in memory (bounded, least recently used
+    evicted first) and, when ``directory`` is set, are mirrored on disk so
+    they survive between runs.
+    """
+
+    directory: Path | None = public_field(
+        default=None,
+        description="Optional directory where entries are persisted between runs",
+    )
+    max_entries: int = public_field(
+        default=2048, description="Maximum number of entries kept in memory"
+    )
+    _entries: OrderedDict[str, CachedResponse] = private_field(
+        factory=OrderedDict, description="In-memory entries, oldest first"
+    )
+    _lock: threading.Lock = private_field(
+        factory=threading.Lock, description="Guards in-memory entries"
+    )
+
+    @staticmethod
+    def build_key(
+        url: str,
+        query_params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> str:
+        """Hash everything that can change the representation, credentials included."""
+        import hashlib
+        import json
+
+        return hashlib.sha256(
+            json.dumps(
+                [
+                    url,
+                    sorted((str(k), str(v)) for k, v in (query_params or {}).items()),
+                    sorted((k.lower(), str(v)) for k, v in (headers or {}).items()),
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def clear(self) -> None:
+        import shutil
+
+        with self._lock:
+            self._entries.clear()
+        if self.directory is not None and self.directory.exists():
+            shutil.rmtree(self.directory)
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = self._read_from_disk(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        path = self._get_entry_path(key)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def store(
+        self, key: str, response: requests.Response, persist: bool = True
+    ) -> CachedResponse | None:
+        """Keep a response if it carries a validator; ``persist=False`` keeps it in memory only."""
+        from wexample_filestate_git.remote.http.cached_response import (
+            CachedResponse,
+        )
+
+        entry = CachedResponse.from_response(response)
+        if entry is None:
+            return None
+
+        self._remember(key, entry)
+        if persist:
+            self._write_to_disk(key, entry)
+        return entry
+
+    def _get_entry_path(self, key: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return Path(self.directory) / key[:2] / f"{key}.json"
+
+    def _read_from_disk(self, key: str) -> CachedResponse | None:
+        import json
+
+        from wexample_filestate_git.remote.http.cached_response import (
+            CachedResponse,
+        )
+
+        path = self._get_entry_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return CachedResponse.from_dict(json.loads(path.read_text()))
+        except (OSError, ValueError, KeyError):
+            # Corrupted or concurrently replaced entry: behave as a miss.
+            return None
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _write_to_disk(self, key: str, entry: CachedResponse) -> None:
+        import json
+        import os
+        import tempfile
+
+        path = self._get_entry_path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write then rename so concurrent readers never see a partial file.
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as handle:
+                json.dump(entry.to_dict(), handle)
+            os.replace(tmp_path, path)
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
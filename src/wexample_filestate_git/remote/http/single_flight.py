@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class SingleFlight(BaseClass):
+    """Runs concurrent calls sharing a key only once.
+
+    The first caller of a key runs the callback; callers arriving with the
+    same key while it runs wait for it and get the same result (or
+    exception). Nothing is kept once the call completes: later callers run
+    it again, caching is left to the layers below.
+    """
+
+    _calls: dict[str, dict[str, Any]] = private_field(
+        factory=dict, description="Calls in flight by key: done event and outcome"
+    )
+    _lock: threading.Lock = private_field(
+        factory=threading.Lock, description="Guards calls in flight"
+    )
+    _shared_count: int = private_field(
+        default=0, description="Calls answered by another caller's run"
+    )
+
+    def do(self, key: str, callback: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"done": threading.Event(), "error": None, "result": None}
+                self._calls[key] = call
+            else:
+                self._shared_count += 1
+
+        if not leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+
+        try:
+            call["result"] = callback()
+            return call["result"]
+        except BaseException as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+
+    def get_shared_count(self) -> int:
+        """Number of calls that were answered without running the callback."""
+        with self._lock:
+            return self._shared_count
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from wexample_filestate_git.remote.abstract_remote import AbstractRemote
+    from wexample_filestate_git.repo.git_push_batcher import GitPushBatcher
+    from wexample_filestate_git.repo.ref_snapshot import RefSnapshot
 
 
 class WithGitRemoteMixin:
@@ -11,23 +14,24 @@ class WithGitRemoteMixin:
     def _build_remote_instance(
         remote_type, remote_url: str, target
     ) -> AbstractRemote | None:
+        from wexample_filestate_git.remote.remote_registry import RemoteRegistry
+
         api_token = WithGitRemoteMixin._get_api_token(remote_type, target)
 
-        return remote_type(
-            io=target.io,
+        return RemoteRegistry.get_remote(
+            remote_type=remote_type,
             api_token=api_token,
             base_url=remote_type.build_remote_api_url_from_repo(remote_url),
+            io=target.io,
         )
 
     @staticmethod
     def _detect_remote_type(remote_url: str):
-        from wexample_filestate_git.remote.github_remote import GithubRemote
-        from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+        from wexample_filestate_git.remote.remote_type_registry import (
+            RemoteTypeRegistry,
+        )
 
-        for remote_type in [GithubRemote, GitlabRemote]:
-            if remote_type.detect_remote_type(remote_url):
-                return remote_type
-        return None
+        return RemoteTypeRegistry.detect(remote_url)
 
     @staticmethod
     def _get_api_token(remote_type, target) -> str:
@@ -47,3 +51,90 @@ class WithGitRemoteMixin:
             )
 
         return api_token
+
+    def _flush_branch_pushes(self, batcher: GitPushBatcher, remote_name: str) -> None:
+        try:
+            statuses = batcher.flush(remote_name)
+        except Exception as e:
+            self.target.log(message=f"WARNING: {e}")
+            return
+
+        for status in statuses:
+            if status.is_rejected():
+                self.target.log(
+                    message=f"WARNING: could not push {status.describe()} to {remote_name}"
+                )
+
+    def _prepare_branch_deletions(
+        self,
+        remote_name: str,
+        remote_url: str | None,
+        deletions: dict[str, str],
+        before_default_switch: Callable[[str], None] | None = None,
+    ) -> None:
+        """Unprotect aliases (``{alias: canonical}``) and move the default
+        branch away from them, through the API of the host when it has one."""
+        remote_type = self._detect_remote_type(remote_url) if remote_url else None
+        if not remote_type:
+            return
+
+        try:
+            api_remote = self._build_remote_instance(
+                remote_type, remote_url, self.target
+            )
+            repo_info = api_remote.parse_repository_url(remote_url)
+            namespace, name = repo_info["namespace"], repo_info["name"]
+            default_branch = api_remote.get_default_branch(namespace, name)
+        except Exception as e:
+            self.target.log(
+                message=f"WARNING: could not prepare branch deletions on {remote_name}: {e}"
+            )
+            return
+
+        for alias, canonical in deletions.items():
+            try:
+                api_remote.unprotect_branch(namespace, name, alias)
+                if default_branch in (None, alias):
+                    if before_default_switch is not None:
+                        before_default_switch(canonical)
+                    api_remote.set_default_branch(namespace, name, canonical)
+                    default_branch = canonical
+            except Exception as e:
+                self.target.log(
+                    message=f"WARNING: could not prepare '{alias}' for deletion on {remote_name}: {e}"
+                )
+
+    def _push_branch_changes(
+        self,
+        batcher: GitPushBatcher,
+        snapshot: RefSnapshot,
+        remote_name: str,
+        branches: list[str],
+        deletions: dict[str, str],
+    ) -> None:
+        """Push ``branches`` and delete aliases (``{alias: canonical}``) on one
+        remote, as a single atomic push.
+
+        The host refuses to delete its default branch: when an alias is the
+        default, its canonical branch becomes the default first, which requires
+        pushing that branch ahead if the host does not have it yet.
+        """
+        for branch_name in branches:
+            batcher.add_branch(remote_name, branch_name)
+
+        if deletions:
+
+            def before_default_switch(branch_name: str) -> None:
+                if not snapshot.has_remote_head(remote_name, branch_name):
+                    self._flush_branch_pushes(batcher, remote_name)
+
+            self._prepare_branch_deletions(
+                remote_name,
+                next(iter(snapshot.get_remote_urls(remote_name)), None),
+                deletions,
+                before_default_switch,
+            )
+            for alias in deletions:
+                batcher.add_deletion(remote_name, alias)
+
+        self._flush_branch_pushes(batcher, remote_name)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_filestate_git.remote.abstract_remote import AbstractRemote
+    from wexample_filestate_git.remote.pipeline.pipeline_webhook_receiver import (
+        PipelineEventKey,
+    )
+
+
+@base_class
+class PipelineHandle(BaseClass):
+    """One pipeline followed by a ``PipelinePoller``, and what is known about it."""
+
+    error: Exception | None = public_field(
+        default=None, description="Last fetch error, cleared by a successful fetch"
+    )
+    error_count: int = public_field(default=0, description="Consecutive failed fetches")
+    expected_duration: float | None = public_field(
+        default=None,
+        description="Expected total duration in seconds, if known from earlier runs",
+    )
+    finished_at: float | None = public_field(
+        default=None, description="Monotonic time at which a terminal status was seen"
+    )
+    name: str = public_field(description="Repository name")
+    namespace: str = public_field(description="Repository namespace")
+    next_poll_at: float = public_field(
+        default=0.0, description="Monotonic time of the next scheduled fetch"
+    )
+    pipeline: dict[str, Any] = public_field(
+        factory=dict, description="Last pipeline payload returned by the remote"
+    )
+    pipeline_id: int = public_field(description="Pipeline / workflow run ID")
+    polls: int = public_field(default=0, description="Number of fetches so far")
+    remote: AbstractRemote = public_field(description="Remote hosting the pipeline")
+    started_at: float = public_field(
+        default=0.0, description="Monotonic time at which the handle was added"
+    )
+    status: str = public_field(default="", description="Last known status")
+
+    def get_duration(self) -> float | None:
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def get_event_key(self) -> PipelineEventKey:
+        from wexample_filestate_git.remote.pipeline.pipeline_webhook_receiver import (
+            PipelineWebhookReceiver,
+        )
+
+        return PipelineWebhookReceiver.build_event_key(
+            self.remote, self.namespace, self.name, self.pipeline_id
+        )
+
+    def get_repository_key(self) -> str:
+        return f"{self.namespace}/{self.name}"
+
+    def has_failed(self) -> bool:
+        """Whether the poller gave up on this pipeline after repeated fetch errors."""
+        return self.is_done() and self.error is not None
+
+    def is_done(self) -> bool:
+        return self.finished_at is not None
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_filestate_git.remote.abstract_remote import AbstractRemote
+    from wexample_filestate_git.remote.pipeline.pipeline_handle import (
+        PipelineHandle,
+    )
+    from wexample_filestate_git.remote.pipeline.pipeline_webhook_receiver import (
+        PipelineWebhookReceiver,
+    )
+
+
+@base_class
+class PipelinePoller(BaseClass):
+    """Waits on many pipelines at once, from one scheduling loop.
+
+    Each handle gets its own next poll time: a pipeline expected to run for a
+    while is checked again half-way to its expected end, which tightens as
+    the end approaches, while a pipeline with no history, or one overrunning
+    it, is backed off in proportion to how long it has been running.
+    Expectations come from the handle, or from the durations of pipelines
+    already completed (by repository first, then overall). Pipelines due at
+    the same time are fetched concurrently; total wall time follows the
+    slowest pipeline rather than the sum of all of them. A failed fetch
+    (transient gateway error, open circuit breaker) only concerns its own
+    handle: it is retried with an exponential back-off, and the handle is
+    given up (``has_failed``) after ``max_errors`` consecutive failures.
+    """
+
+    backoff_ratio: float = public_field(
+        default=0.1,
+        description="Fraction of the elapsed time used as interval when no expectation applies",
+    )
+    max_errors: int = public_field(
+        default=5,
+        description="Consecutive fetch errors after which a pipeline is given up",
+    )
+    max_interval: float = public_field(
+        default=60.0, description="Longest wait between two fetches of one pipeline"
+    )
+    max_workers: int = public_field(
+        default=8, description="Maximum number of pipelines fetched concurrently"
+    )
+    min_interval: float = public_field(
+        default=2.0, description="Shortest wait between two fetches of one pipeline"
+    )
+    on_complete: Callable[[PipelineHandle], None] | None = public_field(
+        default=None, description="Called with each handle as soon as it completes"
+    )
+    timeout: float = public_field(
+        default=1800.0, description="Seconds to wait for all pipelines to complete"
+    )
+    webhook_receiver: PipelineWebhookReceiver | None = public_field(
+        default=None,
+        description="Pipeline webhook listener; events complete handles without a fetch",
+    )
+    _durations: dict[str, list[float]] = private_field(
+        factory=dict, description="Completed durations, by repository"
+    )
+    _handles: list[PipelineHandle] = private_field(
+        factory=list, description="Every handle added to this poller"
+    )
+
+    def add(
+        self,
+        remote: AbstractRemote,
+        namespace: str,
+        name: str,
+        pipeline_id: int,
+        expected_duration: float | None = None,
+    ) -> PipelineHandle:
+        from wexample_filestate_git.remote.pipeline.pipeline_handle import (
+            PipelineHandle,
+        )
+
+        now = time.monotonic()
+        handle = PipelineHandle(
+            expected_duration=expected_duration,
+            name=name,
+            namespace=namespace,
+            next_poll_at=now,
+            pipeline_id=pipeline_id,
+            remote=remote,
+            started_at=now,
+        )
+        self._handles.append(handle)
+        return handle
+
+    def get_pending(self) -> list[PipelineHandle]:
+        return [handle for handle in self._handles if not handle.is_done()]
+
+    def iter_completed(self) -> Iterator[PipelineHandle]:
+        """Yield handles as their pipelines reach a terminal status."""
+        from wexample_helpers.helper.parallel import parallel_for_each
+
+        deadline = time.monotonic() + self.timeout
+        while pending := self.get_pending():
+            now = time.monotonic()
+            if now >= deadline:
+                raise TimeoutError(
+                    "Pipelines did not complete within "
+                    f"{self.timeout}s: {', '.join(self._describe(h) for h in pending)}"
+                )
+
+            due = [handle for handle in pending if handle.next_poll_at <= now]
+            if not due:
+                next_poll_at = min(handle.next_poll_at for handle in pending)
+                due = self._wait(min(next_poll_at, deadline) - now, pending)
+                if not due:
+                    continue
+            else:
+                parallel_for_each(due, self._poll, max_workers=self.max_workers)
+
+            for handle in due:
+                if handle.is_done():
+                    if not handle.has_failed():
+                        self.record_duration(
+                            handle.get_repository_key(), handle.get_duration()
+                        )
+                    if self.on_complete:
+                        self.on_complete(handle)
+                    yield handle
+
+    def record_duration(self, repository_key: str, duration: float) -> None:
+        """Feed a known duration (e.g. from a previous release) into the estimates."""
+        self._durations.setdefault(repository_key, []).append(duration)
+
+    def wait(self) -> list[PipelineHandle]:
+        """Block until every pipeline completes; returns handles in completion order."""
+        return list(self.iter_completed())
+
+    def _describe(self, handle: PipelineHandle) -> str:
+        return f"{handle.get_repository_key()}#{handle.pipeline_id}"
+
+    def _estimate_duration(self, handle: PipelineHandle) -> float | None:
+        from statistics import median
+
+        if handle.expected_duration is not None:
+            return handle.expected_duration
+        durations = self._durations.get(handle.get_repository_key())
+        if not durations:
+            # Packages released together usually share their CI configuration.
+            durations = [d for values in self._durations.values() for d in values]
+        return median(durations) if durations else None
+
+    def _get_interval(self, handle: PipelineHandle, now: float) -> float:
+        if self.webhook_receiver is not None:
+            # Events drive completion; fetching is only a safety net.
+            return self.max_interval
+        elapsed = now - handle.started_at
+        expected = self._estimate_duration(handle)
+        if expected is not None and elapsed < expected:
+            interval = (expected - elapsed) / 2
+        else:
+            interval = elapsed * self.backoff_ratio
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def _poll(self, handle: PipelineHandle) -> None:
+        import requests
+        from wexample_helpers.error.gateway_error import GatewayError
+
+        from wexample_filestate_git.exception.remote_unavailable_exception import (
+            RemoteUnavailableException,
+        )
+
+        handle.polls += 1
+        # Transport failures only: a bug must not pass for a failed pipeline.
+        try:
+            pipeline = handle.remote.get_pipeline(
+                handle.namespace, handle.name, handle.pipeline_id
+            )
+        except (
+            GatewayError,
+            RemoteUnavailableException,
+            requests.RequestException,
+        ) as e:
+            self._record_error(handle, e)
+            return
+        handle.error = None
+        handle.error_count = 0
+        self._update(handle, pipeline)
+
+    def _record_error(self, handle: PipelineHandle, error: Exception) -> None:
+        now = time.monotonic()
+        handle.error = error
+        handle.error_count += 1
+        if handle.error_count >= self.max_errors:
+            handle.finished_at = now
+            return
+
+        interval = min(self.min_interval * 2**handle.error_count, self.max_interval)
+        # An open circuit breaker tells when the host is worth trying again.
+        retry_in = getattr(error, "retry_in", None)
+        if retry_in is not None:
+            interval = max(interval, retry_in)
+        handle.next_poll_at = now + interval
+
+    def _update(self, handle: PipelineHandle, pipeline: dict | None) -> None:
+        remote = handle.remote
+        now = time.monotonic()
+
+        handle.pipeline = pipeline or {}
+        handle.status = remote.get_pipeline_status(handle.pipeline)
+        if remote.is_pipeline_terminal(handle.pipeline):
+            handle.finished_at = now
+        else:
+            handle.next_poll_at = now + self._get_interval(handle, now)
+
+    def _wait(
+        self, timeout: float, pending: list[PipelineHandle]
+    ) -> list[PipelineHandle]:
+        """Sleep until the next poll, or less if webhook events arrive; returns
+        the handles those events updated."""
+        if self.webhook_receiver is None:
+            time.sleep(timeout)
+            return []
+
+        events = self.webhook_receiver.pop_events(
+            [handle.get_event_key() for handle in pending], timeout
+        )
+        updated = []
+        for handle in pending:
+            pipeline = events.get(handle.get_event_key())
+            if pipeline is not None:
+                self._update(handle, pipeline)
+                updated.append(handle)
+        return updated
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    import asyncio
+    from http.server import ThreadingHTTPServer
+
+    from wexample_filestate_git.remote.abstract_remote import AbstractRemote
+
+# Forge, repository path (lowercase) and pipeline ID: pipeline IDs are only
+# unique within a forge, and GitHub run IDs not even across repositories.
+PipelineEventKey = tuple[str, str, int]
+
+
+@base_class
+class PipelineWebhookReceiver(BaseClass):
+    """Embedded HTTP listener turning pipeline webhooks into wake-ups.
+
+    Accepts GitLab pipeline events and GitHub ``workflow_run`` events on
+    any path, and keeps the latest pipeline payload of each (forge,
+    repository, pipeline ID) until a waiter claims it; waiters only claim the
+    pipelines they wait on. Payloads are stored in the shape ``get_pipeline``
+    returns, so they can be handed to the remote's status helpers as is.
+    Coroutines wait with ``wait_for_pipeline_async``, on their event loop and
+    without a thread.
+    When ``secret`` is set, requests must carry a matching ``X-Gitlab-Token``
+    or ``X-Hub-Signature-256``.
+    """
+
+    host: str = public_field(default="127.0.0.1", description="Interface to bind")
+    max_pending_events: int = public_field(
+        default=1024, description="Unclaimed events kept before the oldest are dropped"
+    )
+    port: int = public_field(
+        default=0, description="Port to bind; 0 picks a free one (see get_url)"
+    )
+    secret: str | None = public_field(
+        default=None, description="Shared webhook secret used to authenticate events"
+    )
+    _async_waiters: dict[
+        PipelineEventKey, list[tuple[asyncio.AbstractEventLoop, asyncio.Future]]
+    ] = private_field(
+        factory=dict, description="Futures of coroutines waiting on each pipeline"
+    )
+    _condition: threading.Condition = private_field(
+        factory=threading.Condition, description="Signals waiters on new events"
+    )
+    _events: OrderedDict[PipelineEventKey, dict[str, Any]] = private_field(
+        factory=OrderedDict, description="Latest unclaimed payload per pipeline"
+    )
+    _server: ThreadingHTTPServer | None = private_field(
+        default=None, description="Running HTTP server"
+    )
+    _thread: threading.Thread | None = private_field(
+        default=None, description="Thread serving requests"
+    )
+
+    @staticmethod
+    def build_event_key(
+        remote: AbstractRemote, namespace: str, name: str, pipeline_id: int
+    ) -> PipelineEventKey:
+        """Key under which events of a pipeline followed through ``remote`` arrive."""
+        return (
+            remote.get_snake_short_class_name(),
+            f"{namespace}/{name}".lower(),
+            pipeline_id,
+        )
+
+    @staticmethod
+    def extract_event_key(
+        event_name: str, payload: dict[str, Any]
+    ) -> PipelineEventKey | None:
+        """Return the key of the pipeline carried by a webhook payload, if any."""
+        pipeline = PipelineWebhookReceiver.extract_pipeline(event_name, payload)
+        if not pipeline or not isinstance(pipeline.get("id"), int):
+            return None
+        if event_name == "workflow_run":
+            forge = "github"
+            repository = (payload.get("repository") or {}).get("full_name")
+        else:
+            forge = "gitlab"
+            repository = (payload.get("project") or {}).get("path_with_namespace")
+        if not repository:
+            return None
+        return forge, repository.lower(), pipeline["id"]
+
+    @staticmethod
+    def extract_pipeline(event_name: str, payload: dict[str, Any]) -> dict | None:
+        """Return the pipeline dict carried by a webhook payload, if any.
+
+        GitHub ``check_run`` events are ignored: they carry a check run ID,
+        not the workflow run ID pipelines are followed by.
+        """
+        if payload.get("object_kind") == "pipeline" or event_name == "Pipeline Hook":
+            return payload.get("object_attributes") or None
+        if event_name == "workflow_run":
+            return payload.get(event_name) or None
+        return None
+
+    @staticmethod
+    def _wake_future(future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(None)
+
+    def get_url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("Webhook receiver is not started")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def handle_event(
+        self, event_name: str, payload: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Record the pipeline carried by an event and wake up waiters."""
+        key = self.extract_event_key(event_name, payload)
+        if key is None:
+            return None
+        pipeline = self.extract_pipeline(event_name, payload)
+
+        with self._condition:
+            self._events[key] = pipeline
+            self._events.move_to_end(key)
+            while len(self._events) > self.max_pending_events:
+                self._events.popitem(last=False)
+            self._condition.notify_all()
+            for loop, future in self._async_waiters.get(key, ()):
+                try:
+                    loop.call_soon_threadsafe(self._wake_future, future)
+                except RuntimeError:
+                    # Loop closed: its waiter is gone.
+                    continue
+        return pipeline
+
+    def is_authorized(self, headers: Any, body: bytes) -> bool:
+        import hashlib
+        import hmac
+
+        if not self.secret:
+            return True
+
+        gitlab_token = headers.get("X-Gitlab-Token")
+        if gitlab_token is not None:
+            return hmac.compare_digest(gitlab_token, self.secret)
+
+        signature = headers.get("X-Hub-Signature-256") or ""
+        expected = hmac.new(self.secret.encode(), body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(signature, f"sha256={expected}")
+
+    def pop_events(
+        self, keys: Iterable[PipelineEventKey], timeout: float = 0.0
+    ) -> dict[PipelineEventKey, dict[str, Any]]:
+        """Claim the pending events of ``keys``, waiting up to ``timeout`` for
+        the first one; events of other pipelines are left to their waiters."""
+        keys = set(keys)
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while not keys.intersection(self._events):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return {}
+                self._condition.wait(remaining)
+            return {
+                key: self._events.pop(key) for key in keys.intersection(self._events)
+            }
+
+    def start(self) -> PipelineWebhookReceiver:
+        from http.server import ThreadingHTTPServer
+
+        if self._server is None:
+            self._server = ThreadingHTTPServer(
+                (self.host, self.port), self._create_handler_class()
+            )
+            self._server.daemon_threads = True
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                name="pipeline-webhook-receiver",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def wait_for_pipeline(
+        self, key: PipelineEventKey, timeout: float
+    ) -> dict[str, Any] | None:
+        """Claim the next event of one pipeline, or return None after ``timeout``."""
+        return self.pop_events([key], timeout).get(key)
+
+    async def wait_for_pipeline_async(
+        self, key: PipelineEventKey, timeout: float
+    ) -> dict[str, Any] | None:
+        """Coroutine version of ``wait_for_pipeline``, woken from the server
+        thread through the loop rather than blocking a worker thread."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            with self._condition:
+                if key in self._events:
+                    return self._events.pop(key)
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None
+                waiter = (loop, loop.create_future())
+                self._async_waiters.setdefault(key, []).append(waiter)
+            try:
+                await asyncio.wait_for(waiter[1], remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._condition:
+                    waiters = self._async_waiters.get(key, [])
+                    waiters.remove(waiter)
+                    if not waiters:
+                        self._async_waiters.pop(key, None)
+
+    def _create_handler_class(self) -> type:
+        import json
+        from http.server import BaseHTTPRequestHandler
+
+        receiver = self
+
+        class PipelineWebhookHandler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if not receiver.is_authorized(self.headers, body):
+                    self.send_response(401)
+                    self.end_headers()
+                    return
+                try:
+                    payload = json.loads(body or b"{}")
+                except ValueError:
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+
+                event_name = (
+                    self.headers.get("X-GitHub-Event")
+                    or self.headers.get("X-Gitlab-Event")
+                    or ""
+                )
+                if isinstance(payload, dict):
+                    receiver.handle_event(event_name, payload)
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, format: str, *args: Any) -> None:
+                # Keep the terminal output of the running command clean.
+                pass
+
+        return PipelineWebhookHandler
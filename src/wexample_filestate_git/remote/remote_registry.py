@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wexample_prompt.common.io_manager import IoManager
+
+    from wexample_filestate_git.remote.abstract_remote import AbstractRemote
+    from wexample_filestate_git.remote.cache.abstract_cache_store import (
+        AbstractCacheStore,
+    )
+    from wexample_filestate_git.remote.cache.ci_variable_ledger import (
+        CiVariableLedger,
+    )
+    from wexample_filestate_git.remote.cache.gitlab_id_cache import GitlabIdCache
+    from wexample_filestate_git.remote.http.remote_http_client import (
+        RemoteHttpClient,
+    )
+    from wexample_filestate_git.remote.http.response_cache import ResponseCache
+
+
+class RemoteRegistry:
+    """Process-wide pool of remote API clients.
+
+    Returns a single remote instance per (remote type, API base URL, token),
+    all of them sharing one keep-alive HTTP client. Options and operations are
+    re-evaluated on every rectify pass; going through the registry means they
+    reuse open connections instead of paying a new TCP/TLS handshake each time.
+    They also share one response cache, so repeated GETs become conditional
+    requests, and one cache store for facts worth keeping between runs.
+    """
+
+    _cache_store: AbstractCacheStore | None = None
+    _cache_store_configured: AbstractCacheStore | None = None
+    _ci_variable_ledger: CiVariableLedger | None = None
+    _ci_variable_ledger_path: Path | None = None
+    _gitlab_id_cache: GitlabIdCache | None = None
+    _http_client: RemoteHttpClient | None = None
+    _http_client_options: dict[str, Any] = {}
+    _instances: dict[tuple, AbstractRemote] = {}
+    _lock = threading.RLock()
+    _response_cache: ResponseCache | None = None
+    _response_cache_dir: Path | None = None
+
+    @classmethod
+    def configure(
+        cls,
+        pool_maxsize: int | None = None,
+        per_host_maxsize: dict[str, int] | None = None,
+        pool_block: bool | None = None,
+        http2_hosts: list[str] | set[str] | None = None,
+        response_cache_dir: str | Path | None = None,
+        ci_variable_ledger_path: str | Path | None = None,
+        cache_store: AbstractCacheStore | None = None,
+        circuit_failure_threshold: int | None = None,
+        circuit_reset_timeout: float | None = None,
+    ) -> None:
+        """Change pooling, caching and circuit breaker settings; applies to
+        clients created afterwards."""
+        from wexample_filestate_git.remote.http.circuit_breaker import (
+            CircuitBreaker,
+        )
+
+        options = {
+            "pool_maxsize": pool_maxsize,
+            "per_host_maxsize": per_host_maxsize,
+            "pool_block": pool_block,
+            "http2_hosts": set(http2_hosts) if http2_hosts is not None else None,
+        }
+        with cls._lock:
+            cls._http_client_options.update(
+                {key: value for key, value in options.items() if value is not None}
+            )
+            if response_cache_dir is not None:
+                cls._response_cache_dir = Path(response_cache_dir)
+            if cache_store is not None:
+                cls._cache_store_configured = cache_store
+            if ci_variable_ledger_path is not None:
+                cls._ci_variable_ledger_path = Path(ci_variable_ledger_path)
+            if (
+                circuit_failure_threshold is not None
+                or circuit_reset_timeout is not None
+            ):
+                CircuitBreaker.configure(
+                    failure_threshold=circuit_failure_threshold,
+                    reset_timeout=circuit_reset_timeout,
+                )
+            cls.reset()
+
+    @classmethod
+    def get_cache_store(cls) -> AbstractCacheStore:
+        """Store shared by processes and runs; a SQLite file in the user cache by default."""
+        from wexample_filestate_git.helper.cache import get_cache_dir
+        from wexample_filestate_git.remote.cache.sqlite_cache_store import (
+            SqliteCacheStore,
+        )
+
+        with cls._lock:
+            if cls._cache_store is None:
+                cls._cache_store = cls._cache_store_configured or SqliteCacheStore(
+                    path=get_cache_dir() / "cache.sqlite3"
+                )
+            return cls._cache_store
+
+    @classmethod
+    def get_ci_variable_ledger(cls) -> CiVariableLedger:
+        """Ledger of pushed CI variable values; on disk in the user cache by default."""
+        from wexample_filestate_git.helper.cache import get_cache_dir
+        from wexample_filestate_git.remote.cache.ci_variable_ledger import (
+            CiVariableLedger,
+        )
+
+        with cls._lock:
+            if cls._ci_variable_ledger is None:
+                cls._ci_variable_ledger = CiVariableLedger(
+                    path=cls._ci_variable_ledger_path
+                    or get_cache_dir() / "ci_variables_ledger.json"
+                )
+            return cls._ci_variable_ledger
+
+    @classmethod
+    def get_gitlab_id_cache(cls) -> GitlabIdCache:
+        """GitLab IDs, kept between runs in the shared cache store."""
+        from wexample_filestate_git.remote.cache.gitlab_id_cache import (
+            GitlabIdCache,
+        )
+
+        with cls._lock:
+            if cls._gitlab_id_cache is None:
+                cls._gitlab_id_cache = GitlabIdCache(store=cls.get_cache_store())
+            return cls._gitlab_id_cache
+
+    @classmethod
+    def get_http_client(cls) -> RemoteHttpClient:
+        from wexample_filestate_git.remote.http.remote_http_client import (
+            RemoteHttpClient,
+        )
+
+        with cls._lock:
+            if cls._http_client is None:
+                cls._http_client = RemoteHttpClient(**cls._http_client_options)
+            return cls._http_client
+
+    @classmethod
+    def get_remote(
+        cls,
+        remote_type: type[AbstractRemote],
+        api_token: str,
+        base_url: str | None,
+        io: IoManager,
+    ) -> AbstractRemote:
+        key = (remote_type, base_url, api_token)
+
+        with cls._lock:
+            remote = cls._instances.get(key)
+            if remote is None:
+                kwargs: dict[str, Any] = {
+                    "io": io,
+                    "api_token": api_token,
+                    "http_client": cls.get_http_client(),
+                    "response_cache": cls.get_response_cache(),
+                    # The gateway's fixed inter-request delay is meant for a
+                    # single short-lived client; on a shared instance it would
+                    # serialize the whole process at one request per second.
+                    "rate_limit_delay": 0.0,
+                    **remote_type.build_registry_kwargs(),
+                }
+                if base_url:
+                    kwargs["base_url"] = base_url
+                remote = remote_type(**kwargs)
+                cls._instances[key] = remote
+
+            return remote
+
+    @classmethod
+    def get_response_cache(cls) -> ResponseCache:
+        from wexample_filestate_git.remote.http.response_cache import ResponseCache
+
+        with cls._lock:
+            if cls._response_cache is None:
+                cls._response_cache = ResponseCache(directory=cls._response_cache_dir)
+            return cls._response_cache
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop every pooled remote, close the shared connections and forget
+        in-memory cache entries (entries persisted on disk are kept)."""
+        with cls._lock:
+            if cls._http_client is not None:
+                cls._http_client.close()
+            cls._cache_store = None
+            cls._ci_variable_ledger = None
+            cls._gitlab_id_cache = None
+            cls._http_client = None
+            cls._instances.clear()
+            cls._response_cache = None
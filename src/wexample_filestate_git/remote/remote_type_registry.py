@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import re
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_filestate_git.remote.abstract_remote import AbstractRemote
+
+# Third-party forges register their remote class under this entry point
+# group, e.g. ``gitea = "my_package.gitea_remote:GiteaRemote"``.
+REMOTE_TYPE_ENTRY_POINT_GROUP = "wexample_filestate_git.remotes"
+# Probe answers are persisted in the shared cache store; a host rarely changes
+# forge, while a failed probe may come from a transient outage.
+REMOTE_TYPE_PROBE_TTL = 30 * 24 * 3600.0
+REMOTE_TYPE_PROBE_MISS_TTL = 24 * 3600.0
+
+# Host of https://, ssh:// and scp-like (git@host:path) remote URLs.
+_HOST_PATTERN = re.compile(r"^(?:[a-z][a-z0-9+.-]*://)?(?:[^@/]+@)?\[?([^/:\]]+)")
+
+
+class RemoteTypeRegistry:
+    """Process-wide index of remote classes, by name and by host.
+
+    Remote classes are the built-in GitHub and GitLab ones plus any declared
+    under the ``wexample_filestate_git.remotes`` entry point group. The type
+    of a remote URL is resolved once per host and memoized: from the
+    mappings declared with ``configure``, then from the classes' own URL
+    patterns, and finally by probing the host's API, whose answer is
+    persisted between runs.
+    """
+
+    _host_mappings: dict[str, str] = {}
+    _hosts: dict[str, type[AbstractRemote] | None] = {}
+    _lock = threading.RLock()
+    _probe_unknown_hosts: bool = True
+    _types: dict[str, type[AbstractRemote]] | None = None
+
+    @classmethod
+    def configure(
+        cls,
+        host_mappings: dict[str, str] | None = None,
+        probe_unknown_hosts: bool | None = None,
+    ) -> None:
+        """Declare the type of hosts (e.g. ``{"git.example.com": "gitlab"}``)."""
+        with cls._lock:
+            if host_mappings is not None:
+                cls._host_mappings.update(
+                    {host.lower(): name.lower() for host, name in host_mappings.items()}
+                )
+            if probe_unknown_hosts is not None:
+                cls._probe_unknown_hosts = probe_unknown_hosts
+            cls._hosts.clear()
+
+    @classmethod
+    def declare(cls, remote_url: str, name: str) -> None:
+        """Declare the type of the host serving ``remote_url``; it is
+        remembered between runs like a probe answer, so remotes of that host
+        configured without a type are not probed either."""
+        from wexample_filestate_git.remote.remote_registry import RemoteRegistry
+
+        host = cls.get_host(remote_url)
+        name = name.lower()
+        if host is None or cls.get_type(name) is None:
+            return
+        with cls._lock:
+            if cls._host_mappings.get(host) == name:
+                return
+            cls._host_mappings[host] = name
+            cls._hosts.pop(host, None)
+        RemoteRegistry.get_cache_store().set(
+            f"remote_type:{host}", name, ttl=REMOTE_TYPE_PROBE_TTL
+        )
+
+    @classmethod
+    def detect(cls, remote_url: str) -> type[AbstractRemote] | None:
+        """Return the remote class serving a git remote URL, or None."""
+        host = cls.get_host(remote_url)
+        if host is None:
+            return None
+
+        with cls._lock:
+            if host in cls._hosts:
+                return cls._hosts[host]
+
+        remote_type = cls._resolve(host, remote_url)
+        with cls._lock:
+            cls._hosts[host] = remote_type
+        return remote_type
+
+    @classmethod
+    def get_host(cls, remote_url: str) -> str | None:
+        match = _HOST_PATTERN.match(remote_url.strip())
+        return match.group(1).lower() if match else None
+
+    @classmethod
+    def get_type(cls, name: str) -> type[AbstractRemote] | None:
+        """Return the remote class registered under a name (e.g. ``gitlab``)."""
+        return cls.get_types().get(name.lower())
+
+    @classmethod
+    def get_types(cls) -> dict[str, type[AbstractRemote]]:
+        with cls._lock:
+            if cls._types is None:
+                cls._types = cls._load_types()
+            return cls._types
+
+    @classmethod
+    def register(
+        cls, remote_type: type[AbstractRemote], name: str | None = None
+    ) -> None:
+        """Add a remote class; its name defaults to e.g. ``gitlab`` for GitlabRemote."""
+        with cls._lock:
+            cls.get_types()[
+                (name or remote_type.get_snake_short_class_name()).lower()
+            ] = remote_type
+            cls._hosts.clear()
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget registered classes, host mappings and memoized hosts."""
+        with cls._lock:
+            cls._host_mappings.clear()
+            cls._hosts.clear()
+            cls._probe_unknown_hosts = True
+            cls._types = None
+
+    @classmethod
+    def _load_types(cls) -> dict[str, type[AbstractRemote]]:
+        import logging
+        from importlib.metadata import entry_points
+
+        from wexample_filestate_git.remote.github_remote import GithubRemote
+        from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+
+        types: dict[str, type[AbstractRemote]] = {
+            remote_type.get_snake_short_class_name(): remote_type
+            for remote_type in (GithubRemote, GitlabRemote)
+        }
+        for entry_point in entry_points(group=REMOTE_TYPE_ENTRY_POINT_GROUP):
+            try:
+                types[entry_point.name.lower()] = entry_point.load()
+            except Exception as e:
+                # A broken plugin must not prevent detecting the others.
+                logging.getLogger(__name__).warning(
+                    "Could not load remote type %r (%s): %s",
+                    entry_point.name,
+                    entry_point.value,
+                    e,
+                )
+        return types
+
+    @classmethod
+    def _probe(cls, host: str) -> type[AbstractRemote] | None:
+        from wexample_filestate_git.remote.remote_registry import RemoteRegistry
+
+        cache_store = RemoteRegistry.get_cache_store()
+        cache_key = f"remote_type:{host}"
+        name = cache_store.get(cache_key)
+        if name is None:
+            name = next(
+                (
+                    type_name
+                    for type_name, remote_type in cls.get_types().items()
+                    if remote_type.probe_host(host)
+                ),
+                "",
+            )
+            cache_store.set(
+                cache_key,
+                name,
+                ttl=REMOTE_TYPE_PROBE_TTL if name else REMOTE_TYPE_PROBE_MISS_TTL,
+            )
+        return cls.get_type(name) if name else None
+
+    @classmethod
+    def _resolve(cls, host: str, remote_url: str) -> type[AbstractRemote] | None:
+        with cls._lock:
+            name = cls._host_mappings.get(host)
+        if name is not None:
+            return cls.get_type(name)
+
+        for remote_type in cls.get_types().values():
+            if remote_type.detect_remote_type(remote_url):
+                return remote_type
+
+        return cls._probe(host) if cls._probe_unknown_hosts else None
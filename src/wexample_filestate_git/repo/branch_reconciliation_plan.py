@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_filestate_git.repo.branch_reconciliation_step import (
+        BranchReconciliationStep,
+    )
+    from wexample_filestate_git.repo.ref_snapshot import RefSnapshot
+
+
+@base_class
+class BranchReconciliationPlan(BaseClass):
+    """Every change bringing branches in line with a ``branches`` config.
+
+    Built from a single ``RefSnapshot``: local renames and merges in the order
+    they can run (an alias renamed into a missing canonical branch turns the
+    next aliases of that branch into merges), then, per remote, the canonical
+    branches to push and the aliases to delete. Aliases are deleted on a
+    remote when they were renamed or merged locally, or when ``sync_remote``
+    is enabled for them.
+    """
+
+    local_steps: list[BranchReconciliationStep] = public_field(
+        factory=list, description="Renames and merges, in execution order"
+    )
+    remote_steps: list[BranchReconciliationStep] = public_field(
+        factory=list, description="Pushes and deletions, grouped by remote"
+    )
+
+    @classmethod
+    def build(
+        cls, snapshot: RefSnapshot, branches: dict[str, Any]
+    ) -> BranchReconciliationPlan:
+        from wexample_filestate_git.repo.branch_reconciliation_step import (
+            BRANCH_STEP_DELETE_REMOTE,
+            BRANCH_STEP_MERGE,
+            BRANCH_STEP_PUSH,
+            BRANCH_STEP_RENAME,
+            BranchReconciliationStep,
+        )
+
+        designs = cls._parse_designs(branches)
+        plan = cls()
+
+        # Branch existence as it will be once the previous steps ran.
+        exists: dict[str, bool] = {}
+
+        def branch_exists(name: str) -> bool:
+            return exists.get(name, snapshot.has_branch(name))
+
+        for canonical, aliases, on_conflict, _ in designs:
+            for alias in aliases:
+                if not branch_exists(alias):
+                    continue
+                if not branch_exists(canonical):
+                    action = BRANCH_STEP_RENAME
+                    exists[canonical] = True
+                elif on_conflict == "merge":
+                    action = BRANCH_STEP_MERGE
+                elif on_conflict == "error":
+                    raise ValueError(
+                        f"Both '{alias}' and '{canonical}' exist — manual resolution required."
+                    )
+                else:
+                    continue
+                exists[alias] = False
+                plan.local_steps.append(
+                    BranchReconciliationStep(
+                        action=action, from_branch=alias, to_branch=canonical
+                    )
+                )
+
+        reconciled = {step.from_branch for step in plan.local_steps}
+        for remote_name in snapshot.get_remote_names():
+            pushed: set[str] = set()
+            deleted: set[str] = set()
+            for step in plan.local_steps:
+                if step.to_branch not in pushed:
+                    pushed.add(step.to_branch)
+                    plan.remote_steps.append(
+                        BranchReconciliationStep(
+                            action=BRANCH_STEP_PUSH,
+                            remote_name=remote_name,
+                            to_branch=step.to_branch,
+                        )
+                    )
+            for canonical, aliases, _, sync_remote in designs:
+                for alias in aliases:
+                    if (
+                        alias in deleted
+                        or not (sync_remote or alias in reconciled)
+                        or not snapshot.has_remote_head(remote_name, alias)
+                    ):
+                        continue
+                    deleted.add(alias)
+                    plan.remote_steps.append(
+                        BranchReconciliationStep(
+                            action=BRANCH_STEP_DELETE_REMOTE,
+                            from_branch=alias,
+                            remote_name=remote_name,
+                            to_branch=canonical,
+                        )
+                    )
+
+        return plan
+
+    @classmethod
+    def _parse_designs(
+        cls, branches: dict[str, Any]
+    ) -> list[tuple[str, list[str], str, bool]]:
+        """Validate the config once: ``(canonical, aliases, on_alias_conflict,
+        sync_remote)`` per entry."""
+        designs = []
+        for canonical, config in branches.items():
+            if not isinstance(config, dict):
+                continue
+            aliases = config.get("aliases", [])
+            designs.append(
+                (
+                    canonical,
+                    aliases if isinstance(aliases, list) else [],
+                    config.get("on_alias_conflict", "merge"),
+                    bool(config.get("sync_remote", True)),
+                )
+            )
+        return designs
+
+    def describe(self) -> str:
+        return ", ".join(
+            step.describe() for step in [*self.local_steps, *self.remote_steps]
+        )
+
+    def get_remote_names(self) -> list[str]:
+        return list(dict.fromkeys(step.remote_name for step in self.remote_steps))
+
+    def get_remote_steps(self, remote_name: str) -> list[BranchReconciliationStep]:
+        return [step for step in self.remote_steps if step.remote_name == remote_name]
+
+    def is_empty(self) -> bool:
+        return not self.local_steps and not self.remote_steps
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+BRANCH_STEP_DELETE_REMOTE = "delete_remote"
+BRANCH_STEP_MERGE = "merge"
+BRANCH_STEP_PUSH = "push"
+BRANCH_STEP_RENAME = "rename"
+
+
+@base_class
+class BranchReconciliationStep(BaseClass):
+    """One change of a branch reconciliation plan."""
+
+    action: str = public_field(description="rename, merge, push or delete_remote")
+    from_branch: str | None = public_field(
+        default=None, description="Alias branch renamed, merged or deleted"
+    )
+    remote_name: str | None = public_field(
+        default=None, description="Remote the step applies to; None for local steps"
+    )
+    to_branch: str = public_field(description="Canonical branch of the alias")
+
+    def describe(self) -> str:
+        if self.action == BRANCH_STEP_RENAME:
+            return f"rename '{self.from_branch}' → '{self.to_branch}'"
+        if self.action == BRANCH_STEP_MERGE:
+            return f"merge '{self.from_branch}' into '{self.to_branch}'"
+        if self.action == BRANCH_STEP_PUSH:
+            return f"push '{self.to_branch}' to {self.remote_name}"
+        return f"delete '{self.from_branch}' on {self.remote_name}"
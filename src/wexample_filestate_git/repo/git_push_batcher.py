@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from git import Repo
+
+    from wexample_filestate_git.repo.push_ref_status import PushRefStatus
+
+
+@base_class
+class GitPushBatcher(BaseClass):
+    """Collects refspecs per remote and pushes each batch in one ``git push``.
+
+    Every push opens a connection and negotiates refs with the remote; a
+    rename pushed as "create the new branch" then "delete the old one" pays
+    for that twice and leaves the remote half-renamed in between. Batches are
+    pushed with ``--atomic``, so the remote applies all of their refs or none,
+    and with ``--porcelain``, parsed into one ``PushRefStatus`` per refspec.
+    Remotes which do not support atomic pushes get a plain one.
+    """
+
+    repo: Repo = public_field(description="Repository refs are pushed from")
+    _refspecs: dict[str, list[str]] = private_field(
+        factory=dict, description="Refspecs waiting to be pushed, by remote name"
+    )
+
+    def add(self, remote_name: str, refspec: str) -> None:
+        refspecs = self._refspecs.setdefault(remote_name, [])
+        if refspec not in refspecs:
+            refspecs.append(refspec)
+
+    def add_branch(self, remote_name: str, branch_name: str) -> None:
+        self.add(remote_name, f"{branch_name}:{branch_name}")
+
+    def add_deletion(self, remote_name: str, branch_name: str) -> None:
+        self.add(remote_name, f":{branch_name}")
+
+    def flush(self, remote_name: str) -> list[PushRefStatus]:
+        """Push the refspecs waiting for ``remote_name``, in one invocation."""
+        refspecs = self._refspecs.pop(remote_name, [])
+        if not refspecs:
+            return []
+        return self.push(remote_name, refspecs)
+
+    def get_pending(self, remote_name: str) -> list[str]:
+        return list(self._refspecs.get(remote_name, []))
+
+    def push(self, remote_name: str, refspecs: list[str]) -> list[PushRefStatus]:
+        """Push ``refspecs`` atomically; rejected refs are reported in the
+        returned statuses, a push which could not run at all raises.
+
+        Deletions are chosen from remote-tracking refs, which may be stale: a
+        deletion of a branch already gone upstream would fail the whole batch,
+        so it is dropped (with its tracking ref) and the rest pushed again.
+        """
+        status, stdout, stderr = self._run_push(remote_name, refspecs, atomic=True)
+        if status != 0 and "support --atomic" in stderr:
+            status, stdout, stderr = self._run_push(remote_name, refspecs, atomic=False)
+
+        missing = self._find_missing_deletions(refspecs, stderr) if status else []
+        if missing:
+            self._prune_tracking_refs(remote_name, missing)
+            refspecs = [refspec for refspec in refspecs if refspec not in missing]
+            return self.push(remote_name, refspecs) if refspecs else []
+
+        statuses = self._parse_porcelain(stdout)
+        if status != 0 and not statuses:
+            raise RuntimeError(
+                f"Push of {', '.join(refspecs)} to {remote_name} failed: "
+                f"{stderr.strip() or f'git exited with status {status}'}"
+            )
+        return statuses
+
+    def _find_missing_deletions(self, refspecs: list[str], stderr: str) -> list[str]:
+        """Deletion refspecs git refused because the remote has no such ref."""
+        import re
+
+        missing = set(
+            re.findall(r"unable to delete '([^']+)': remote ref does not exist", stderr)
+        )
+        return [
+            refspec
+            for refspec in refspecs
+            if refspec.startswith(":") and refspec[1:] in missing
+        ]
+
+    def _parse_porcelain(self, output: str) -> list[PushRefStatus]:
+        from wexample_filestate_git.repo.push_ref_status import PushRefStatus
+
+        statuses = []
+        for line in output.splitlines():
+            ref_status = PushRefStatus.from_porcelain_line(line)
+            if ref_status is not None:
+                statuses.append(ref_status)
+        return statuses
+
+    def _prune_tracking_refs(self, remote_name: str, deletions: list[str]) -> None:
+        for refspec in deletions:
+            branch_name = refspec[1:].removeprefix("refs/heads/")
+            self.repo.git.update_ref(
+                "-d",
+                f"refs/remotes/{remote_name}/{branch_name}",
+                with_exceptions=False,
+            )
+
+    def _run_push(
+        self, remote_name: str, refspecs: list[str], atomic: bool
+    ) -> tuple[int, str, str]:
+        options = ["--atomic", "--porcelain"] if atomic else ["--porcelain"]
+        return self.repo.git.push(
+            *options,
+            remote_name,
+            *refspecs,
+            with_extended_output=True,
+            with_exceptions=False,
+        )
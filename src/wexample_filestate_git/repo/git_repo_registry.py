@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from git import Repo
+
+
+class GitRepoRegistry:
+    """Process-wide pool of GitPython ``Repo`` handles, one per work tree.
+
+    Options and operations are re-evaluated on every rectify pass and each of
+    them used to open its own ``Repo``: ``.git/config`` was parsed again every
+    time, and the persistent ``git cat-file`` processes of every handle lived
+    until garbage collection. Handles are kept in a bounded LRU instead;
+    evicted ones are closed, which stops their processes. Git operations
+    invalidate the handle of their target once applied (or undone), so
+    nothing reads a repository through a handle older than the last change.
+    """
+
+    _instances: OrderedDict[str, Repo] = OrderedDict()
+    _lock = threading.RLock()
+    _max_size: int = 64
+
+    @classmethod
+    def configure(cls, max_size: int | None = None) -> None:
+        """Change how many handles are kept open; extra ones are closed at once."""
+        with cls._lock:
+            if max_size is not None:
+                cls._max_size = max_size
+            cls._evict()
+
+    @classmethod
+    def get_repo(cls, path: str | Path) -> Repo:
+        """Return the shared handle of the repository at ``path``.
+
+        Raises like ``Repo(path)`` when ``path`` is not a git work tree.
+        """
+        from git import Repo
+
+        key = cls._build_key(path)
+        with cls._lock:
+            repo = cls._instances.get(key)
+            if repo is None:
+                repo = Repo(key)
+                cls._instances[key] = repo
+                cls._evict()
+            else:
+                cls._instances.move_to_end(key)
+            return repo
+
+    @classmethod
+    def get_size(cls) -> int:
+        with cls._lock:
+            return len(cls._instances)
+
+    @classmethod
+    def invalidate(cls, path: str | Path) -> None:
+        """Close and forget the handle of ``path``; the next call opens a fresh one."""
+        with cls._lock:
+            repo = cls._instances.pop(cls._build_key(path), None)
+        if repo is not None:
+            repo.close()
+
+    @classmethod
+    def reset(cls) -> None:
+        """Close every handle."""
+        with cls._lock:
+            repos = list(cls._instances.values())
+            cls._instances.clear()
+        for repo in repos:
+            repo.close()
+
+    @classmethod
+    def _build_key(cls, path: str | Path) -> str:
+        return str(Path(path).resolve())
+
+    @classmethod
+    def _evict(cls) -> None:
+        while len(cls._instances) > max(cls._max_size, 0):
+            _, repo = cls._instances.popitem(last=False)
+            repo.close()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+PUSH_FLAG_DELETED = "-"
+PUSH_FLAG_FAST_FORWARD = " "
+PUSH_FLAG_FORCED = "+"
+PUSH_FLAG_NEW = "*"
+PUSH_FLAG_REJECTED = "!"
+PUSH_FLAG_UP_TO_DATE = "="
+
+
+@base_class
+class PushRefStatus(BaseClass):
+    """Outcome of one refspec, from a ``git push --porcelain`` status line."""
+
+    flag: str = public_field(description="Status flag, one of the PUSH_FLAG_* values")
+    from_ref: str = public_field(description="Local ref pushed; empty for a deletion")
+    reason: str | None = public_field(
+        default=None, description="Why the ref was rejected, when it was"
+    )
+    summary: str = public_field(
+        description="Summary git gives, e.g. a commit range or [rejected]"
+    )
+    to_ref: str = public_field(description="Remote ref updated or deleted")
+
+    @classmethod
+    def from_porcelain_line(cls, line: str) -> PushRefStatus | None:
+        """Parse ``<flag>\\t<from>:<to>\\t<summary> (<reason>)``, None for any
+        other line ("To <url>", "Done", messages from the remote)."""
+        parts = line.split("\t")
+        if len(parts) != 3 or len(parts[0]) != 1 or ":" not in parts[1]:
+            return None
+        from_ref, _, to_ref = parts[1].rpartition(":")
+        summary, reason = parts[2], None
+        if summary.endswith(")") and " (" in summary:
+            summary, _, reason = summary[:-1].partition(" (")
+        return cls(
+            flag=parts[0],
+            from_ref=from_ref,
+            reason=reason,
+            summary=summary,
+            to_ref=to_ref,
+        )
+
+    def describe(self) -> str:
+        ref = f"'{self.to_ref}'" if self.from_ref else f"deletion of '{self.to_ref}'"
+        if self.reason:
+            return f"{ref} {self.summary} ({self.reason})"
+        return f"{ref} {self.summary}"
+
+    def is_rejected(self) -> bool:
+        return self.flag == PUSH_FLAG_REJECTED
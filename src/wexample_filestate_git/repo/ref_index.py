@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class RefIndex(BaseClass):
+    """Read-only ref name to object ID map, packed for very large repositories.
+
+    Names are sorted and stored back to back in one UTF-8 buffer with an
+    offsets array, object IDs as raw 20 (SHA-1) or 32 (SHA-256) bytes in a
+    second buffer at the same position. 100k refs fit in a few MB, where one
+    GitPython object (or even one dict entry) per ref costs several times
+    that. Lookups and prefix queries bisect over the sorted names.
+    """
+
+    _names: bytes = private_field(default=b"", description="Sorted names, UTF-8")
+    _object_id_size: int = private_field(
+        default=20, description="Bytes per object ID (20 for SHA-1, 32 for SHA-256)"
+    )
+    _object_ids: bytes = private_field(
+        default=b"", description="Raw object IDs, in name order"
+    )
+    _offsets: array = private_field(
+        factory=lambda: array("I", [0]),
+        description="Start of each name in the names buffer, then its total length",
+    )
+
+    @classmethod
+    def from_refs(cls, refs: dict[str, str]) -> RefIndex:
+        """Build an index from ``{ref name: hexadecimal object ID}``."""
+        entries: list[tuple[bytes, bytes]] = []
+        for name, object_id in refs.items():
+            try:
+                entries.append((name.encode("utf-8"), bytes.fromhex(object_id)))
+            except ValueError:
+                # Not an object ID: a corrupt or symbolic ref.
+                continue
+        entries.sort()
+
+        index = cls()
+        if entries:
+            # A repository uses a single hash algorithm.
+            index._object_id_size = len(entries[0][1])
+            entries = [
+                entry for entry in entries if len(entry[1]) == index._object_id_size
+            ]
+        offsets = array("I", [0])
+        for name, _ in entries:
+            offsets.append(offsets[-1] + len(name))
+        index._names = b"".join(name for name, _ in entries)
+        index._object_ids = b"".join(object_id for _, object_id in entries)
+        index._offsets = offsets
+        return index
+
+    def __contains__(self, name: str) -> bool:
+        return self._find(name.encode("utf-8")) is not None
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def get(self, name: str) -> str | None:
+        """Hexadecimal object ID of ``name``, None if there is no such ref."""
+        position = self._find(name.encode("utf-8"))
+        if position is None:
+            return None
+        return self._get_object_id(position).hex()
+
+    def get_memory_size(self) -> int:
+        """Bytes held by the buffers, for sizing checks."""
+        return (
+            len(self._names)
+            + len(self._object_ids)
+            + self._offsets.itemsize * len(self._offsets)
+        )
+
+    def get_names(self, prefix: str = "") -> list[str]:
+        """Sorted names starting with ``prefix``."""
+        start, end = self._get_prefix_range(prefix.encode("utf-8"))
+        return [
+            self._get_name(position).decode("utf-8") for position in range(start, end)
+        ]
+
+    def _find(self, name: bytes) -> int | None:
+        position = bisect_left(range(len(self)), name, key=self._get_name)
+        if position < len(self) and self._get_name(position) == name:
+            return position
+        return None
+
+    def _get_name(self, position: int) -> bytes:
+        return self._names[self._offsets[position] : self._offsets[position + 1]]
+
+    def _get_object_id(self, position: int) -> bytes:
+        start = position * self._object_id_size
+        return self._object_ids[start : start + self._object_id_size]
+
+    def _get_prefix_range(self, prefix: bytes) -> tuple[int, int]:
+        positions = range(len(self))
+        start = bisect_left(positions, prefix, key=self._get_name)
+        # 0xff never occurs in UTF-8: every name starting with the prefix
+        # sorts before it.
+        end = bisect_left(positions, prefix + b"\xff", lo=start, key=self._get_name)
+        return start, end
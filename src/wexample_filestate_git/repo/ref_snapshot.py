@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import ClassVar
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_filestate_git.repo.ref_index import RefIndex
+
+_CONFIG_SECTION_PATTERN = re.compile(
+    r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]'
+)
+_CONFIG_VARIABLE_PATTERN = re.compile(r"^([A-Za-z][A-Za-z0-9-]*)\s*(?:=\s*(.*))?$")
+
+
+@base_class
+class RefSnapshot(BaseClass):
+    """Ref names and remotes of a repository, read straight from ``.git``.
+
+    Parses ``HEAD``, ``packed-refs``, loose files under ``refs/`` and the
+    remote sections of ``config``, without GitPython objects nor any git
+    subprocess; enough for the read-only checks options run on every rectify
+    pass. Refs are kept in a ``RefIndex``, compact even with 100k of them.
+
+    Snapshots are memoized per work tree and reused as long as the
+    modification times of those files (and of every ``refs/`` directory, which
+    git touches whenever it writes a loose ref) are unchanged.
+    """
+
+    head: str | None = public_field(
+        default=None,
+        description="Ref HEAD points to, or the object ID when detached",
+    )
+    path: Path = public_field(description="Work tree the snapshot was read from")
+    refs: RefIndex = public_field(
+        description="Every branch, remote-tracking branch and tag, by full ref name"
+    )
+    remotes: dict[str, list[str]] = public_field(
+        factory=dict, description="Configured URLs of each remote, in config order"
+    )
+
+    _snapshots: ClassVar[dict[str, tuple[tuple, RefSnapshot]]] = {}
+    _snapshots_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def read(cls, path: str | Path) -> RefSnapshot | None:
+        """Return the snapshot of the work tree at ``path``, None if it is not one."""
+        work_tree = Path(path)
+        git_dirs = cls._find_git_dirs(work_tree)
+        if git_dirs is None:
+            return None
+        git_dir, common_dir = git_dirs
+
+        # Stamp first: a change made while parsing is caught by the next read.
+        stamp = cls._build_stamp(git_dir, common_dir)
+        key = str(work_tree)
+        with cls._snapshots_lock:
+            cached = cls._snapshots.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        snapshot = cls._parse(work_tree, git_dir, common_dir)
+        with cls._snapshots_lock:
+            cls._snapshots[key] = (stamp, snapshot)
+        return snapshot
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._snapshots_lock:
+            cls._snapshots.clear()
+
+    @classmethod
+    def _build_stamp(cls, git_dir: Path, common_dir: Path) -> tuple:
+        entries: list[tuple] = []
+        for file_path in (
+            git_dir / "HEAD",
+            common_dir / "packed-refs",
+            common_dir / "config",
+        ):
+            try:
+                stat = os.stat(file_path)
+                entries.append(
+                    (str(file_path), stat.st_mtime_ns, stat.st_size, stat.st_ino)
+                )
+            except OSError:
+                entries.append((str(file_path), None))
+        for dir_path, _, _ in os.walk(common_dir / "refs"):
+            try:
+                entries.append((dir_path, os.stat(dir_path).st_mtime_ns))
+            except OSError:
+                continue
+        return tuple(entries)
+
+    @classmethod
+    def _find_git_dirs(cls, work_tree: Path) -> tuple[Path, Path] | None:
+        """Return the git directory and the one holding shared refs (worktrees)."""
+        from wexample_helpers.const.globals import DIR_GIT
+
+        dot_git = work_tree / DIR_GIT
+        try:
+            if dot_git.is_dir():
+                git_dir = dot_git
+            elif dot_git.is_file():
+                # Linked worktree or submodule: ".git" points to the real directory.
+                content = dot_git.read_text().strip()
+                if not content.startswith("gitdir:"):
+                    return None
+                git_dir = work_tree / content[len("gitdir:") :].strip()
+            else:
+                return None
+
+            common_dir = git_dir
+            commondir_file = git_dir / "commondir"
+            if commondir_file.is_file():
+                common_dir = git_dir / commondir_file.read_text().strip()
+        except OSError:
+            return None
+        return git_dir, common_dir
+
+    @classmethod
+    def _parse(cls, work_tree: Path, git_dir: Path, common_dir: Path) -> RefSnapshot:
+        remotes = cls._parse_remotes(common_dir / "config")
+        refs = cls._parse_packed_refs(common_dir / "packed-refs")
+        # Loose refs are more recent than their packed copy.
+        refs.update(cls._parse_loose_refs(common_dir))
+
+        return cls(
+            head=cls._parse_head(git_dir / "HEAD"),
+            path=work_tree,
+            refs=RefIndex.from_refs(refs),
+            remotes=remotes,
+        )
+
+    @classmethod
+    def _parse_config_value(cls, raw: str) -> str:
+        """Unquote a config value and drop its trailing comment."""
+        value: list[str] = []
+        quoted = False
+        index = 0
+        while index < len(raw):
+            char = raw[index]
+            if char == "\\" and index + 1 < len(raw):
+                escaped = raw[index + 1]
+                value.append({"n": "\n", "t": "\t", "b": "\b"}.get(escaped, escaped))
+                index += 2
+                continue
+            if char == '"':
+                quoted = not quoted
+            elif char in "#;" and not quoted:
+                break
+            else:
+                value.append(char)
+            index += 1
+        return "".join(value).strip()
+
+    @classmethod
+    def _parse_head(cls, head_path: Path) -> str | None:
+        try:
+            content = head_path.read_text().strip()
+        except OSError:
+            return None
+        if content.startswith("ref:"):
+            return content[len("ref:") :].strip()
+        return content or None
+
+    @classmethod
+    def _parse_loose_refs(cls, common_dir: Path) -> dict[str, str]:
+        refs: dict[str, str] = {}
+        refs_dir = common_dir / "refs"
+        for dir_path, _, file_names in os.walk(refs_dir):
+            for file_name in file_names:
+                if file_name.endswith(".lock"):
+                    continue
+                file_path = Path(dir_path) / file_name
+                try:
+                    content = file_path.read_text().strip()
+                except (OSError, UnicodeDecodeError):
+                    continue
+                # Symbolic refs (e.g. refs/remotes/origin/HEAD) are not heads.
+                if not content or content.startswith("ref:"):
+                    continue
+                ref_name = file_path.relative_to(common_dir).as_posix()
+                refs[ref_name] = content
+        return refs
+
+    @classmethod
+    def _parse_packed_refs(cls, packed_refs_path: Path) -> dict[str, str]:
+        refs: dict[str, str] = {}
+        try:
+            content = packed_refs_path.read_text()
+        except OSError:
+            return refs
+        for line in content.splitlines():
+            # Skip the header and peeled tag lines ("^<object id>").
+            if not line or line[0] in "#^":
+                continue
+            object_id, _, ref_name = line.partition(" ")
+            if ref_name:
+                refs[ref_name.strip()] = object_id
+        return refs
+
+    @classmethod
+    def _parse_remotes(cls, config_path: Path) -> dict[str, list[str]]:
+        remotes: dict[str, list[str]] = {}
+        try:
+            content = config_path.read_text()
+        except (OSError, UnicodeDecodeError):
+            return remotes
+
+        remote_name: str | None = None
+        for line in content.splitlines():
+            line = line.strip()
+            if not line or line[0] in "#;":
+                continue
+
+            section = _CONFIG_SECTION_PATTERN.match(line)
+            if section:
+                name, subsection = section.group(1).lower(), section.group(2)
+                remote_name = None
+                if name == "remote" and subsection is not None:
+                    remote_name = re.sub(r"\\(.)", r"\1", subsection)
+                elif name.startswith("remote."):
+                    # Deprecated [remote.name] syntax.
+                    remote_name = name[len("remote.") :]
+                if remote_name is not None:
+                    remotes.setdefault(remote_name, [])
+                continue
+
+            if remote_name is None:
+                continue
+            variable = _CONFIG_VARIABLE_PATTERN.match(line)
+            if variable and variable.group(1).lower() == "url" and variable.group(2):
+                remotes[remote_name].append(cls._parse_config_value(variable.group(2)))
+        return remotes
+
+    def get_branch_names(self) -> list[str]:
+        return self._strip_prefix(self.refs.get_names("refs/heads/"), "refs/heads/")
+
+    def get_head_branch(self) -> str | None:
+        """Name of the checked out branch, None when HEAD is detached."""
+        if self.head is None or not self.head.startswith("refs/heads/"):
+            return None
+        return self.head[len("refs/heads/") :]
+
+    def get_remote_heads(self, remote_name: str) -> list[str]:
+        prefix = f"refs/remotes/{remote_name}/"
+        # Remote names may contain slashes: skip refs of a nested remote.
+        nested = tuple(
+            f"refs/remotes/{name}/"
+            for name in self.remotes
+            if name.startswith(f"{remote_name}/")
+        )
+        names = self.refs.get_names(prefix)
+        if nested:
+            names = [name for name in names if not name.startswith(nested)]
+        return self._strip_prefix(names, prefix)
+
+    def get_remote_names(self) -> list[str]:
+        return list(self.remotes)
+
+    def get_remote_urls(self, remote_name: str) -> list[str]:
+        return self.remotes.get(remote_name, [])
+
+    def has_branch(self, branch_name: str) -> bool:
+        return f"refs/heads/{branch_name}" in self.refs
+
+    def has_remote_head(self, remote_name: str, branch_name: str) -> bool:
+        return f"refs/remotes/{remote_name}/{branch_name}" in self.refs
+
+    def _strip_prefix(self, names: list[str], prefix: str) -> list[str]:
+        return [name[len(prefix) :] for name in names]
@@ -0,0 +1,468 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.abstract_method import abstract_method
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+    from wexample_prompt.common.io_manager import IoManager
+
+    from wexample_filestate_git.remote.abstract_remote import AbstractRemote
+    from wexample_filestate_git.testing.fake_api.fake_api_request import (
+        FakeApiRequest,
+    )
+
+# (status code, JSON payload) or (status code, JSON payload, headers).
+FakeApiResponse = tuple
+FakeApiRoute = tuple[str, str, Callable[["FakeApiRequest", re.Match], FakeApiResponse]]
+
+# Statuses of pipelines held by the server, in GitLab's vocabulary.
+FAKE_PIPELINE_TERMINAL_STATUSES = {"success", "failed", "canceled", "skipped"}
+
+
+@base_class
+class AbstractFakeApiServer(BaseClass):
+    """In-process HTTP server imitating a forge API, for offline tests and benchmarks.
+
+    Holds repositories, merge proposals, pipelines, CI variables and
+    protected branches in memory, and serves the endpoints the matching
+    remote class calls. Every request is recorded; latency, a rate limit
+    (with the forge's headers) and injected errors can be configured to
+    reproduce real-world conditions deterministically.
+    """
+
+    host: str = public_field(default="127.0.0.1", description="Interface to bind")
+    latency: float = public_field(
+        default=0.0, description="Seconds added to every response"
+    )
+    port: int = public_field(
+        default=0, description="Port to bind; 0 picks a free one (see get_url)"
+    )
+    rate_limit: int | None = public_field(
+        default=None,
+        description="Requests allowed per rate limit window; unlimited when None",
+    )
+    rate_limit_window: float = public_field(
+        default=60.0, description="Length of the rate limit window, in seconds"
+    )
+    _active_requests: int = private_field(
+        default=0, description="Requests being served right now"
+    )
+    _errors: list[dict[str, Any]] = private_field(
+        factory=list, description="Injected errors still to be returned"
+    )
+    _group_variables: dict[str, dict[str, dict[str, Any]]] = private_field(
+        factory=dict, description="Group / organization variables, by group then key"
+    )
+    _lock: threading.RLock = private_field(
+        factory=threading.RLock, description="Guards the state and the counters"
+    )
+    _max_active_requests: int = private_field(
+        default=0, description="Highest number of requests served at once"
+    )
+    _next_id: int = private_field(default=1, description="Next numeric ID to assign")
+    _rate_limit_count: int = private_field(
+        default=0, description="Requests counted in the current window"
+    )
+    _rate_limit_reset_at: float = private_field(
+        default=0.0, description="Wall-clock end of the current window"
+    )
+    _repositories: dict[str, dict[str, Any]] = private_field(
+        factory=dict, description="Repositories by namespace/name"
+    )
+    _requests: list[FakeApiRequest] = private_field(
+        factory=list, description="Every request received, in order"
+    )
+    _server: ThreadingHTTPServer | None = private_field(
+        default=None, description="Running HTTP server"
+    )
+    _thread: threading.Thread | None = private_field(
+        default=None, description="Thread serving requests"
+    )
+
+    @classmethod
+    @abstract_method
+    def get_remote_class(cls) -> type[AbstractRemote]:
+        """Return the remote class this server imitates."""
+
+    def add_pipeline(
+        self,
+        namespace: str,
+        name: str,
+        ref: str = "main",
+        status: str = "running",
+        sha: str | None = None,
+    ) -> dict[str, Any]:
+        """Add a pipeline, by default on the current head of ``ref``."""
+        with self._lock:
+            repository = self._require_repository(namespace, name)
+            pipeline = {
+                "id": self._create_id(),
+                "ref": ref,
+                "sha": sha or self._get_branch_sha(repository, ref),
+                "status": status,
+            }
+            repository["pipelines"][pipeline["id"]] = pipeline
+            return pipeline
+
+    def add_repository(
+        self,
+        namespace: str,
+        name: str,
+        default_branch: str = "main",
+        private: bool = False,
+        description: str = "",
+    ) -> dict[str, Any]:
+        with self._lock:
+            repository = {
+                "branches": {},
+                "default_branch": default_branch,
+                "description": description,
+                "id": self._create_id(),
+                "name": name,
+                "namespace": namespace,
+                "private": private,
+                "proposals": {},
+                "pipelines": {},
+                "protected_branches": set(),
+                "variables": {},
+            }
+            self._repositories[f"{namespace}/{name}"] = repository
+            return repository
+
+    def count_requests(self, method: str | None = None, path: str | None = None) -> int:
+        """Count recorded requests, optionally by method and path regex."""
+        with self._lock:
+            return sum(
+                1
+                for request in self._requests
+                if (method is None or request.method == method)
+                and (path is None or re.search(path, request.path))
+            )
+
+    def get_base_url(self) -> str:
+        """API base URL to give to the remote."""
+        return self.get_url().rstrip("/") + self._get_api_path()
+
+    def get_group_variables(self, group: str) -> dict[str, str]:
+        with self._lock:
+            return {
+                key: variable["value"]
+                for key, variable in self._group_variables.get(group, {}).items()
+            }
+
+    def get_max_concurrency(self) -> int:
+        """Highest number of requests that were in flight at the same time."""
+        with self._lock:
+            return self._max_active_requests
+
+    def get_repository(self, namespace: str, name: str) -> dict[str, Any] | None:
+        with self._lock:
+            return self._repositories.get(f"{namespace}/{name}")
+
+    def get_requests(self) -> list[FakeApiRequest]:
+        with self._lock:
+            return list(self._requests)
+
+    def get_url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("Fake API server is not started")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def get_variables(self, namespace: str, name: str) -> dict[str, str]:
+        with self._lock:
+            repository = self._require_repository(namespace, name)
+            return {
+                key: variable["value"]
+                for key, variable in repository["variables"].items()
+            }
+
+    def inject_error(
+        self,
+        status_code: int = 429,
+        count: int = 1,
+        path: str | None = None,
+        retry_after: int = 1,
+    ) -> None:
+        """Answer the next ``count`` requests (matching ``path``, a regex) with an error."""
+        with self._lock:
+            self._errors.append(
+                {
+                    "count": count,
+                    "path": path,
+                    "retry_after": retry_after,
+                    "status_code": status_code,
+                }
+            )
+
+    def make_remote(self, io: IoManager | None = None, **kwargs: Any) -> AbstractRemote:
+        """Build a remote client talking to this server."""
+        from wexample_prompt.common.io_manager import IoManager
+
+        # No fixed delay between requests: only the server's own settings
+        # should shape the timings.
+        kwargs.setdefault("rate_limit_delay", 0.0)
+        return self.get_remote_class()(
+            io=io or IoManager(),
+            api_token="test_token",
+            base_url=self.get_base_url(),
+            **kwargs,
+        )
+
+    def protect_branch(self, namespace: str, name: str, branch: str) -> None:
+        with self._lock:
+            self._require_repository(namespace, name)["protected_branches"].add(branch)
+
+    def reset_requests(self) -> None:
+        """Forget recorded requests and the concurrency high-water mark."""
+        with self._lock:
+            self._requests.clear()
+            self._max_active_requests = self._active_requests
+
+    def set_pipeline_status(
+        self, namespace: str, name: str, pipeline_id: int, status: str
+    ) -> None:
+        with self._lock:
+            repository = self._require_repository(namespace, name)
+            repository["pipelines"][pipeline_id]["status"] = status
+
+    def start(self) -> AbstractFakeApiServer:
+        from http.server import ThreadingHTTPServer
+
+        if self._server is None:
+            self._server = ThreadingHTTPServer(
+                (self.host, self.port), self._create_handler_class()
+            )
+            self._server.daemon_threads = True
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                name="fake-api-server",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @abstract_method
+    def _get_api_path(self) -> str:
+        """Path of the API base URL on the server (e.g. ``/api/v4``)."""
+
+    @abstract_method
+    def _get_rate_limit_headers(
+        self, limit: int, remaining: int, reset_at: float
+    ) -> dict[str, str]:
+        """Rate limit headers, named as the forge names them."""
+
+    @abstract_method
+    def _get_routes(self) -> list[FakeApiRoute]:
+        """(method, path regex, handler) triples; the first full match is served."""
+
+    @abstract_method
+    def _paginate(
+        self, request: FakeApiRequest, items: list[Any]
+    ) -> tuple[list[Any], dict[str, str]]:
+        """Slice ``items`` to the requested page; returns it with paging headers."""
+
+    def _check_rate_limit(self) -> tuple[int, dict[str, str]] | None:
+        """Count one request; returns the 429 status and headers once exhausted."""
+        import math
+
+        if self.rate_limit is None:
+            return None
+
+        now = time.time()
+        if now >= self._rate_limit_reset_at:
+            self._rate_limit_count = 0
+            self._rate_limit_reset_at = now + self.rate_limit_window
+        self._rate_limit_count += 1
+
+        headers = self._get_rate_limit_headers(
+            self.rate_limit,
+            max(self.rate_limit - self._rate_limit_count, 0),
+            self._rate_limit_reset_at,
+        )
+        if self._rate_limit_count <= self.rate_limit:
+            return 200, headers
+        retry_after = math.ceil(self._rate_limit_reset_at - now)
+        return 429, {**headers, "Retry-After": str(retry_after)}
+
+    def _create_handler_class(self) -> type:
+        import json
+        from http.server import BaseHTTPRequestHandler
+
+        server = self
+
+        class FakeApiHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_DELETE(self) -> None:
+                self._serve()
+
+            def do_GET(self) -> None:
+                self._serve()
+
+            def do_HEAD(self) -> None:
+                self._serve()
+
+            def do_PATCH(self) -> None:
+                self._serve()
+
+            def do_POST(self) -> None:
+                self._serve()
+
+            def do_PUT(self) -> None:
+                self._serve()
+
+            def log_message(self, format: str, *args: Any) -> None:
+                # Keep the test output clean.
+                pass
+
+            def _serve(self) -> None:
+                raw_body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                try:
+                    body = json.loads(raw_body) if raw_body else None
+                except ValueError:
+                    body = None
+
+                status, payload, headers = server._handle(
+                    self.command, self.path, body, self.headers
+                )
+                content = b"" if payload is None else json.dumps(payload).encode()
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if content:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(content)
+
+        return FakeApiHandler
+
+    def _create_id(self) -> int:
+        with self._lock:
+            self._next_id += 1
+            return self._next_id - 1
+
+    def _dispatch(self, request: FakeApiRequest) -> FakeApiResponse:
+        for method, pattern, handler in self._get_routes():
+            if method != request.method:
+                continue
+            match = re.fullmatch(pattern, request.path)
+            if match:
+                return handler(request, match)
+        return 404, {"message": "Not Found"}
+
+    def _get_branch_sha(self, repository: dict[str, Any], branch: str) -> str:
+        """Head commit of a branch; branches spring into existence when asked for."""
+        import hashlib
+
+        if branch not in repository["branches"]:
+            seed = f"{repository['id']}:{branch}:{self._create_id()}"
+            repository["branches"][branch] = hashlib.sha1(seed.encode()).hexdigest()
+        return repository["branches"][branch]
+
+    def _handle(
+        self, method: str, raw_path: str, body: Any, headers: Any
+    ) -> tuple[int, Any, dict[str, str]]:
+        import hashlib
+        import json
+        from urllib.parse import parse_qsl, urlsplit
+
+        from wexample_filestate_git.testing.fake_api.fake_api_request import (
+            FakeApiRequest,
+        )
+
+        parts = urlsplit(raw_path)
+        path = parts.path
+        api_path = self._get_api_path()
+        if api_path and path.startswith(api_path):
+            path = path[len(api_path) :]
+        request = FakeApiRequest(
+            body=body,
+            method=method,
+            path=path.strip("/"),
+            query=dict(parse_qsl(parts.query)),
+        )
+
+        with self._lock:
+            self._requests.append(request)
+            self._active_requests += 1
+            self._max_active_requests = max(
+                self._max_active_requests, self._active_requests
+            )
+        try:
+            # Outside the lock: concurrent requests wait in parallel, as they
+            # would on a real server.
+            if self.latency:
+                time.sleep(self.latency)
+
+            with self._lock:
+                rate_limit = self._check_rate_limit()
+                rate_limit_headers = rate_limit[1] if rate_limit else {}
+                if rate_limit and rate_limit[0] == 429:
+                    return 429, {"message": "Rate limit exceeded"}, rate_limit_headers
+
+                error = self._pop_error(request)
+                if error is not None:
+                    return error
+
+                result = self._dispatch(request)
+        finally:
+            with self._lock:
+                self._active_requests -= 1
+
+        status, payload = result[0], result[1]
+        response_headers = {
+            **rate_limit_headers,
+            **(result[2] if len(result) > 2 else {}),
+        }
+
+        # Conditional requests, as both forges support them.
+        if method == "GET" and status == 200:
+            etag = '"' + hashlib.sha1(json.dumps(payload).encode()).hexdigest() + '"'
+            response_headers["ETag"] = etag
+            if headers.get("If-None-Match") == etag:
+                return 304, None, response_headers
+
+        return status, payload, response_headers
+
+    def _pop_error(self, request: FakeApiRequest) -> FakeApiResponse | None:
+        for error in self._errors:
+            if error["path"] is not None and not re.search(error["path"], request.path):
+                continue
+            error["count"] -= 1
+            if error["count"] <= 0:
+                self._errors.remove(error)
+            headers = {}
+            if error["status_code"] == 429:
+                headers["Retry-After"] = str(error["retry_after"])
+            return error["status_code"], {"message": "Injected error"}, headers
+        return None
+
+    def _require_repository(self, namespace: str, name: str) -> dict[str, Any]:
+        repository = self._repositories.get(f"{namespace}/{name}")
+        if repository is None:
+            raise KeyError(f"Unknown repository: {namespace}/{name}")
+        return repository
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class FakeApiRequest(BaseClass):
+    """One request received by a fake API server."""
+
+    body: Any = public_field(default=None, description="Decoded JSON body")
+    method: str = public_field(description="HTTP method")
+    path: str = public_field(
+        description="Path relative to the API base URL, still percent-encoded"
+    )
+    query: dict[str, str] = public_field(
+        factory=dict, description="Query parameters (first value of each)"
+    )
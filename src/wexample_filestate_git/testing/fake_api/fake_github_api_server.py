@@ -0,0 +1,439 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_filestate_git.testing.fake_api.abstract_fake_api_server import (
+    FAKE_PIPELINE_TERMINAL_STATUSES,
+    AbstractFakeApiServer,
+)
+
+if TYPE_CHECKING:
+    from wexample_filestate_git.remote.abstract_remote import AbstractRemote
+    from wexample_filestate_git.testing.fake_api.abstract_fake_api_server import (
+        FakeApiResponse,
+        FakeApiRoute,
+    )
+    from wexample_filestate_git.testing.fake_api.fake_api_request import (
+        FakeApiRequest,
+    )
+
+_OWNER = r"(?P<owner>repos/[^/]+/[^/]+|orgs/[^/]+)"
+_REPO = r"repos/(?P<namespace>[^/]+)/(?P<name>[^/]+)"
+
+# GitLab pipeline statuses as GitHub (status, conclusion).
+_WORKFLOW_RUN_STATES = {
+    "canceled": ("completed", "cancelled"),
+    "created": ("queued", None),
+    "failed": ("completed", "failure"),
+    "pending": ("queued", None),
+    "running": ("in_progress", None),
+    "skipped": ("completed", "skipped"),
+    "success": ("completed", "success"),
+}
+
+
+@base_class
+class FakeGithubApiServer(AbstractFakeApiServer):
+    """Fake GitHub REST / GraphQL API, as used by ``GithubRemote``.
+
+    Actions secrets are sealed by the client; when PyNaCl is installed the
+    server holds the matching private keys and stores decrypted values, so
+    ``get_variables`` returns what was sent.
+    """
+
+    _private_keys: dict[str, Any] = private_field(
+        factory=dict, description="Actions secrets private key per owner"
+    )
+    _secret_repositories: dict[str, set[int]] = private_field(
+        factory=dict, description="Repository IDs selected per organization secret"
+    )
+
+    @classmethod
+    def get_remote_class(cls) -> type[AbstractRemote]:
+        from wexample_filestate_git.remote.github_remote import GithubRemote
+
+        return GithubRemote
+
+    def get_secret_repository_ids(self, org: str, key: str) -> set[int]:
+        with self._lock:
+            return set(self._secret_repositories.get(f"{org}/{key}", set()))
+
+    def _get_api_path(self) -> str:
+        return ""
+
+    def _get_owner_variables(self, owner: str) -> dict[str, dict[str, Any]] | None:
+        kind, _, path = owner.partition("/")
+        if kind == "orgs":
+            return self._group_variables.setdefault(path, {})
+        repository = self._repositories.get(path)
+        return repository["variables"] if repository else None
+
+    def _get_rate_limit_headers(
+        self, limit: int, remaining: int, reset_at: float
+    ) -> dict[str, str]:
+        return {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(int(reset_at)),
+            "X-RateLimit-Resource": "core",
+        }
+
+    def _get_repository_from_match(self, match: re.Match) -> dict[str, Any] | None:
+        return self._repositories.get(f"{match['namespace']}/{match['name']}")
+
+    def _get_routes(self) -> list[FakeApiRoute]:
+        return [
+            ("HEAD", r"user", lambda request, match: (200, None)),
+            ("POST", r"graphql", self._graphql),
+            ("POST", r"orgs/(?P<org>[^/]+)/repos", self._create_repository),
+            ("GET", rf"{_OWNER}/actions/secrets", self._list_secrets),
+            ("GET", rf"{_OWNER}/actions/secrets/public-key", self._get_public_key),
+            ("GET", rf"{_OWNER}/actions/secrets/(?P<key>[^/]+)", self._get_secret),
+            ("PUT", rf"{_OWNER}/actions/secrets/(?P<key>[^/]+)", self._put_secret),
+            (
+                "GET",
+                r"orgs/(?P<org>[^/]+)/actions/secrets/(?P<key>[^/]+)/repositories",
+                self._list_secret_repositories,
+            ),
+            (
+                "PUT",
+                r"orgs/(?P<org>[^/]+)/actions/secrets/(?P<key>[^/]+)"
+                r"/repositories/(?P<id>\d+)",
+                self._add_secret_repository,
+            ),
+            ("GET", _REPO, self._get_repository),
+            ("GET", rf"{_REPO}/actions/runs", self._list_workflow_runs),
+            ("GET", rf"{_REPO}/actions/runs/(?P<id>\d+)", self._get_workflow_run),
+            (
+                "GET",
+                rf"{_REPO}/commits/(?P<sha>[^/]+)/check-runs",
+                self._list_check_runs,
+            ),
+            ("GET", rf"{_REPO}/pulls", self._list_pulls),
+            ("POST", rf"{_REPO}/pulls", self._create_pull),
+            ("GET", rf"{_REPO}/pulls/(?P<number>\d+)", self._get_pull),
+            ("PUT", rf"{_REPO}/pulls/(?P<number>\d+)/merge", self._merge_pull),
+        ]
+
+    def _paginate(
+        self, request: FakeApiRequest, items: list[Any]
+    ) -> tuple[list[Any], dict[str, str]]:
+        from urllib.parse import urlencode
+
+        page = int(request.query.get("page") or 1)
+        per_page = int(request.query.get("per_page") or 30)
+        start = (page - 1) * per_page
+        headers = {}
+        if start + per_page < len(items):
+            query = urlencode({**request.query, "page": page + 1})
+            headers["Link"] = (
+                f'<{self.get_base_url()}/{request.path}?{query}>; rel="next"'
+            )
+        return items[start : start + per_page], headers
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+    def _serialize_pull(
+        self, repository: dict[str, Any], proposal: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            "base": {"ref": proposal["target_branch"]},
+            "head": {
+                "label": f"{repository['namespace']}:{proposal['source_branch']}",
+                "ref": proposal["source_branch"],
+                "sha": self._get_branch_sha(repository, proposal["source_branch"]),
+            },
+            "id": proposal["id"],
+            "merged": proposal["state"] == "merged",
+            "number": proposal["iid"],
+            "state": "open" if proposal["state"] == "opened" else "closed",
+            "title": proposal["title"],
+        }
+
+    def _serialize_repository(self, repository: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "default_branch": repository["default_branch"],
+            "description": repository["description"],
+            "full_name": f"{repository['namespace']}/{repository['name']}",
+            "id": repository["id"],
+            "name": repository["name"],
+            "owner": {"login": repository["namespace"]},
+            "private": repository["private"],
+        }
+
+    def _serialize_workflow_run(self, pipeline: dict[str, Any]) -> dict[str, Any]:
+        status, conclusion = _WORKFLOW_RUN_STATES.get(
+            pipeline["status"], ("completed", pipeline["status"])
+        )
+        return {
+            "conclusion": conclusion,
+            "head_branch": pipeline["ref"],
+            "head_sha": pipeline["sha"],
+            "id": pipeline["id"],
+            "name": "ci",
+            "status": status,
+        }
+
+    # ------------------------------------------------------------------
+    # Handlers
+    # ------------------------------------------------------------------
+    def _add_secret_repository(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        if match["key"] not in self._group_variables.get(match["org"], {}):
+            return 404, {"message": "Not Found"}
+        self._secret_repositories.setdefault(
+            f"{match['org']}/{match['key']}", set()
+        ).add(int(match["id"]))
+        return 204, None
+
+    def _create_pull(self, request: FakeApiRequest, match: re.Match) -> FakeApiResponse:
+        repository = self._get_repository_from_match(match)
+        if repository is None:
+            return 404, {"message": "Not Found"}
+        body = request.body or {}
+        proposal = {
+            "id": self._create_id(),
+            "iid": len(repository["proposals"]) + 1,
+            "source_branch": body.get("head"),
+            "state": "opened",
+            "target_branch": body.get("base"),
+            "title": body.get("title"),
+        }
+        repository["proposals"][proposal["iid"]] = proposal
+        return 201, self._serialize_pull(repository, proposal)
+
+    def _create_repository(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        body = request.body or {}
+        if f"{match['org']}/{body.get('name')}" in self._repositories:
+            return 422, {"message": "Repository creation failed."}
+        repository = self.add_repository(
+            match["org"],
+            body["name"],
+            private=bool(body.get("private")),
+            description=body.get("description") or "",
+        )
+        return 201, self._serialize_repository(repository)
+
+    def _get_public_key(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        import base64
+
+        from nacl.public import PrivateKey
+
+        owner = match["owner"]
+        if self._get_owner_variables(owner) is None:
+            return 404, {"message": "Not Found"}
+        private_key = self._private_keys.setdefault(owner, PrivateKey.generate())
+        return 200, {
+            "key": base64.b64encode(bytes(private_key.public_key)).decode(),
+            "key_id": f"key-{id(private_key)}",
+        }
+
+    def _get_pull(self, request: FakeApiRequest, match: re.Match) -> FakeApiResponse:
+        repository = self._get_repository_from_match(match)
+        proposal = (repository or {}).get("proposals", {}).get(int(match["number"]))
+        if proposal is None:
+            return 404, {"message": "Not Found"}
+        return 200, self._serialize_pull(repository, proposal)
+
+    def _get_repository(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        repository = self._get_repository_from_match(match)
+        if repository is None:
+            return 404, {"message": "Not Found"}
+        return 200, self._serialize_repository(repository)
+
+    def _get_secret(self, request: FakeApiRequest, match: re.Match) -> FakeApiResponse:
+        secret = (self._get_owner_variables(match["owner"]) or {}).get(match["key"])
+        if secret is None:
+            return 404, {"message": "Not Found"}
+        return 200, {"name": secret["key"], "updated_at": secret["updated_at"]}
+
+    def _get_workflow_run(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        repository = self._get_repository_from_match(match)
+        pipeline = (repository or {}).get("pipelines", {}).get(int(match["id"]))
+        if pipeline is None:
+            return 404, {"message": "Not Found"}
+        return 200, self._serialize_workflow_run(pipeline)
+
+    def _graphql(self, request: FakeApiRequest, match: re.Match) -> FakeApiResponse:
+        body = request.body or {}
+        variables = body.get("variables") or {}
+        data: dict[str, Any] = {}
+        errors: list[dict[str, Any]] = []
+        for alias, owner_var, name_var in re.findall(
+            r"(\w+): repository\(owner: \$(\w+), name: \$(\w+)\)",
+            body.get("query") or "",
+        ):
+            repository = self._repositories.get(
+                f"{variables.get(owner_var)}/{variables.get(name_var)}"
+            )
+            if repository is None:
+                data[alias] = None
+                errors.append({"path": [alias], "type": "NOT_FOUND"})
+                continue
+            default_branch = repository["default_branch"]
+            protected = sorted(repository["protected_branches"])
+            data[alias] = {
+                "branchProtectionRules": {
+                    "nodes": [{"pattern": pattern} for pattern in protected]
+                },
+                "databaseId": repository["id"],
+                "defaultBranchRef": {
+                    "branchProtectionRule": (
+                        {"pattern": default_branch}
+                        if default_branch in protected
+                        else None
+                    ),
+                    "name": default_branch,
+                },
+                "id": f"R_{repository['id']}",
+                "isArchived": False,
+                "isPrivate": repository["private"],
+                "name": repository["name"],
+                "owner": {"login": repository["namespace"]},
+            }
+        payload: dict[str, Any] = {"data": data}
+        if errors:
+            payload["errors"] = errors
+        return 200, payload
+
+    def _list_check_runs(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        repository = self._get_repository_from_match(match)
+        if repository is None:
+            return 404, {"message": "Not Found"}
+        runs = [
+            self._serialize_workflow_run(pipeline)
+            for pipeline in repository["pipelines"].values()
+            if pipeline["sha"] == match["sha"]
+        ]
+        page, headers = self._paginate(request, runs)
+        return 200, {"check_runs": page, "total_count": len(runs)}, headers
+
+    def _list_pulls(self, request: FakeApiRequest, match: re.Match) -> FakeApiResponse:
+        repository = self._get_repository_from_match(match)
+        if repository is None:
+            return 404, {"message": "Not Found"}
+        pulls = [
+            self._serialize_pull(repository, proposal)
+            for proposal in repository["proposals"].values()
+        ]
+        filters = {
+            "base": lambda pull: pull["base"]["ref"],
+            "head": lambda pull: pull["head"]["label"],
+            "state": lambda pull: pull["state"],
+        }
+        for name, get in filters.items():
+            if request.query.get(name) and request.query[name] != "all":
+                pulls = [pull for pull in pulls if get(pull) == request.query[name]]
+        page, headers = self._paginate(request, pulls)
+        return 200, page, headers
+
+    def _list_secret_repositories(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        if match["key"] not in self._group_variables.get(match["org"], {}):
+            return 404, {"message": "Not Found"}
+        ids = sorted(
+            self._secret_repositories.get(f"{match['org']}/{match['key']}", ())
+        )
+        page, headers = self._paginate(request, [{"id": i} for i in ids])
+        return 200, {"repositories": page, "total_count": len(ids)}, headers
+
+    def _list_secrets(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        secrets = self._get_owner_variables(match["owner"])
+        if secrets is None:
+            return 404, {"message": "Not Found"}
+        items = [
+            {"name": secret["key"], "updated_at": secret["updated_at"]}
+            for secret in secrets.values()
+        ]
+        page, headers = self._paginate(request, items)
+        return 200, {"secrets": page, "total_count": len(items)}, headers
+
+    def _list_workflow_runs(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        repository = self._get_repository_from_match(match)
+        if repository is None:
+            return 404, {"message": "Not Found"}
+        branch = request.query.get("branch")
+        runs = [
+            self._serialize_workflow_run(pipeline)
+            for pipeline in sorted(
+                repository["pipelines"].values(), key=lambda p: -p["id"]
+            )
+            if branch is None or pipeline["ref"] == branch
+        ]
+        page, headers = self._paginate(request, runs)
+        return 200, {"total_count": len(runs), "workflow_runs": page}, headers
+
+    def _merge_pull(self, request: FakeApiRequest, match: re.Match) -> FakeApiResponse:
+        repository = self._get_repository_from_match(match)
+        proposal = (repository or {}).get("proposals", {}).get(int(match["number"]))
+        if proposal is None:
+            return 404, {"message": "Not Found"}
+        if proposal["state"] != "opened":
+            return 405, {"message": "Pull Request is not mergeable"}
+        if any(
+            pipeline["sha"]
+            == self._get_branch_sha(repository, proposal["source_branch"])
+            and pipeline["status"] not in FAKE_PIPELINE_TERMINAL_STATUSES
+            for pipeline in repository["pipelines"].values()
+        ):
+            return 405, {"message": "Required status checks are pending"}
+        proposal["state"] = "merged"
+        # The merge moves the target branch to a new commit.
+        repository["branches"].pop(proposal["target_branch"], None)
+        sha = self._get_branch_sha(repository, proposal["target_branch"])
+        return 200, {
+            "merged": True,
+            "message": "Pull Request successfully merged",
+            "sha": sha,
+        }
+
+    def _put_secret(self, request: FakeApiRequest, match: re.Match) -> FakeApiResponse:
+        import base64
+        import datetime
+
+        owner = match["owner"]
+        secrets = self._get_owner_variables(owner)
+        body = request.body or {}
+        private_key = self._private_keys.get(owner)
+        if secrets is None:
+            return 404, {"message": "Not Found"}
+        if private_key is None or body.get("key_id") != f"key-{id(private_key)}":
+            return 422, {"message": "Bad key_id"}
+
+        from nacl.public import SealedBox
+
+        value = SealedBox(private_key).decrypt(
+            base64.b64decode(body.get("encrypted_value") or "")
+        )
+        created = match["key"] not in secrets
+        secrets[match["key"]] = {
+            "key": match["key"],
+            "updated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "value": value.decode(),
+        }
+        if owner.startswith("orgs/") and "selected_repository_ids" in body:
+            self._secret_repositories[f"{owner[5:]}/{match['key']}"] = set(
+                body["selected_repository_ids"]
+            )
+        return (201, {}) if created else (204, None)
@@ -0,0 +1,456 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+from wexample_filestate_git.testing.fake_api.abstract_fake_api_server import (
+    FAKE_PIPELINE_TERMINAL_STATUSES,
+    AbstractFakeApiServer,
+)
+
+if TYPE_CHECKING:
+    from wexample_filestate_git.remote.abstract_remote import AbstractRemote
+    from wexample_filestate_git.testing.fake_api.abstract_fake_api_server import (
+        FakeApiResponse,
+        FakeApiRoute,
+    )
+    from wexample_filestate_git.testing.fake_api.fake_api_request import (
+        FakeApiRequest,
+    )
+
+_OWNER = r"(?P<owner>(?:projects|groups)/[^/]+)"
+_PROJECT = r"projects/(?P<project>[^/]+)"
+
+
+@base_class
+class FakeGitlabApiServer(AbstractFakeApiServer):
+    """Fake GitLab REST API (``/api/v4``), as used by ``GitlabRemote``.
+
+    Projects are addressed by numeric ID or URL-encoded path, and groups
+    exist as soon as a project lives in them. Merge requests are always
+    mergeable, unless a pipeline of their source branch is still running.
+    """
+
+    _group_ids: dict[str, int] = private_field(
+        factory=dict, description="Numeric ID of each group, assigned on first use"
+    )
+
+    @classmethod
+    def get_remote_class(cls) -> type[AbstractRemote]:
+        from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+
+        return GitlabRemote
+
+    def _get_api_path(self) -> str:
+        return "/api/v4"
+
+    def _get_group_id(self, group: str) -> int:
+        """Stable ID of a group (namespace), assigned on first use."""
+        if group not in self._group_ids:
+            self._group_ids[group] = self._create_id()
+        return self._group_ids[group]
+
+    def _get_groups(self) -> set[str]:
+        groups: set[str] = set()
+        for repository in self._repositories.values():
+            parts = repository["namespace"].split("/")
+            groups.update("/".join(parts[: i + 1]) for i in range(len(parts)))
+        groups.update(self._group_variables)
+        return groups
+
+    def _get_owner_variables(self, owner: str) -> dict[str, dict[str, Any]] | None:
+        from urllib.parse import unquote
+
+        kind, _, reference = owner.partition("/")
+        if kind == "groups":
+            group = unquote(reference)
+            if group not in self._get_groups():
+                return None
+            return self._group_variables.setdefault(group, {})
+        repository = self._get_project(reference)
+        return repository["variables"] if repository else None
+
+    def _get_project(self, reference: str) -> dict[str, Any] | None:
+        """Resolve a numeric project ID or a URL-encoded path."""
+        from urllib.parse import unquote
+
+        if reference.isdigit():
+            return next(
+                (r for r in self._repositories.values() if r["id"] == int(reference)),
+                None,
+            )
+        return self._repositories.get(unquote(reference))
+
+    def _get_rate_limit_headers(
+        self, limit: int, remaining: int, reset_at: float
+    ) -> dict[str, str]:
+        return {
+            "RateLimit-Limit": str(limit),
+            "RateLimit-Remaining": str(remaining),
+            "RateLimit-Reset": str(int(reset_at)),
+        }
+
+    def _get_routes(self) -> list[FakeApiRoute]:
+        return [
+            ("HEAD", r"user", lambda request, match: (200, None)),
+            ("GET", r"namespaces", self._list_namespaces),
+            ("POST", r"projects", self._create_project),
+            ("GET", r"groups/(?P<group>[^/]+)/projects", self._list_group_projects),
+            ("GET", rf"{_OWNER}/variables", self._list_variables),
+            ("POST", rf"{_OWNER}/variables", self._create_variable),
+            ("GET", rf"{_OWNER}/variables/(?P<key>[^/]+)", self._get_variable),
+            ("PUT", rf"{_OWNER}/variables/(?P<key>[^/]+)", self._update_variable),
+            ("GET", _PROJECT, self._get_project_response),
+            ("PUT", _PROJECT, self._update_project),
+            ("GET", rf"{_PROJECT}/merge_requests", self._list_merge_requests),
+            ("POST", rf"{_PROJECT}/merge_requests", self._create_merge_request),
+            (
+                "GET",
+                rf"{_PROJECT}/merge_requests/(?P<iid>\d+)",
+                self._get_merge_request,
+            ),
+            (
+                "PUT",
+                rf"{_PROJECT}/merge_requests/(?P<iid>\d+)/merge",
+                self._merge_merge_request,
+            ),
+            (
+                "GET",
+                rf"{_PROJECT}/merge_requests/(?P<iid>\d+)/pipelines",
+                self._list_merge_request_pipelines,
+            ),
+            ("GET", rf"{_PROJECT}/pipelines", self._list_pipelines),
+            ("GET", rf"{_PROJECT}/pipelines/(?P<id>\d+)", self._get_pipeline),
+            (
+                "DELETE",
+                rf"{_PROJECT}/protected_branches/(?P<branch>[^/]+)",
+                self._unprotect_branch,
+            ),
+        ]
+
+    def _paginate(
+        self, request: FakeApiRequest, items: list[Any]
+    ) -> tuple[list[Any], dict[str, str]]:
+        page = int(request.query.get("page") or 1)
+        per_page = int(request.query.get("per_page") or 20)
+        start = (page - 1) * per_page
+        headers = {
+            "X-Page": str(page),
+            "X-Per-Page": str(per_page),
+            "X-Total": str(len(items)),
+        }
+        if start + per_page < len(items):
+            headers["X-Next-Page"] = str(page + 1)
+        return items[start : start + per_page], headers
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+    def _serialize_merge_request(
+        self, repository: dict[str, Any], proposal: dict[str, Any]
+    ) -> dict[str, Any]:
+        mergeable = proposal["state"] == "opened" and not self._has_running_pipeline(
+            repository, proposal["source_branch"]
+        )
+        return {
+            "detailed_merge_status": "mergeable" if mergeable else "not_open",
+            "id": proposal["id"],
+            "iid": proposal["iid"],
+            "project_id": repository["id"],
+            "sha": self._get_branch_sha(repository, proposal["source_branch"]),
+            "source_branch": proposal["source_branch"],
+            "state": proposal["state"],
+            "target_branch": proposal["target_branch"],
+            "title": proposal["title"],
+        }
+
+    def _serialize_pipeline(self, pipeline: dict[str, Any]) -> dict[str, Any]:
+        return {key: pipeline[key] for key in ("id", "ref", "sha", "status")}
+
+    def _serialize_project(self, repository: dict[str, Any]) -> dict[str, Any]:
+        namespace = repository["namespace"]
+        return {
+            "default_branch": repository["default_branch"],
+            "description": repository["description"],
+            "id": repository["id"],
+            "name": repository["name"],
+            "namespace": {
+                "full_path": namespace,
+                "id": self._get_group_id(namespace),
+                "path": namespace.rsplit("/", 1)[-1],
+            },
+            "path": repository["name"],
+            "path_with_namespace": f"{namespace}/{repository['name']}",
+            "visibility": "private" if repository["private"] else "public",
+        }
+
+    def _serialize_variable(self, variable: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "key": variable["key"],
+            "masked": variable["masked"],
+            "protected": variable["protected"],
+            "value": variable["value"],
+        }
+
+    # ------------------------------------------------------------------
+    # Handlers
+    # ------------------------------------------------------------------
+    def _create_merge_request(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        repository = self._get_project(match["project"])
+        if repository is None:
+            return 404, {"message": "404 Project Not Found"}
+        body = request.body or {}
+        proposal = {
+            "id": self._create_id(),
+            "iid": len(repository["proposals"]) + 1,
+            "source_branch": body.get("source_branch"),
+            "state": "opened",
+            "target_branch": body.get("target_branch"),
+            "title": body.get("title"),
+        }
+        repository["proposals"][proposal["iid"]] = proposal
+        return 201, self._serialize_merge_request(repository, proposal)
+
+    def _create_project(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        body = request.body or {}
+        namespace = next(
+            (
+                group
+                for group in self._get_groups()
+                if self._get_group_id(group) == body.get("namespace_id")
+            ),
+            None,
+        )
+        if namespace is None:
+            return 404, {"message": "404 Namespace Not Found"}
+        if f"{namespace}/{body.get('path')}" in self._repositories:
+            return 400, {"message": {"path": ["has already been taken"]}}
+        repository = self.add_repository(
+            namespace,
+            body["path"],
+            private=body.get("visibility") == "private",
+            description=body.get("description") or "",
+        )
+        return 201, self._serialize_project(repository)
+
+    def _create_variable(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        variables = self._get_owner_variables(match["owner"])
+        body = request.body or {}
+        if variables is None:
+            return 404, {"message": "404 Not Found"}
+        if body.get("key") in variables:
+            return 400, {"message": {"key": ["has already been taken"]}}
+        variables[body["key"]] = self._build_variable(body["key"], body)
+        return 201, self._serialize_variable(variables[body["key"]])
+
+    def _get_merge_request(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        repository = self._get_project(match["project"])
+        proposal = (repository or {}).get("proposals", {}).get(int(match["iid"]))
+        if proposal is None:
+            return 404, {"message": "404 Not found"}
+        return 200, self._serialize_merge_request(repository, proposal)
+
+    def _get_pipeline(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        repository = self._get_project(match["project"])
+        pipeline = (repository or {}).get("pipelines", {}).get(int(match["id"]))
+        if pipeline is None:
+            return 404, {"message": "404 Not found"}
+        return 200, self._serialize_pipeline(pipeline)
+
+    def _get_project_response(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        repository = self._get_project(match["project"])
+        if repository is None:
+            return 404, {"message": "404 Project Not Found"}
+        return 200, self._serialize_project(repository)
+
+    def _get_variable(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        variable = (self._get_owner_variables(match["owner"]) or {}).get(match["key"])
+        if variable is None:
+            return 404, {"message": "404 Variable Not Found"}
+        return 200, self._serialize_variable(variable)
+
+    def _list_group_projects(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        from urllib.parse import unquote
+
+        group = unquote(match["group"])
+        if group not in self._get_groups():
+            return 404, {"message": "404 Group Not Found"}
+        include_subgroups = request.query.get("include_subgroups") in ("True", "true")
+        projects = [
+            self._serialize_project(repository)
+            for repository in sorted(self._repositories.values(), key=lambda r: r["id"])
+            if repository["namespace"] == group
+            or (include_subgroups and repository["namespace"].startswith(f"{group}/"))
+        ]
+        page, headers = self._paginate(request, projects)
+        return 200, page, headers
+
+    def _list_merge_request_pipelines(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        repository = self._get_project(match["project"])
+        proposal = (repository or {}).get("proposals", {}).get(int(match["iid"]))
+        if proposal is None:
+            return 404, {"message": "404 Not found"}
+        sha = self._get_branch_sha(repository, proposal["source_branch"])
+        pipelines = [
+            self._serialize_pipeline(pipeline)
+            for pipeline in sorted(
+                repository["pipelines"].values(), key=lambda p: -p["id"]
+            )
+            if pipeline["sha"] == sha
+        ]
+        page, headers = self._paginate(request, pipelines)
+        return 200, page, headers
+
+    def _list_merge_requests(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        repository = self._get_project(match["project"])
+        if repository is None:
+            return 404, {"message": "404 Project Not Found"}
+        proposals = [
+            self._serialize_merge_request(repository, proposal)
+            for proposal in repository["proposals"].values()
+        ]
+        for name in ("source_branch", "target_branch", "state"):
+            if request.query.get(name) and request.query[name] != "all":
+                proposals = [p for p in proposals if p[name] == request.query[name]]
+        page, headers = self._paginate(request, proposals)
+        return 200, page, headers
+
+    def _list_namespaces(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        search = request.query.get("search") or ""
+        namespaces = [
+            {
+                "full_path": group,
+                "id": self._get_group_id(group),
+                "path": group.rsplit("/", 1)[-1],
+            }
+            for group in sorted(self._get_groups())
+            if search in group
+        ]
+        page, headers = self._paginate(request, namespaces)
+        return 200, page, headers
+
+    def _list_pipelines(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        repository = self._get_project(match["project"])
+        if repository is None:
+            return 404, {"message": "404 Project Not Found"}
+        ref = request.query.get("ref")
+        pipelines = [
+            self._serialize_pipeline(pipeline)
+            for pipeline in sorted(
+                repository["pipelines"].values(),
+                key=lambda p: p["id"],
+                reverse=request.query.get("sort", "desc") == "desc",
+            )
+            if ref is None or pipeline["ref"] == ref
+        ]
+        page, headers = self._paginate(request, pipelines)
+        return 200, page, headers
+
+    def _list_variables(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        variables = self._get_owner_variables(match["owner"])
+        if variables is None:
+            return 404, {"message": "404 Not Found"}
+        page, headers = self._paginate(
+            request, [self._serialize_variable(v) for v in variables.values()]
+        )
+        return 200, page, headers
+
+    def _merge_merge_request(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        repository = self._get_project(match["project"])
+        proposal = (repository or {}).get("proposals", {}).get(int(match["iid"]))
+        if proposal is None:
+            return 404, {"message": "404 Not found"}
+        if proposal["state"] != "opened" or self._has_running_pipeline(
+            repository, proposal["source_branch"]
+        ):
+            return 405, {"message": "405 Method Not Allowed"}
+        proposal["state"] = "merged"
+        # The merge moves the target branch to a new commit.
+        repository["branches"].pop(proposal["target_branch"], None)
+        return 200, self._serialize_merge_request(repository, proposal)
+
+    def _unprotect_branch(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        from urllib.parse import unquote
+
+        repository = self._get_project(match["project"])
+        branch = unquote(match["branch"])
+        if repository is None or branch not in repository["protected_branches"]:
+            return 404, {"message": "404 Not found"}
+        repository["protected_branches"].discard(branch)
+        return 204, None
+
+    def _update_project(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        repository = self._get_project(match["project"])
+        if repository is None:
+            return 404, {"message": "404 Project Not Found"}
+        body = request.body or {}
+        for key in ("default_branch", "description"):
+            if key in body:
+                repository[key] = body[key]
+        return 200, self._serialize_project(repository)
+
+    def _update_variable(
+        self, request: FakeApiRequest, match: re.Match
+    ) -> FakeApiResponse:
+        variables = self._get_owner_variables(match["owner"])
+        if variables is None or match["key"] not in variables:
+            return 404, {"message": "404 Variable Not Found"}
+        variables[match["key"]] = self._build_variable(match["key"], request.body or {})
+        return 200, self._serialize_variable(variables[match["key"]])
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _build_variable(self, key: str, body: dict[str, Any]) -> dict[str, Any]:
+        import datetime
+
+        return {
+            "key": key,
+            "masked": bool(body.get("masked")),
+            "protected": bool(body.get("protected")),
+            "updated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "value": body.get("value"),
+        }
+
+    def _has_running_pipeline(self, repository: dict[str, Any], branch: str) -> bool:
+        sha = self._get_branch_sha(repository, branch)
+        return any(
+            pipeline["sha"] == sha
+            and pipeline["status"] not in FAKE_PIPELINE_TERMINAL_STATUSES
+            for pipeline in repository["pipelines"].values()
+        )
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    import socket
+
+
+@base_class
+class Http2TestServer(BaseClass):
+    """Minimal cleartext HTTP/2 server (prior knowledge), built on ``h2``.
+
+    Answers every request with a small JSON body after ``latency`` seconds;
+    streams of one connection are answered concurrently. Counts the TCP
+    connections it accepted and the most streams it answered at once, and can
+    drop connections right after receiving a request, as a server going away.
+    """
+
+    drop_requests: int = public_field(
+        default=0,
+        description="Number of requests whose connection is closed instead of answered",
+    )
+    host: str = public_field(default="127.0.0.1", description="Interface to bind")
+    latency: float = public_field(
+        default=0.0, description="Seconds before each response is sent"
+    )
+    _active_streams: int = private_field(
+        default=0, description="Streams currently being answered"
+    )
+    _connections: int = private_field(
+        default=0, description="TCP connections accepted so far"
+    )
+    _dropped: int = private_field(default=0, description="Requests dropped so far")
+    _lock: threading.Lock = private_field(
+        factory=threading.Lock, description="Guards the counters"
+    )
+    _max_active_streams: int = private_field(
+        default=0, description="Most streams answered at the same time"
+    )
+    _requests: int = private_field(default=0, description="Requests answered so far")
+    _socket: socket.socket | None = private_field(
+        default=None, description="Listening socket"
+    )
+    _thread: threading.Thread | None = private_field(
+        default=None, description="Thread accepting connections"
+    )
+
+    def get_connection_count(self) -> int:
+        with self._lock:
+            return self._connections
+
+    def get_dropped_count(self) -> int:
+        with self._lock:
+            return self._dropped
+
+    def get_max_concurrent_streams(self) -> int:
+        with self._lock:
+            return self._max_active_streams
+
+    def get_request_count(self) -> int:
+        with self._lock:
+            return self._requests
+
+    def get_url(self) -> str:
+        if self._socket is None:
+            raise RuntimeError("HTTP/2 test server is not started")
+        host, port = self._socket.getsockname()[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> Http2TestServer:
+        import socket
+
+        if self._socket is None:
+            self._socket = socket.create_server((self.host, 0))
+            self._thread = threading.Thread(
+                target=self._accept, name="http2-test-server", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        import socket
+
+        if self._socket is not None:
+            try:
+                self._socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._socket.close()
+            self._socket = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _accept(self) -> None:
+        while self._socket is not None:
+            try:
+                connection, _ = self._socket.accept()
+            except OSError:
+                return
+            with self._lock:
+                self._connections += 1
+            threading.Thread(
+                target=self._serve, args=(connection,), daemon=True
+            ).start()
+
+    def _respond(
+        self,
+        h2_connection: Any,
+        connection: socket.socket,
+        write_lock: threading.Lock,
+        stream_id: int,
+        path: str,
+    ) -> None:
+        import json
+
+        with self._lock:
+            self._active_streams += 1
+            self._max_active_streams = max(
+                self._max_active_streams, self._active_streams
+            )
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self._active_streams -= 1
+        body = json.dumps({"path": path, "stream_id": stream_id}).encode()
+        with write_lock:
+            h2_connection.send_headers(
+                stream_id,
+                [
+                    (":status", "200"),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(body))),
+                ],
+            )
+            h2_connection.send_data(stream_id, body, end_stream=True)
+            try:
+                connection.sendall(h2_connection.data_to_send())
+            except OSError:
+                return
+        with self._lock:
+            self._requests += 1
+
+    def _serve(self, connection: socket.socket) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        h2_connection = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        write_lock = threading.Lock()
+        paths: dict[int, str] = {}
+        with write_lock:
+            h2_connection.initiate_connection()
+            connection.sendall(h2_connection.data_to_send())
+
+        with connection:
+            while True:
+                try:
+                    data = connection.recv(65535)
+                except OSError:
+                    return
+                if not data:
+                    return
+                with write_lock:
+                    try:
+                        events = h2_connection.receive_data(data)
+                    except Exception:
+                        # Not HTTP/2 (e.g. an HTTP/1.1 client): drop it.
+                        return
+                    connection.sendall(h2_connection.data_to_send())
+
+                for event in events:
+                    if isinstance(event, h2.events.RequestReceived):
+                        headers = {
+                            (k.decode() if isinstance(k, bytes) else k): (
+                                v.decode() if isinstance(v, bytes) else v
+                            )
+                            for k, v in event.headers
+                        }
+                        paths[event.stream_id] = headers.get(":path", "/")
+                    elif isinstance(event, h2.events.DataReceived):
+                        with write_lock:
+                            h2_connection.acknowledge_received_data(
+                                event.flow_controlled_length, event.stream_id
+                            )
+                    elif isinstance(event, h2.events.StreamEnded):
+                        if self._take_drop():
+                            return
+                        threading.Thread(
+                            target=self._respond,
+                            args=(
+                                h2_connection,
+                                connection,
+                                write_lock,
+                                event.stream_id,
+                                paths.pop(event.stream_id, "/"),
+                            ),
+                            daemon=True,
+                        ).start()
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+
+    def _take_drop(self) -> bool:
+        with self._lock:
+            if self._dropped >= self.drop_requests:
+                return False
+            self._dropped += 1
+            return True
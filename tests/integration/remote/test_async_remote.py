@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from wexample_filestate_git.remote.async_gitlab_remote import AsyncGitlabRemote
+from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+
+
+class TestAsyncRemote:
+    """Test cases for the asyncio remote clients."""
+
+    @pytest.fixture
+    def remote(self) -> AsyncGitlabRemote:
+        from wexample_prompt.common.io_manager import IoManager
+
+        return AsyncGitlabRemote(
+            remote=GitlabRemote(
+                io=IoManager(), api_token="test_token", rate_limit_delay=0.0
+            )
+        )
+
+    def test_poll_pipelines_concurrently(self, remote, monkeypatch) -> None:
+        statuses = {
+            1: iter(["running", "success"]),
+            2: iter(["pending", "running", "failed"]),
+        }
+
+        def get_pipeline(namespace: str, name: str, pipeline_id: int) -> dict:
+            return {"id": pipeline_id, "status": next(statuses[pipeline_id])}
+
+        monkeypatch.setattr(remote.remote, "get_pipeline", get_pipeline)
+
+        async def poll_all() -> list[str]:
+            return await asyncio.gather(
+                remote.poll_pipeline("ns", "repo-1", 1, timeout=5, interval=0),
+                remote.poll_pipeline("ns", "repo-2", 2, timeout=5, interval=0),
+            )
+
+        assert asyncio.run(poll_all()) == ["success", "failed"]
+
+    def test_calls_are_bounded_by_max_concurrency(self, remote, monkeypatch) -> None:
+        import threading
+        import time
+
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def check_repository_exists(name: str, namespace: str) -> bool:
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return True
+
+        monkeypatch.setattr(
+            remote.remote, "check_repository_exists", check_repository_exists
+        )
+        remote.max_concurrency = 2
+
+        async def check_all() -> list[bool]:
+            return await asyncio.gather(
+                *(remote.check_repository_exists(f"repo-{i}", "ns") for i in range(6))
+            )
+
+        assert all(asyncio.run(check_all()))
+        assert in_flight[1] == 2
+
+    def test_poll_pipeline_waits_on_webhook_events(self, remote, monkeypatch) -> None:
+        import threading
+
+        from wexample_filestate_git.remote.pipeline.pipeline_webhook_receiver import (
+            PipelineWebhookReceiver,
+        )
+
+        receiver = PipelineWebhookReceiver()
+        remote.remote.webhook_receiver = receiver
+        fetches = []
+        monkeypatch.setattr(
+            remote.remote,
+            "get_pipeline",
+            lambda *args: fetches.append(args) or {"id": 31, "status": "running"},
+        )
+        event = {
+            "object_kind": "pipeline",
+            "object_attributes": {"id": 31, "status": "success"},
+            "project": {"path_with_namespace": "ns/repo"},
+        }
+        threading.Timer(0.05, receiver.handle_event, ("Pipeline Hook", event)).start()
+
+        status = asyncio.run(remote.poll_pipeline("ns", "repo", 31, interval=60))
+
+        assert status == "success"
+        assert len(fetches) == 1
+
+    def test_webhook_waits_hold_no_worker_thread(self, remote, monkeypatch) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        from wexample_filestate_git.remote.pipeline.pipeline_webhook_receiver import (
+            PipelineWebhookReceiver,
+        )
+
+        receiver = PipelineWebhookReceiver()
+        remote.remote.webhook_receiver = receiver
+        pipeline_ids = list(range(1, 9))
+        monkeypatch.setattr(
+            remote.remote,
+            "get_pipeline",
+            lambda namespace, name, pipeline_id: {
+                "id": pipeline_id,
+                "status": "running",
+            },
+        )
+        monkeypatch.setattr(remote.remote, "get_default_branch", lambda *args: "main")
+
+        async def run() -> list[str]:
+            # Fewer worker threads than waiting polls.
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(2))
+            polls = [
+                asyncio.create_task(
+                    remote.poll_pipeline("ns", "repo", pipeline_id, timeout=5)
+                )
+                for pipeline_id in pipeline_ids
+            ]
+            await asyncio.sleep(0.2)
+
+            # Other calls still get a thread while every poll waits.
+            assert (
+                await asyncio.wait_for(remote.get_default_branch("ns", "repo"), 2)
+                == "main"
+            )
+
+            for pipeline_id in pipeline_ids:
+                receiver.handle_event(
+                    "Pipeline Hook",
+                    {
+                        "object_kind": "pipeline",
+                        "object_attributes": {"id": pipeline_id, "status": "success"},
+                        "project": {"path_with_namespace": "ns/repo"},
+                    },
+                )
+            return await asyncio.gather(*polls)
+
+        assert asyncio.run(run()) == ["success"] * len(pipeline_ids)
+
+    def test_request_methods_are_mirrored(self) -> None:
+        import inspect
+
+        from wexample_api.common.abstract_gateway import AbstractGateway
+
+        from wexample_filestate_git.remote.abstract_async_remote import (
+            AbstractAsyncRemote,
+        )
+        from wexample_filestate_git.remote.abstract_remote import AbstractRemote
+
+        # Class-level helpers, iterators and transport helpers stay on `remote`.
+        not_mirrored = {
+            "build_registry_kwargs",
+            "build_remote_api_url_from_repo",
+            "check_connection",
+            "get_circuit_breaker",
+            "get_pipeline_status",
+            "get_rate_limit_budget",
+            "get_rate_limit_scheduler",
+            "is_pipeline_terminal",
+            "iter_branch_pipelines",
+            "iter_paginated",
+            "probe_host",
+        }
+        sync_methods = {
+            name
+            for name, _ in inspect.getmembers(AbstractRemote, callable)
+            if not name.startswith("_") and not hasattr(AbstractGateway, name)
+        }
+
+        assert sync_methods - not_mirrored <= set(dir(AbstractAsyncRemote))
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from wexample_filestate_git.remote.cache.memory_cache_store import MemoryCacheStore
+from wexample_filestate_git.remote.cache.sqlite_cache_store import SqliteCacheStore
+
+
+class TestCacheStore:
+    """Test cases for the TTL-aware cache stores."""
+
+    @pytest.fixture(params=["memory", "sqlite"])
+    def store(self, request, tmp_path):
+        if request.param == "memory":
+            return MemoryCacheStore()
+        return SqliteCacheStore(path=tmp_path / "cache.sqlite3")
+
+    def test_entries_expire_after_their_ttl(self, store, monkeypatch) -> None:
+        now = time.time()
+        store.set("remote_exists:a", True, ttl=3600)
+        store.set("remote_exists:b", False, ttl=60)
+        store.set("pinned", {"id": 1})
+
+        monkeypatch.setattr(time, "time", lambda: now + 120)
+
+        assert store.purge_expired() == 1
+        assert store.get("remote_exists:a") is True
+        assert store.get("remote_exists:b") is None
+        assert store.get("pinned") == {"id": 1}
+
+    def test_invalidation(self, store) -> None:
+        store.set("remote_exists:a", True)
+        store.set("remote_exists:b", True)
+        store.set("remote_exists_b", True)
+        store.set("other", True)
+
+        store.delete("other")
+        assert store.delete_prefix("remote_exists:") == 2
+
+        assert store.get("other") is None
+        assert store.get("remote_exists:a") is None
+        assert store.get("remote_exists_b") is True
+
+    def test_sqlite_entries_are_shared_between_processes(self, tmp_path) -> None:
+        import subprocess
+        import sys
+
+        path = tmp_path / "cache.sqlite3"
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; "
+                "from wexample_filestate_git.remote.cache.sqlite_cache_store "
+                "import SqliteCacheStore; "
+                "SqliteCacheStore(path=sys.argv[1]).set('key', [1, 2], ttl=60)",
+                str(path),
+            ],
+            check=True,
+        )
+
+        assert SqliteCacheStore(path=path).get("key") == [1, 2]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from wexample_filestate_git.remote.cache.ci_variable_ledger import CiVariableLedger
+
+REMOTE_URL = "git@gitlab.com:test-namespace/test-repo.git"
+
+
+class TestCiVariableLedger:
+    """Test cases for the CI variable sync ledger."""
+
+    def test_pushed_values_are_known_by_later_runs(self, tmp_path) -> None:
+        path = tmp_path / "ledger.json"
+        CiVariableLedger(path=path).record(
+            REMOTE_URL, "TOKEN", "s3cret", updated_at="2026-01-01T00:00:00Z"
+        )
+
+        ledger = CiVariableLedger(path=path)
+
+        assert ledger.is_synced(REMOTE_URL, "TOKEN", "s3cret")
+        assert not ledger.is_synced(REMOTE_URL, "TOKEN", "rotated")
+        assert not ledger.is_synced("git@gitlab.com:other/repo.git", "TOKEN", "s3cret")
+        assert ledger.get_entry(REMOTE_URL, "TOKEN")["updated_at"] == (
+            "2026-01-01T00:00:00Z"
+        )
+
+    def test_values_are_not_stored(self, tmp_path) -> None:
+        path = tmp_path / "ledger.json"
+        CiVariableLedger(path=path).record(REMOTE_URL, "TOKEN", "s3cret")
+
+        assert "s3cret" not in path.read_text()
+
+    def test_forget(self, tmp_path) -> None:
+        ledger = CiVariableLedger(path=tmp_path / "ledger.json")
+        ledger.record(REMOTE_URL, "TOKEN", "s3cret")
+        ledger.forget(REMOTE_URL, "TOKEN")
+
+        assert not CiVariableLedger(path=tmp_path / "ledger.json").is_synced(
+            REMOTE_URL, "TOKEN", "s3cret"
+        )
+
+    def test_concurrent_ledgers_merge_their_entries(self, tmp_path) -> None:
+        path = tmp_path / "ledger.json"
+        first = CiVariableLedger(path=path)
+        second = CiVariableLedger(path=path)
+        # Both loaded before either wrote, as parallel fleet runs would.
+        assert not first.is_synced(REMOTE_URL, "TOKEN", "s3cret")
+        assert not second.is_synced(REMOTE_URL, "OTHER", "value")
+
+        first.record(REMOTE_URL, "TOKEN", "s3cret")
+        second.record(REMOTE_URL, "OTHER", "value")
+
+        ledger = CiVariableLedger(path=path)
+        assert ledger.is_synced(REMOTE_URL, "TOKEN", "s3cret")
+        assert ledger.is_synced(REMOTE_URL, "OTHER", "value")
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from wexample_filestate_git.exception.remote_unavailable_exception import (
+    RemoteUnavailableException,
+)
+from wexample_filestate_git.remote.http.circuit_breaker import CircuitBreaker
+from wexample_filestate_git.testing.fake_api.fake_gitlab_api_server import (
+    FakeGitlabApiServer,
+)
+
+
+class TestCircuitBreaker:
+    """Test cases for failing fast on unavailable hosts."""
+
+    @pytest.fixture(autouse=True)
+    def reset_breakers(self):
+        CircuitBreaker.reset_all()
+        yield
+        CircuitBreaker.reset_all()
+
+    @pytest.fixture
+    def gitlab(self):
+        server = FakeGitlabApiServer().start()
+        yield server
+        server.stop()
+
+    def test_server_errors_open_the_circuit_of_one_host(self, gitlab) -> None:
+        other = FakeGitlabApiServer().start()
+        try:
+            remote = gitlab.make_remote()
+            breaker = remote.get_circuit_breaker()
+            breaker.reset_timeout = 0.1
+            gitlab.inject_error(status_code=503, count=breaker.failure_threshold)
+
+            for _ in range(breaker.failure_threshold):
+                assert not remote.check_connection()
+            sent = len(gitlab.get_requests())
+
+            with pytest.raises(RemoteUnavailableException) as error:
+                remote.check_connection()
+            assert error.value.host == breaker.host
+            assert len(gitlab.get_requests()) == sent
+            # Other hosts are not affected.
+            assert other.make_remote().check_connection()
+
+            # Once the timeout elapsed, a probe closes the circuit again.
+            time.sleep(0.1)
+            assert remote.check_connection()
+            assert breaker.get_state() == "closed"
+        finally:
+            other.stop()
+
+    def test_failed_probe_reopens_the_circuit(self, gitlab) -> None:
+        remote = gitlab.make_remote()
+        # Nothing listens on this port anymore: connections are refused.
+        gitlab.stop()
+        breaker = remote.get_circuit_breaker()
+        breaker.reset_timeout = 0.1
+
+        for _ in range(breaker.failure_threshold):
+            assert not remote.check_connection()
+        assert breaker.get_state() == "open"
+
+        time.sleep(0.1)
+        with pytest.raises(RemoteUnavailableException):
+            remote.check_connection()
+        assert breaker.get_state() == "open"
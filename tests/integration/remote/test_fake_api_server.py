@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import pytest
+
+from wexample_filestate_git.testing.fake_api.fake_github_api_server import (
+    FakeGithubApiServer,
+)
+from wexample_filestate_git.testing.fake_api.fake_gitlab_api_server import (
+    FakeGitlabApiServer,
+)
+
+
+class TestFakeApiServer:
+    """Test cases for the remotes against the in-process fake APIs."""
+
+    @pytest.fixture
+    def github(self):
+        server = FakeGithubApiServer().start()
+        yield server
+        server.stop()
+
+    @pytest.fixture
+    def gitlab(self):
+        server = FakeGitlabApiServer().start()
+        yield server
+        server.stop()
+
+    def test_gitlab_repository_and_variables(self, gitlab) -> None:
+        gitlab.add_repository("group", "existing")
+        remote = gitlab.make_remote()
+
+        remote.create_repository_if_not_exists("https://gitlab.com/group/created.git")
+        results = remote.set_ci_variables(
+            "group", "created", {f"VAR_{i}": str(i) for i in range(25)}
+        )
+
+        assert remote.check_repository_exists("created", "group")
+        assert all(results.values())
+        assert gitlab.get_variables("group", "created")["VAR_24"] == "24"
+        # One listing, then one POST per new variable.
+        assert gitlab.count_requests("GET", r"/variables$") == 1
+        assert gitlab.count_requests("POST", r"/variables$") == 25
+
+    def test_gitlab_merge_waits_for_pipelines(self, gitlab) -> None:
+        gitlab.add_repository("group", "repo")
+        remote = gitlab.make_remote()
+
+        proposal = remote.create_merge_proposal("group", "repo", "feature", "main", "T")
+        pipeline = gitlab.add_pipeline("group", "repo", ref="feature")
+        [listed] = remote.get_merge_proposal_pipelines("group", "repo", proposal["iid"])
+        gitlab.set_pipeline_status("group", "repo", pipeline["id"], "success")
+
+        assert listed["status"] == "running"
+        assert remote.poll_pipeline("group", "repo", pipeline["id"]) == "success"
+        assert remote.merge_merge_proposal("group", "repo", proposal["iid"])[
+            "state"
+        ] == ("merged")
+
+    def test_rate_limit_and_injected_errors(self, gitlab) -> None:
+        gitlab.add_repository("group", "repo")
+        gitlab.rate_limit = 100
+        gitlab.inject_error(status_code=429, count=2, retry_after=0)
+        remote = gitlab.make_remote()
+
+        assert remote.get_default_branch("group", "repo") == "main"
+
+        # Both injected 429s were retried by the remote.
+        assert gitlab.count_requests("GET", r"^projects/") == 3
+        assert remote.get_rate_limit_budget()["remaining"] == 97
+
+    def test_github_batch_check_and_pull_requests(self, github) -> None:
+        for index in range(3):
+            github.add_repository("org", f"repo-{index}")
+        github.protect_branch("org", "repo-0", "main")
+        github.latency = 0.05
+        remote = github.make_remote()
+
+        results = remote.check_repositories_exist(
+            [f"https://github.com/org/repo-{index}" for index in range(4)]
+        )
+        pull = remote.create_merge_proposal("org", "repo-1", "feature", "main", "T")
+        github.add_pipeline("org", "repo-1", ref="feature", status="failed")
+
+        assert results["https://github.com/org/repo-0"]["default_branch_protected"]
+        assert results["https://github.com/org/repo-3"] is None
+        assert github.count_requests("POST", r"^graphql$") == 1
+        [run] = remote.get_merge_proposal_pipelines("org", "repo-1", pull["number"])
+        assert remote._extract_pipeline_status(run) == "failure"
+
+    def test_github_secrets(self, github) -> None:
+        pytest.importorskip("nacl")
+
+        github.add_repository("org", "repo")
+        remote = github.make_remote()
+
+        results = remote.set_ci_variables("org", "repo", {"A": "1", "B": "2"})
+        remote.set_group_ci_variables("org", {"SHARED": "3"})
+        remote.grant_group_ci_variables("org", ["SHARED"], "org", "repo")
+
+        assert results == {"A": True, "B": True}
+        assert github.get_variables("org", "repo") == {"A": "1", "B": "2"}
+        assert github.get_group_variables("org") == {"SHARED": "3"}
+        assert github.get_secret_repository_ids("org", "SHARED") == {
+            github.get_repository("org", "repo")["id"]
+        }
+
+    def test_github_group_secret_needs_its_current_selection(self, github) -> None:
+        pytest.importorskip("nacl")
+
+        github.add_repository("org", "repo")
+        remote = github.make_remote()
+        remote.set_group_ci_variables("org", {"SHARED": "1"})
+        remote.grant_group_ci_variables("org", ["SHARED"], "org", "repo")
+        remote = github.make_remote()
+
+        github.inject_error(status_code=403, path=r"SHARED/repositories$")
+        # Written without the repositories already granted, the secret
+        # would lose them: it is left untouched instead.
+        assert not remote.set_group_ci_variable("org", "SHARED", "2")
+        assert remote.set_group_ci_variable("org", "SHARED", "2")
+
+        assert github.get_group_variables("org") == {"SHARED": "2"}
+        assert github.get_secret_repository_ids("org", "SHARED") == {
+            github.get_repository("org", "repo")["id"]
+        }
+
+    def test_identical_gets_in_flight_are_coalesced(self) -> None:
+        from wexample_helpers.helper.parallel import parallel_map
+
+        server = FakeGitlabApiServer(latency=0.2).start()
+        try:
+            server.add_repository("group", "repo")
+            pipeline = server.add_pipeline("group", "repo", ref="main")
+            remote = server.make_remote()
+
+            statuses = parallel_map(
+                range(8),
+                lambda _: remote.get_pipeline("group", "repo", pipeline["id"]),
+                max_workers=8,
+            )
+
+            assert len({status["id"] for status in statuses}) == 1
+            assert server.count_requests("GET", r"/pipelines/\d+$") == 1
+            assert remote._in_flight.get_shared_count() == 7
+
+            # Nothing is kept once the call completed.
+            remote.get_pipeline("group", "repo", pipeline["id"])
+            assert server.count_requests("GET", r"/pipelines/\d+$") == 2
+        finally:
+            server.stop()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from wexample_filestate_git.remote.http.gateway_transport import GatewayTransport
+
+
+class TestGatewayTransport:
+    """Test cases for routing gateway requests through a pooled client."""
+
+    def _build_remote(self, http_client):
+        from wexample_prompt.common.io_manager import IoManager
+
+        from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+
+        return GitlabRemote(
+            io=IoManager(),
+            api_token="test_token",
+            http_client=http_client,
+            rate_limit_delay=0.0,
+        )
+
+    def test_requests_go_through_the_bound_client_only(self, monkeypatch) -> None:
+        import requests
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"{}"
+        client = Mock()
+        client.request.return_value = response
+        unpooled = Mock(return_value=response)
+        monkeypatch.setattr(requests, "request", unpooled)
+
+        self._build_remote(client).get_pipeline("ns", "repo", 1)
+        self._build_remote(None).get_pipeline("ns", "repo", 2)
+
+        client.request.assert_called_once()
+        assert client.request.call_args[1]["url"].endswith("/pipelines/1")
+        # The binding ends with the request: other gateways are not pooled.
+        unpooled.assert_called_once()
+        assert unpooled.call_args[1]["url"].endswith("/pipelines/2")
+
+    def test_install_refuses_a_gateway_it_cannot_route(self, monkeypatch) -> None:
+        import pytest
+        import requests
+        import wexample_api.common.abstract_gateway as gateway_module
+
+        monkeypatch.setattr(GatewayTransport, "_installed", False)
+        monkeypatch.setattr(gateway_module, "requests", requests)
+        # As if the gateway sent with "from requests import request".
+        monkeypatch.setattr(gateway_module, "request", Mock(), raising=False)
+
+        with pytest.raises(RuntimeError):
+            GatewayTransport.install()
+
+    def test_native_hook_needs_no_proxy(self, monkeypatch) -> None:
+        from wexample_api.common.abstract_gateway import AbstractGateway
+
+        monkeypatch.setattr(
+            AbstractGateway, "_send_http_request", Mock(), raising=False
+        )
+        monkeypatch.setattr(
+            GatewayTransport,
+            "install",
+            Mock(side_effect=AssertionError("must not install")),
+        )
+
+        with GatewayTransport.use(Mock()):
+            pass
+
+    def test_unbound_context_uses_requests(self, monkeypatch) -> None:
+        import requests
+        import wexample_api.common.abstract_gateway as gateway_module
+
+        unpooled = Mock()
+        monkeypatch.setattr(requests, "request", unpooled)
+        GatewayTransport.install()
+
+        with GatewayTransport.use(Mock()):
+            pass
+        gateway_module.requests.request(method="GET", url="http://example.com")
+
+        unpooled.assert_called_once()
+        assert gateway_module.requests.exceptions is requests.exceptions
@@ -24,6 +24,224 @@ class TestGithubRemote(AbstractGitRemoteTest):
         remote = GithubRemote(io=io_manager, api_token="test_token")
         return remote
 
+    def test_check_repositories_exist_batches_graphql(self, remote) -> None:
+        from unittest.mock import Mock, patch
+
+        urls = [f"https://github.com/test-namespace/repo-{i}" for i in range(150)]
+
+        def graphql_response(**kwargs):
+            variables = kwargs["data"]["variables"]
+            data = {}
+            errors = []
+            for alias_index in range(len(variables) // 2):
+                name = variables[f"n{alias_index}"]
+                if name == "repo-3":
+                    errors.append({"type": "NOT_FOUND", "path": [f"r{alias_index}"]})
+                data[f"r{alias_index}"] = (
+                    None
+                    if name == "repo-3"
+                    else {
+                        "databaseId": 1,
+                        "id": "R_1",
+                        "name": name,
+                        "owner": {"login": variables[f"o{alias_index}"]},
+                        "defaultBranchRef": {
+                            "name": "main",
+                            "branchProtectionRule": {"pattern": "main"},
+                        },
+                        "branchProtectionRules": {"nodes": [{"pattern": "main"}]},
+                    }
+                )
+            response = Mock(status_code=200)
+            response.json.return_value = {"data": data, "errors": errors}
+            return response
+
+        with patch(
+            "wexample_api.common.abstract_gateway.AbstractGateway.make_request",
+            side_effect=graphql_response,
+        ) as mock_request:
+            results = remote.check_repositories_exist(urls)
+
+        assert mock_request.call_count == 2
+        assert mock_request.call_args[1]["endpoint"] == "graphql"
+        assert results[urls[3]] is None
+        assert results[urls[0]]["default_branch"] == "main"
+        assert results[urls[0]]["default_branch_protected"] is True
+        assert results[urls[103]]["name"] == "repo-103"
+        assert results[urls[149]]["name"] == "repo-149"
+
+    def test_check_runs_follow_link_pagination(self, remote) -> None:
+        import json
+        from unittest.mock import patch
+
+        import requests
+
+        def page(payload: dict, next_url: str | None = None):
+            response = requests.Response()
+            response.status_code = 200
+            response._content = json.dumps(payload).encode()
+            if next_url:
+                response.headers["Link"] = f'<{next_url}>; rel="next"'
+            return response
+
+        responses = [
+            page({"head": {"sha": "abc"}}),
+            page(
+                {"check_runs": [{"id": 1}, {"id": 2}]},
+                next_url="https://api.github.com/repositories/7/commits/abc/check-runs?page=2",
+            ),
+            page({"check_runs": [{"id": 3}]}),
+        ]
+
+        with patch(
+            "wexample_api.common.abstract_gateway.AbstractGateway.make_request",
+            side_effect=responses,
+        ) as mock_request:
+            runs = remote.get_merge_proposal_pipelines("test-namespace", "repo", 1)
+
+        assert [run["id"] for run in runs] == [1, 2, 3]
+        assert mock_request.call_args[1]["endpoint"] == (
+            "repositories/7/commits/abc/check-runs"
+        )
+        assert mock_request.call_args[1]["query_params"] == {"page": "2"}
+
+    def test_set_ci_variables_seals_secrets_with_cached_key(self, remote) -> None:
+        pytest.importorskip("nacl")
+
+        import base64
+        import json
+        import threading
+        from unittest.mock import patch
+
+        import requests
+        from nacl.public import PrivateKey, SealedBox
+        from wexample_api.enums.http import HttpMethod
+
+        private_key = PrivateKey.generate()
+        public_key = base64.b64encode(bytes(private_key.public_key)).decode()
+        lock = threading.Lock()
+        sent: dict[str, dict] = {}
+
+        def make_request(endpoint: str, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            if endpoint.endswith("/actions/secrets"):
+                payload = {"total_count": 1, "secrets": [{"name": "EXISTING"}]}
+            elif endpoint.endswith("/public-key"):
+                payload = {"key_id": "k1", "key": public_key}
+            else:
+                assert kwargs["method"] == HttpMethod.PUT
+                with lock:
+                    sent[endpoint.rsplit("/", 1)[1]] = kwargs["data"]
+                response.status_code = 201
+                payload = {}
+            response._content = json.dumps(payload).encode()
+            return response
+
+        variables = {"EXISTING": "one", "NEW_A": "two", "NEW_B": "three"}
+        with patch(
+            "wexample_api.common.abstract_gateway.AbstractGateway.make_request",
+            side_effect=make_request,
+        ) as mock_request:
+            results = remote.set_ci_variables("test-namespace", "repo", variables)
+
+        assert results == {"EXISTING": True, "NEW_A": True, "NEW_B": True}
+        endpoints = [call[1]["endpoint"] for call in mock_request.call_args_list]
+        assert endpoints.count("repos/test-namespace/repo/actions/secrets") == 1
+        assert (
+            endpoints.count("repos/test-namespace/repo/actions/secrets/public-key") == 1
+        )
+        assert len(endpoints) == 5
+
+        unseal = SealedBox(private_key).decrypt
+        for key, value in variables.items():
+            assert sent[key]["key_id"] == "k1"
+            encrypted = base64.b64decode(sent[key]["encrypted_value"])
+            assert unseal(encrypted).decode() == value
+
+    def test_set_ci_variable_refreshes_rotated_key(self, remote) -> None:
+        pytest.importorskip("nacl")
+
+        import base64
+        from unittest.mock import Mock, patch
+
+        from nacl.public import PrivateKey
+
+        def key(key_id: str) -> Mock:
+            response = Mock(status_code=200)
+            response.json.return_value = {
+                "key_id": key_id,
+                "key": base64.b64encode(
+                    bytes(PrivateKey.generate().public_key)
+                ).decode(),
+            }
+            return response
+
+        with patch(
+            "wexample_api.common.abstract_gateway.AbstractGateway.make_request",
+            side_effect=[
+                key("old"),
+                Mock(status_code=422),
+                key("new"),
+                Mock(status_code=204),
+            ],
+        ) as mock_request:
+            assert remote.set_ci_variable("test-namespace", "repo", "TOKEN", "value")
+
+        assert mock_request.call_args[1]["data"]["key_id"] == "new"
+
+    def test_group_secret_is_granted_once_per_repository(self, remote) -> None:
+        pytest.importorskip("nacl")
+
+        import base64
+        import json
+        from unittest.mock import patch
+
+        import requests
+        from nacl.public import PrivateKey
+        from wexample_api.enums.http import HttpMethod
+
+        public_key = base64.b64encode(bytes(PrivateKey.generate().public_key))
+
+        def make_request(endpoint: str, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            payload: dict = {}
+            if endpoint == "orgs/org/actions/secrets":
+                payload = {"total_count": 1, "secrets": [{"name": "TOKEN"}]}
+            elif endpoint.endswith("/public-key"):
+                payload = {"key_id": "k1", "key": public_key.decode()}
+            elif endpoint.endswith("/TOKEN/repositories"):
+                payload = {"total_count": 1, "repositories": [{"id": 1}]}
+            elif endpoint.startswith("repos/"):
+                payload = {"id": int(endpoint[-1])}
+            elif kwargs.get("method") == HttpMethod.PUT:
+                response.status_code = 204
+            response._content = json.dumps(payload).encode()
+            return response
+
+        with patch(
+            "wexample_api.common.abstract_gateway.AbstractGateway.make_request",
+            side_effect=make_request,
+        ) as mock_request:
+            assert remote.set_group_ci_variables("org", {"TOKEN": "value"}) == {
+                "TOKEN": True
+            }
+            for name in ("repo-1", "repo-2", "repo-2"):
+                assert remote.grant_group_ci_variables("org", ["TOKEN"], "org", name)
+
+        puts = [
+            call[1]
+            for call in mock_request.call_args_list
+            if call[1].get("method") == HttpMethod.PUT
+        ]
+        assert puts[0]["data"]["visibility"] == "selected"
+        assert puts[0]["data"]["selected_repository_ids"] == [1]
+        # repo-1 is already selected; repo-2 is added once.
+        assert [put["endpoint"] for put in puts[1:]] == [
+            "orgs/org/actions/secrets/TOKEN/repositories/2"
+        ]
+
     def test_check_repository_exists(self, remote) -> None:
         from unittest.mock import patch
 
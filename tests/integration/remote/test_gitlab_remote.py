@@ -38,6 +38,120 @@ class TestGitlabRemote(AbstractGitRemoteTest):
             self._assert_check_repository_exists_request(mock_request)
             assert exists is True
 
+    def test_prefetch_group_answers_lookups_from_index(self, remote) -> None:
+        import json
+        from unittest.mock import patch
+
+        import requests
+
+        def page(projects: list[dict], next_url: str | None = None):
+            response = requests.Response()
+            response.status_code = 200
+            response._content = json.dumps(projects).encode()
+            if next_url:
+                response.headers["Link"] = f'<{next_url}>; rel="next"'
+            return response
+
+        namespace = {"id": 42, "full_path": "test-namespace"}
+        first_page = page(
+            [
+                {
+                    "path_with_namespace": "test-namespace/test-repo",
+                    "default_branch": "main",
+                    "namespace": namespace,
+                }
+            ],
+            next_url="https://gitlab.com/api/v4/groups/test-namespace/projects?id_after=1&per_page=100",
+        )
+        second_page = page(
+            [
+                {
+                    "path_with_namespace": "test-namespace/other-repo",
+                    "default_branch": "develop",
+                    "namespace": namespace,
+                }
+            ]
+        )
+        remote.group_prefetch = True
+
+        with patch(
+            "wexample_api.common.abstract_gateway.AbstractGateway.make_request",
+            side_effect=[first_page, second_page],
+        ) as mock_request:
+            assert remote.check_repository_exists("test-repo", "test-namespace")
+            assert not remote.check_repository_exists("missing", "test-namespace")
+            assert remote.get_default_branch("test-namespace", "other-repo") == (
+                "develop"
+            )
+            assert remote._get_namespace_id("test-namespace") == 42
+
+        assert mock_request.call_count == 2
+        assert mock_request.call_args[1]["endpoint"] == (
+            "groups/test-namespace/projects"
+        )
+        assert mock_request.call_args[1]["query_params"]["id_after"] == "1"
+
+    def test_failed_prefetch_is_not_retried(self, remote) -> None:
+        from unittest.mock import patch
+
+        from wexample_helpers.error.gateway_error import GatewayError
+
+        def make_request(endpoint: str, **kwargs):
+            if endpoint.startswith("groups/"):
+                raise GatewayError("404 Group Not Found")
+            return self._json_response(200, {"default_branch": "main"})
+
+        remote.group_prefetch = True
+
+        with patch(
+            "wexample_api.common.abstract_gateway.AbstractGateway.make_request",
+            side_effect=make_request,
+        ) as mock_request:
+            assert remote.get_default_branch("a-user", "first") == "main"
+            assert remote.get_default_branch("a-user", "second") == "main"
+
+        endpoints = [call[1]["endpoint"] for call in mock_request.call_args_list]
+        # A user namespace is not a group: listed once, then never again.
+        assert endpoints == [
+            "groups/a-user/projects",
+            "projects/a-user%2Ffirst",
+            "projects/a-user%2Fsecond",
+        ]
+
+    def test_group_index_is_refreshed_after_its_ttl(self, remote) -> None:
+        from unittest.mock import patch
+
+        def listing(*names: str):
+            return self._json_response(
+                200,
+                [
+                    {
+                        "path_with_namespace": f"group/{name}",
+                        "namespace": {"id": 1, "full_path": "group"},
+                    }
+                    for name in names
+                ],
+            )
+
+        remote.group_prefetch = True
+
+        with patch(
+            "wexample_api.common.abstract_gateway.AbstractGateway.make_request",
+            side_effect=[listing("deleted"), listing("created")],
+        ) as mock_request:
+            assert remote.check_repository_exists("deleted", "group")
+            assert not remote.check_repository_exists("created", "group")
+            assert mock_request.call_count == 1
+
+            # Listed longer ago than the TTL.
+            include_subgroups, indexed_at = remote._prefetched_groups["group"]
+            remote._prefetched_groups["group"] = (
+                include_subgroups,
+                indexed_at - remote.group_prefetch_ttl,
+            )
+            assert remote.check_repository_exists("created", "group")
+            assert not remote.check_repository_exists("deleted", "group")
+
     def test_create_repository(self, remote) -> None:
         from unittest.mock import Mock, patch
 
@@ -65,6 +179,173 @@ class TestGitlabRemote(AbstractGitRemoteTest):
             assert mock_request.call_args[1]["data"]["namespace_id"] == 42
             assert result == {"id": 1}
 
+    def test_id_cache_resolves_namespace_once(self, remote, tmp_path) -> None:
+        from unittest.mock import Mock, patch
+
+        from wexample_filestate_git.remote.cache.gitlab_id_cache import (
+            GitlabIdCache,
+        )
+        from wexample_filestate_git.remote.cache.sqlite_cache_store import (
+            SqliteCacheStore,
+        )
+
+        remote.id_cache = GitlabIdCache(
+            store=SqliteCacheStore(path=tmp_path / "cache.sqlite3")
+        )
+
+        def make_request(endpoint: str, **kwargs):
+            if endpoint == "namespaces":
+                response = Mock(status_code=200, links={}, headers={})
+                response.json.return_value = [{"path": "test-namespace", "id": 42}]
+                return response
+            response = Mock(status_code=201)
+            response.json.return_value = {
+                "id": 100 + len(created),
+                "path_with_namespace": f"test-namespace/{kwargs['data']['name']}",
+            }
+            created.append(kwargs["data"]["namespace_id"])
+            return response
+
+        created: list[int] = []
+        with patch(
+            "wexample_api.common.abstract_gateway.AbstractGateway.make_request",
+            side_effect=make_request,
+        ) as mock_request:
+            for i in range(50):
+                remote.create_repository(f"repo-{i}", "test-namespace")
+
+        endpoints = [call[1]["endpoint"] for call in mock_request.call_args_list]
+        assert endpoints.count("namespaces") == 1
+        assert created == [42] * 50
+        assert remote._project_endpoint("test-namespace", "repo-3") == "projects/103"
+        # Persisted for the next run.
+        assert (
+            GitlabIdCache(
+                store=SqliteCacheStore(path=tmp_path / "cache.sqlite3")
+            ).get_project_id(remote.get_base_url(), "test-namespace/repo-3")
+            == 103
+        )
+
+    def _json_response(self, status_code: int, body):
+        import json
+
+        import requests
+
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = json.dumps(body).encode()
+        return response
+
+    def test_id_cache_falls_back_to_path_on_stale_id(self, remote) -> None:
+        from unittest.mock import patch
+
+        from wexample_filestate_git.remote.cache.gitlab_id_cache import (
+            GitlabIdCache,
+        )
+
+        remote.id_cache = GitlabIdCache()
+        remote.id_cache.set_project_id(remote.get_base_url(), "ns/repo", 7)
+
+        with patch(
+            "wexample_api.common.abstract_gateway.AbstractGateway.make_request",
+            side_effect=[
+                self._json_response(404, {"message": "404 Project Not Found"}),
+                self._json_response(200, {"id": 5, "status": "success"}),
+            ],
+        ) as mock_request:
+            pipeline = remote.get_pipeline("ns", "repo", 5)
+
+        endpoints = [call[1]["endpoint"] for call in mock_request.call_args_list]
+        assert endpoints == ["projects/7/pipelines/5", "projects/ns%2Frepo/pipelines/5"]
+        assert pipeline["status"] == "success"
+        assert remote.id_cache.get_project_id(remote.get_base_url(), "ns/repo") is None
+
+    def test_missing_sub_resource_keeps_cached_id(self, remote) -> None:
+        from unittest.mock import patch
+
+        from wexample_filestate_git.remote.cache.gitlab_id_cache import (
+            GitlabIdCache,
+        )
+
+        remote.id_cache = GitlabIdCache()
+        remote.id_cache.set_project_id(remote.get_base_url(), "ns/repo", 7)
+
+        with patch(
+            "wexample_api.common.abstract_gateway.AbstractGateway.make_request",
+            return_value=self._json_response(
+                404, {"message": "404 Variable Not Found"}
+            ),
+        ) as mock_request:
+            assert remote.get_ci_variable("ns", "repo", "MISSING") is None
+
+        mock_request.assert_called_once()
+        assert mock_request.call_args[1]["endpoint"] == "projects/7/variables/MISSING"
+        assert remote.id_cache.get_project_id(remote.get_base_url(), "ns/repo") == 7
+
+    def test_set_ci_variables_lists_once_and_writes_changes(self, remote) -> None:
+        import json
+        from unittest.mock import patch
+
+        import requests
+        from wexample_api.enums.http import HttpMethod
+
+        def make_request(endpoint: str, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            if kwargs.get("method", HttpMethod.GET) == HttpMethod.GET:
+                response._content = json.dumps(
+                    [{"key": f"VAR_{i}", "value": "same"} for i in range(18)]
+                ).encode()
+            elif kwargs["method"] == HttpMethod.POST:
+                response.status_code = 201
+            return response
+
+        variables = {f"VAR_{i}": "same" for i in range(20)}
+        variables["VAR_3"] = "changed"
+
+        with patch(
+            "wexample_api.common.abstract_gateway.AbstractGateway.make_request",
+            side_effect=make_request,
+        ) as mock_request:
+            results = remote.set_ci_variables("test-namespace", "test-repo", variables)
+
+        assert all(results.values()) and len(results) == 20
+        calls = sorted(
+            (call[1].get("method", HttpMethod.GET).value, call[1]["endpoint"])
+            for call in mock_request.call_args_list
+        )
+        project = "projects/test-namespace%2Ftest-repo"
+        assert calls == [
+            ("GET", f"{project}/variables"),
+            ("POST", f"{project}/variables"),
+            ("POST", f"{project}/variables"),
+            ("PUT", f"{project}/variables/VAR_3"),
+        ]
+
+    def test_namespace_lookup_stops_at_first_match(self, remote) -> None:
+        import json
+        from unittest.mock import patch
+
+        import requests
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(
+            [
+                {"path": "other", "full_path": "other", "id": 1},
+                {"path": "sub", "full_path": "test-namespace/sub", "id": 42},
+            ]
+        ).encode()
+        response.headers["X-Next-Page"] = "2"
+
+        with patch(
+            "wexample_api.common.abstract_gateway.AbstractGateway.make_request",
+            return_value=response,
+        ) as mock_request:
+            assert remote._get_namespace_id("test-namespace/sub") == 42
+
+        mock_request.assert_called_once()
+
     def test_parse_repository_url_https(self, remote) -> None:
         url = "https://gitlab.com/test-namespace/test-repo.git"
         info = remote.parse_repository_url(url)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+from wexample_filestate_git.remote.http.remote_http_client import (  # noqa: E402
+    RemoteHttpClient,
+)
+
+REQUESTS = 10
+LATENCY = 0.1
+
+
+class TestHttp2Transport:
+    """Test cases for the optional HTTP/2 transport."""
+
+    def test_concurrent_requests_share_one_connection(self) -> None:
+        from wexample_helpers.helper.parallel import parallel_map
+
+        from wexample_filestate_git.testing.http2_test_server import Http2TestServer
+
+        server = Http2TestServer(latency=LATENCY).start()
+        try:
+            client = RemoteHttpClient(http2_hosts={"127.0.0.1"})
+            # Warm up: the first request opens the connection.
+            client.request(method="GET", url=server.get_url(), timeout=10)
+            responses = parallel_map(
+                list(range(REQUESTS)),
+                lambda index: client.request(
+                    method="GET", url=f"{server.get_url()}namespaces", timeout=10
+                ),
+                max_workers=REQUESTS,
+            )
+        finally:
+            server.stop()
+
+        assert all(response.status_code == 200 for response in responses)
+        assert server.get_connection_count() == 1
+        # Streams of that one connection were answered side by side.
+        assert server.get_max_concurrent_streams() > 1
+
+    def test_dropped_connection_replays_only_safe_methods(self) -> None:
+        import requests
+
+        from wexample_filestate_git.testing.http2_test_server import Http2TestServer
+
+        server = Http2TestServer().start()
+        try:
+            client = RemoteHttpClient(http2_hosts={"127.0.0.1"})
+            client.request(method="GET", url=server.get_url(), timeout=10)
+
+            server.drop_requests = 1
+            with pytest.raises(requests.exceptions.ConnectionError):
+                client.request(method="POST", url=server.get_url(), timeout=10)
+            # The POST reached the server once and was not sent again.
+            assert server.get_dropped_count() == 1
+            assert server.get_request_count() == 1
+
+            server.drop_requests = 2
+            response = client.request(method="GET", url=server.get_url(), timeout=10)
+        finally:
+            server.stop()
+
+        assert response.status_code == 200
+        assert server.get_dropped_count() == 2
+        assert server.get_request_count() == 2
+        assert client.is_http2_host("127.0.0.1")
+
+    def test_falls_back_to_http1(self) -> None:
+        from wexample_filestate_git.testing.fake_api.fake_gitlab_api_server import (
+            FakeGitlabApiServer,
+        )
+
+        server = FakeGitlabApiServer().start()
+        try:
+            client = RemoteHttpClient(http2_hosts={"*"})
+            response = client.request(
+                method="HEAD", url=f"{server.get_base_url()}/user", timeout=10
+            )
+        finally:
+            server.stop()
+
+        assert response.status_code == 200
+        assert not client.is_http2_host("127.0.0.1")
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+from wexample_filestate_git.remote.pipeline.pipeline_poller import PipelinePoller
+
+
+class TestPipelinePoller:
+    """Test cases for waiting on many pipelines at once."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch) -> list[float]:
+        clock = [1000.0]
+
+        def fake_sleep(seconds: float) -> None:
+            clock[0] += seconds
+
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(time, "sleep", fake_sleep)
+        return clock
+
+    @pytest.fixture
+    def remote(self, clock, monkeypatch) -> GitlabRemote:
+        from wexample_prompt.common.io_manager import IoManager
+
+        remote = GitlabRemote(io=IoManager(), api_token="test_token")
+        # Pipeline N finishes N minutes after the start.
+        finish_at = {1: 1060.0, 2: 1120.0, 3: 1180.0}
+
+        def get_pipeline(namespace: str, name: str, pipeline_id: int) -> dict:
+            done = clock[0] >= finish_at[pipeline_id]
+            return {"id": pipeline_id, "status": "success" if done else "running"}
+
+        monkeypatch.setattr(remote, "get_pipeline", get_pipeline)
+        return remote
+
+    def test_completions_are_reported_as_they_happen(self, remote, clock) -> None:
+        completed = []
+        poller = PipelinePoller(on_complete=completed.append, max_workers=1)
+        for pipeline_id in (3, 1, 2):
+            poller.add(remote, "ns", f"repo-{pipeline_id}", pipeline_id)
+
+        handles = poller.wait()
+
+        assert [h.pipeline_id for h in handles] == [1, 2, 3]
+        assert completed == handles
+        assert all(h.status == "success" for h in handles)
+        # Wall time follows the slowest pipeline, not the sum of all three.
+        assert clock[0] - 1000.0 < 180 + poller.max_interval
+
+    def test_expected_duration_tightens_polling(self, remote, clock) -> None:
+        poller = PipelinePoller(min_interval=1.0)
+        handle = poller.add(remote, "ns", "repo-1", 1, expected_duration=60)
+
+        poller.wait()
+
+        # Checks at 0, 30, 45, 52.5, ... converge on the expected end.
+        assert handle.get_duration() == pytest.approx(60, abs=1.5)
+        assert handle.polls < 10
+
+    def test_timeout_lists_pending_pipelines(self, remote) -> None:
+        poller = PipelinePoller(timeout=90)
+        poller.add(remote, "ns", "repo-1", 1)
+        poller.add(remote, "ns", "repo-3", 3)
+
+        with pytest.raises(TimeoutError, match="ns/repo-3#3"):
+            for handle in poller.iter_completed():
+                assert handle.pipeline_id == 1
+
+    def test_fetch_errors_only_concern_their_pipeline(
+        self, remote, clock, monkeypatch
+    ) -> None:
+        from wexample_helpers.error.gateway_error import GatewayError
+
+        get_pipeline = remote.get_pipeline
+        failures = {1: 2, 3: 99}
+
+        def flaky_get_pipeline(namespace: str, name: str, pipeline_id: int) -> dict:
+            if failures.get(pipeline_id, 0) > 0:
+                failures[pipeline_id] -= 1
+                raise GatewayError("HTTP 502")
+            return get_pipeline(namespace, name, pipeline_id)
+
+        monkeypatch.setattr(remote, "get_pipeline", flaky_get_pipeline)
+        poller = PipelinePoller(max_errors=3)
+        for pipeline_id in (1, 2, 3):
+            poller.add(remote, "ns", f"repo-{pipeline_id}", pipeline_id)
+
+        handles = {handle.pipeline_id: handle for handle in poller.wait()}
+
+        assert handles[1].status == handles[2].status == "success"
+        assert not handles[1].has_failed()
+        assert handles[1].error_count == 0
+        assert handles[3].has_failed()
+        assert handles[3].error_count == 3
+        assert isinstance(handles[3].error, GatewayError)
+
+    def test_programming_errors_are_not_retried(self, remote, monkeypatch) -> None:
+        def broken_get_pipeline(namespace: str, name: str, pipeline_id: int) -> dict:
+            raise KeyError("id")
+
+        monkeypatch.setattr(remote, "get_pipeline", broken_get_pipeline)
+        poller = PipelinePoller()
+        poller.add(remote, "ns", "repo", 1)
+
+        with pytest.raises(KeyError):
+            poller.wait()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from wexample_filestate_git.remote.pipeline.pipeline_webhook_receiver import (
+    PipelineWebhookReceiver,
+)
+
+GITLAB_PIPELINE_EVENT = {
+    "object_kind": "pipeline",
+    "object_attributes": {"id": 31, "ref": "main", "status": "success"},
+    "project": {"path_with_namespace": "test-namespace/test-repo"},
+}
+
+GITHUB_WORKFLOW_RUN_EVENT = {
+    "action": "completed",
+    "workflow_run": {"id": 77, "status": "completed", "conclusion": "failure"},
+    "repository": {"full_name": "test-namespace/test-repo"},
+}
+
+
+class TestPipelineWebhookReceiver:
+    """Test cases for pipeline waits resolved by webhooks."""
+
+    @pytest.fixture
+    def receiver(self):
+        receiver = PipelineWebhookReceiver(secret="s3cret").start()
+        yield receiver
+        receiver.stop()
+
+    def _post(self, receiver, payload: dict, headers: dict, delay: float = 0.0):
+        import requests
+
+        def send() -> None:
+            requests.post(receiver.get_url(), data=json.dumps(payload), headers=headers)
+
+        timer = threading.Timer(delay, send)
+        timer.start()
+        return timer
+
+    def test_gitlab_event_resolves_poll(self, receiver, monkeypatch) -> None:
+        from wexample_prompt.common.io_manager import IoManager
+
+        from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+
+        remote = GitlabRemote(
+            io=IoManager(), api_token="test_token", webhook_receiver=receiver
+        )
+        fetches = []
+        monkeypatch.setattr(
+            remote,
+            "get_pipeline",
+            lambda *args: fetches.append(args) or {"id": 31, "status": "running"},
+        )
+
+        self._post(
+            receiver,
+            GITLAB_PIPELINE_EVENT,
+            {"X-Gitlab-Event": "Pipeline Hook", "X-Gitlab-Token": "s3cret"},
+            delay=0.05,
+        )
+        status = remote.poll_pipeline("test-namespace", "test-repo", 31, interval=60)
+
+        assert status == "success"
+        assert len(fetches) == 1
+
+    def test_falls_back_to_polling_without_event(self, receiver, monkeypatch) -> None:
+        from wexample_prompt.common.io_manager import IoManager
+
+        from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+
+        remote = GitlabRemote(
+            io=IoManager(),
+            api_token="test_token",
+            webhook_fallback_timeout=0.05,
+            webhook_receiver=receiver,
+        )
+        statuses = iter(["running", "success"])
+        monkeypatch.setattr(
+            remote, "get_pipeline", lambda *args: {"status": next(statuses)}
+        )
+
+        assert remote.poll_pipeline("ns", "repo", 31, interval=60) == "success"
+
+    def test_github_events_require_a_valid_signature(self, receiver) -> None:
+        import hashlib
+        import hmac
+
+        import requests
+        from wexample_prompt.common.io_manager import IoManager
+
+        from wexample_filestate_git.remote.github_remote import GithubRemote
+        from wexample_filestate_git.remote.pipeline.pipeline_poller import (
+            PipelinePoller,
+        )
+
+        body = json.dumps(GITHUB_WORKFLOW_RUN_EVENT).encode()
+        signature = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+
+        rejected = requests.post(
+            receiver.get_url(),
+            data=body,
+            headers={"X-GitHub-Event": "workflow_run", "X-Hub-Signature-256": "bad"},
+        )
+        assert rejected.status_code == 401
+
+        poller = PipelinePoller(webhook_receiver=receiver, timeout=5)
+        # No fetch is due before the timeout: only the event can complete it.
+        remote = GithubRemote(io=IoManager(), api_token="test_token")
+        handle = poller.add(remote, "test-namespace", "test-repo", 77)
+        handle.next_poll_at += 60
+
+        self._post(
+            receiver,
+            GITHUB_WORKFLOW_RUN_EVENT,
+            {
+                "X-GitHub-Event": "workflow_run",
+                "X-Hub-Signature-256": f"sha256={signature}",
+            },
+            delay=0.05,
+        )
+
+        assert poller.wait() == [handle]
+        assert handle.status == "failure"
+        assert handle.polls == 0
+
+    def test_events_are_claimed_only_by_their_pipeline(self, receiver) -> None:
+        from wexample_prompt.common.io_manager import IoManager
+
+        from wexample_filestate_git.remote.github_remote import GithubRemote
+        from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+
+        gitlab = GitlabRemote(io=IoManager(), api_token="test_token")
+        github = GithubRemote(io=IoManager(), api_token="test_token")
+        other_project = {
+            **GITLAB_PIPELINE_EVENT,
+            "project": {"path_with_namespace": "test-namespace/other-repo"},
+        }
+        check_run = {"check_run": {"id": 31, "status": "completed"}}
+
+        receiver.handle_event("Pipeline Hook", GITLAB_PIPELINE_EVENT)
+        receiver.handle_event("Pipeline Hook", other_project)
+        assert receiver.handle_event("check_run", check_run) is None
+
+        # Same pipeline ID, other forge: nothing to claim.
+        github_key = receiver.build_event_key(github, "test-namespace", "test-repo", 31)
+        assert receiver.wait_for_pipeline(github_key, timeout=0) is None
+
+        key = receiver.build_event_key(gitlab, "Test-Namespace", "test-repo", 31)
+        assert receiver.pop_events([key, github_key]) == {
+            key: GITLAB_PIPELINE_EVENT["object_attributes"]
+        }
+        # The other project's event is still waiting for its own waiter.
+        other_key = receiver.build_event_key(gitlab, "test-namespace", "other-repo", 31)
+        assert receiver.wait_for_pipeline(other_key, timeout=0) is not None
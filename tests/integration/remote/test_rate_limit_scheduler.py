@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+from wexample_filestate_git.remote.http.rate_limit_scheduler import (
+    RateLimitScheduler,
+)
+
+
+def _build_response(status_code: int, body: bytes = b"", headers: dict | None = None):
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = body
+    return response
+
+
+class TestRateLimitScheduler:
+    """Test cases for the per-host rate limit scheduler."""
+
+    @pytest.fixture(autouse=True)
+    def reset_schedulers(self):
+        RateLimitScheduler.reset_all()
+        yield
+        RateLimitScheduler.reset_all()
+
+    @pytest.fixture
+    def remote(self) -> GitlabRemote:
+        from unittest.mock import Mock
+
+        from wexample_prompt.common.io_manager import IoManager
+
+        return GitlabRemote(
+            io=IoManager(),
+            api_token="test_token",
+            http_client=Mock(),
+            rate_limit_delay=0.0,
+        )
+
+    def test_budget_is_learned_from_headers(self, remote) -> None:
+        reset_at = int(time.time()) + 3600
+        remote.http_client.request.return_value = _build_response(
+            200,
+            b'{"id": 7}',
+            {
+                "RateLimit-Limit": "2000",
+                "RateLimit-Remaining": "1500",
+                "RateLimit-Reset": str(reset_at),
+            },
+        )
+
+        remote.get_pipeline("test-namespace", "test-repo", 7)
+
+        budget = remote.get_rate_limit_budget()
+        assert budget["limit"] == 2000
+        assert budget["remaining"] == 1500
+        assert budget["reset_at"] == reset_at
+
+    def test_schedulers_are_shared_per_host(self, remote) -> None:
+        from wexample_prompt.common.io_manager import IoManager
+
+        other = GitlabRemote(io=IoManager(), api_token="other_token")
+
+        assert remote.get_rate_limit_scheduler() is other.get_rate_limit_scheduler()
+
+    def test_rate_limited_request_is_retried(self, remote, monkeypatch) -> None:
+        clock = [time.time()]
+        sleeps: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr(time, "time", lambda: clock[0])
+        monkeypatch.setattr(time, "sleep", fake_sleep)
+        remote.http_client.request.side_effect = [
+            _build_response(429, headers={"Retry-After": "2"}),
+            _build_response(200, b'{"id": 7}'),
+        ]
+
+        assert remote.get_pipeline("test-namespace", "test-repo", 7) == {"id": 7}
+        assert remote.http_client.request.call_count == 2
+        assert sleeps and sum(sleeps) == pytest.approx(2, abs=0.5)
+
+    def test_low_budget_spreads_requests(self) -> None:
+        scheduler = RateLimitScheduler(host="example.com")
+        now = time.time()
+        scheduler.update_from_response(
+            _build_response(
+                200,
+                headers={
+                    "X-RateLimit-Limit": "100",
+                    "X-RateLimit-Remaining": "2",
+                    "X-RateLimit-Reset": str(int(now) + 100),
+                },
+            )
+        )
+
+        assert scheduler._get_delay(now) == 0.0
+        scheduler._last_sent_at = now
+        assert scheduler._get_delay(now) > 10
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pytest
+
+from wexample_filestate_git.remote.github_remote import GithubRemote
+from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+from wexample_filestate_git.remote.remote_registry import RemoteRegistry
+
+
+class TestRemoteRegistry:
+    """Test cases for the process-wide remote registry."""
+
+    @pytest.fixture(autouse=True)
+    def reset_registry(self):
+        RemoteRegistry.reset()
+        yield
+        RemoteRegistry.reset()
+
+    @pytest.fixture
+    def io(self):
+        from wexample_prompt.common.io_manager import IoManager
+
+        return IoManager()
+
+    def test_get_remote_reuses_instance(self, io) -> None:
+        first = RemoteRegistry.get_remote(
+            GitlabRemote, "token", "https://gitlab.example.com/api/v4", io
+        )
+        second = RemoteRegistry.get_remote(
+            GitlabRemote, "token", "https://gitlab.example.com/api/v4", io
+        )
+
+        assert first is second
+        assert first.base_url == "https://gitlab.example.com/api/v4"
+        # Pooled GitLab remotes answer lookups from group indexes.
+        assert first.group_prefetch
+
+    def test_get_remote_keys_on_type_url_and_token(self, io) -> None:
+        base = RemoteRegistry.get_remote(GitlabRemote, "token", None, io)
+        other_token = RemoteRegistry.get_remote(GitlabRemote, "other", None, io)
+        other_type = RemoteRegistry.get_remote(GithubRemote, "token", None, io)
+
+        assert base is not other_token
+        assert base is not other_type
+        assert base.base_url == "https://gitlab.com/api/v4"
+        # Every pooled remote shares the same keep-alive client.
+        assert base.http_client is other_token.http_client is other_type.http_client
+
+    def test_gitlab_ids_are_kept_between_runs(self, io, monkeypatch, tmp_path) -> None:
+        from wexample_filestate_git.remote.cache.sqlite_cache_store import (
+            SqliteCacheStore,
+        )
+
+        # Restored after the test: configure() has no way to unset the store.
+        monkeypatch.setattr(RemoteRegistry, "_cache_store_configured", None)
+        RemoteRegistry.configure(
+            cache_store=SqliteCacheStore(path=tmp_path / "cache.sqlite3")
+        )
+        remote = RemoteRegistry.get_remote(GitlabRemote, "token", None, io)
+        remote.id_cache.set_project_id(remote.get_base_url(), "ns/repo", 7)
+
+        RemoteRegistry.reset()
+        remote = RemoteRegistry.get_remote(GitlabRemote, "token", None, io)
+
+        assert remote.id_cache.get_project_id(remote.get_base_url(), "ns/repo") == 7
+
+    def test_configure_per_host_pool_size(self) -> None:
+        RemoteRegistry.configure(
+            pool_maxsize=4, per_host_maxsize={"gitlab.example.com": 16}
+        )
+        session = RemoteRegistry.get_http_client().get_session()
+
+        host_adapter = session.get_adapter("https://gitlab.example.com/api/v4/user")
+        default_adapter = session.get_adapter("https://github.com/")
+
+        assert host_adapter._pool_maxsize == 16
+        assert default_adapter._pool_maxsize == 4
+
+        RemoteRegistry.configure(pool_maxsize=10, per_host_maxsize={})
+
+    def test_pooled_request_goes_through_shared_client(self, io) -> None:
+        from unittest.mock import patch
+
+        import requests
+
+        remote = RemoteRegistry.get_remote(GithubRemote, "token", None, io)
+        response = requests.Response()
+        response.status_code = 404
+
+        with patch.object(
+            remote.http_client, "request", return_value=response
+        ) as mock_request:
+            exists = remote.check_repository_exists("test-repo", "test-namespace")
+
+        assert exists is False
+        mock_request.assert_called_once()
+        assert (
+            mock_request.call_args[1]["url"]
+            == "https://api.github.com/repos/test-namespace/test-repo"
+        )
+        assert mock_request.call_args[1]["headers"]["Authorization"] == "token token"
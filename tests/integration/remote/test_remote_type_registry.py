@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import pytest
+
+from wexample_filestate_git.remote.github_remote import GithubRemote
+from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+from wexample_filestate_git.remote.remote_type_registry import RemoteTypeRegistry
+
+
+class TestRemoteTypeRegistry:
+    """Test cases for remote type detection."""
+
+    @pytest.fixture(autouse=True)
+    def registry(self):
+        from wexample_filestate_git.remote.cache.memory_cache_store import (
+            MemoryCacheStore,
+        )
+        from wexample_filestate_git.remote.remote_registry import RemoteRegistry
+
+        RemoteTypeRegistry.reset()
+        RemoteRegistry.configure(cache_store=MemoryCacheStore())
+        yield RemoteTypeRegistry
+        RemoteTypeRegistry.reset()
+        RemoteRegistry._cache_store_configured = None
+        RemoteRegistry.reset()
+
+    def test_known_hosts(self) -> None:
+        assert RemoteTypeRegistry.detect("git@github.com:ns/repo.git") is GithubRemote
+        assert (
+            RemoteTypeRegistry.detect("ssh://git@gitlab.example.com:4567/ns/repo.git")
+            is GitlabRemote
+        )
+        assert RemoteTypeRegistry.get_type("GitLab") is GitlabRemote
+
+    def test_declared_host_mapping(self) -> None:
+        RemoteTypeRegistry.configure(host_mappings={"git.example.com": "gitlab"})
+
+        assert (
+            RemoteTypeRegistry.detect("https://git.example.com/ns/repo.git")
+            is GitlabRemote
+        )
+
+    def test_declared_remote_type_spares_the_probe(self, monkeypatch) -> None:
+        def probe_host(cls, host: str) -> bool:
+            raise AssertionError(f"{host} must not be probed")
+
+        monkeypatch.setattr(GitlabRemote, "probe_host", classmethod(probe_host))
+        monkeypatch.setattr(GithubRemote, "probe_host", classmethod(probe_host))
+
+        RemoteTypeRegistry.declare("git@git.example.com:ns/declared.git", "GitLab")
+        RemoteTypeRegistry.declare("git@other.example.com:ns/repo.git", "unknown")
+
+        assert (
+            RemoteTypeRegistry.detect("https://git.example.com/ns/other.git")
+            is GitlabRemote
+        )
+        # Known on the next run too.
+        RemoteTypeRegistry.reset()
+        assert (
+            RemoteTypeRegistry.detect("https://git.example.com/ns/other.git")
+            is GitlabRemote
+        )
+
+    def test_broken_plugin_is_logged(self, monkeypatch, caplog) -> None:
+        from importlib.metadata import EntryPoint
+
+        broken = EntryPoint(
+            name="broken",
+            value="missing_forge_package:Remote",
+            group="wexample_filestate_git.remotes",
+        )
+        monkeypatch.setattr("importlib.metadata.entry_points", lambda group: [broken])
+
+        assert set(RemoteTypeRegistry.get_types()) == {"github", "gitlab"}
+        assert "broken" in caplog.text
+        assert "missing_forge_package" in caplog.text
+
+    def test_unknown_host_is_probed_once(self, monkeypatch) -> None:
+        probes = []
+
+        def probe_host(host: str) -> bool:
+            probes.append(host)
+            return True
+
+        monkeypatch.setattr(GithubRemote, "probe_host", staticmethod(lambda h: False))
+        monkeypatch.setattr(GitlabRemote, "probe_host", staticmethod(probe_host))
+
+        assert RemoteTypeRegistry.detect("git@forge.internal:a/b.git") is GitlabRemote
+        assert RemoteTypeRegistry.detect("git@forge.internal:c/d.git") is GitlabRemote
+        # A later run reads the persisted answer.
+        RemoteTypeRegistry.reset()
+        assert RemoteTypeRegistry.detect("git@forge.internal:a/b.git") is GitlabRemote
+
+        assert probes == ["forge.internal"]
+
+    def test_registered_types_are_detected(self) -> None:
+        class ForgeRemote(GitlabRemote):
+            @classmethod
+            def detect_remote_type(cls, remote_url: str) -> bool:
+                return "forge.example.org" in remote_url
+
+        RemoteTypeRegistry.register(ForgeRemote, name="forge")
+
+        assert RemoteTypeRegistry.detect("git@forge.example.org:a/b.git") is ForgeRemote
+        assert RemoteTypeRegistry.get_type("forge") is ForgeRemote
+
+    def test_github_enterprise_ssh_url_is_detected_and_parsed(self) -> None:
+        from wexample_prompt.common.io_manager import IoManager
+
+        RemoteTypeRegistry.configure(host_mappings={"ghe.example.com": "github"})
+        remote_url = "git@ghe.example.com:ns/repo.git"
+
+        assert RemoteTypeRegistry.detect(remote_url) is GithubRemote
+        remote = GithubRemote(io=IoManager(), api_token="test_token")
+        assert remote.parse_repository_url(remote_url) == {
+            "name": "repo",
+            "namespace": "ns",
+        }
+        assert (
+            GithubRemote.build_remote_api_url_from_repo(remote_url)
+            == "https://ghe.example.com/api/v3"
+        )
+        assert (
+            GithubRemote.resolve_url_from_repo_url(
+                "ssh://git@ghe.example.com:2222/ns/repo.git"
+            )
+            == "https://ghe.example.com/ns/repo"
+        )
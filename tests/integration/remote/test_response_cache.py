@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+from wexample_filestate_git.remote.http.response_cache import ResponseCache
+
+
+def _build_response(status_code: int, body: bytes = b"", headers: dict | None = None):
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = body
+    return response
+
+
+class TestResponseCache:
+    """Test cases for conditional GET requests served from the response cache."""
+
+    @pytest.fixture
+    def remote(self, tmp_path) -> GitlabRemote:
+        from unittest.mock import Mock
+
+        from wexample_prompt.common.io_manager import IoManager
+
+        return GitlabRemote(
+            io=IoManager(),
+            api_token="test_token",
+            http_client=Mock(),
+            rate_limit_delay=0.0,
+            response_cache=ResponseCache(directory=tmp_path),
+        )
+
+    def test_not_modified_is_served_from_cache(self, remote) -> None:
+        remote.http_client.request.side_effect = [
+            _build_response(200, b'{"id": 7, "status": "running"}', {"ETag": '"v1"'}),
+            _build_response(304),
+        ]
+
+        first = remote.get_pipeline("test-namespace", "test-repo", 7)
+        second = remote.get_pipeline("test-namespace", "test-repo", 7)
+
+        assert first == second == {"id": 7, "status": "running"}
+        second_call = remote.http_client.request.call_args_list[1][1]
+        assert second_call["headers"]["If-None-Match"] == '"v1"'
+
+    def test_entries_survive_on_disk(self, remote, tmp_path) -> None:
+        from unittest.mock import Mock
+
+        from wexample_prompt.common.io_manager import IoManager
+
+        remote.http_client.request.return_value = _build_response(
+            200, b'{"id": 7}', {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        )
+        remote.get_pipeline("test-namespace", "test-repo", 7)
+
+        # A fresh process: new cache instance pointing at the same directory.
+        other = GitlabRemote(
+            io=IoManager(),
+            api_token="test_token",
+            http_client=Mock(),
+            rate_limit_delay=0.0,
+            response_cache=ResponseCache(directory=tmp_path),
+        )
+        other.http_client.request.return_value = _build_response(304)
+
+        assert other.get_pipeline("test-namespace", "test-repo", 7) == {"id": 7}
+        sent_headers = other.http_client.request.call_args[1]["headers"]
+        assert sent_headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    def test_variables_are_not_persisted(self, remote, tmp_path) -> None:
+        remote.http_client.request.return_value = _build_response(
+            200, b'{"key": "TOKEN", "value": "secret"}', {"ETag": '"v1"'}
+        )
+
+        assert remote.get_ci_variable("test-namespace", "test-repo", "TOKEN")
+        assert not list(tmp_path.rglob("*.json"))
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import pytest
+
+from wexample_filestate_git.repo.branch_reconciliation_plan import (
+    BranchReconciliationPlan,
+)
+from wexample_filestate_git.repo.ref_snapshot import RefSnapshot
+
+BRANCHES = {
+    "main": {"aliases": ["master", "old"]},
+    "develop": {"aliases": ["dev", "devel"]},
+}
+
+
+class TestBranchReconciliationPlan:
+    """Test cases for reconciling every branch alias in one operation."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        from git import Repo
+
+        bare = Repo.init(tmp_path / "remote.git", bare=True)
+        # Stands for the default branch switch a hosting API would make: git
+        # refuses to delete the branch a bare repository's HEAD points to.
+        bare.git.symbolic_ref("HEAD", "refs/heads/main")
+        bare.close()
+        repo = Repo.init(tmp_path / "repo", initial_branch="master")
+        (tmp_path / "repo" / "README.md").write_text("readme")
+        repo.index.add(["README.md"])
+        repo.index.commit("Initial commit")
+        repo.create_head("dev")
+        repo.create_head("old")
+        repo.create_head("devel").checkout()
+        repo.index.commit("Devel work")
+        repo.heads.master.checkout()
+
+        origin = repo.create_remote("origin", str(tmp_path / "remote.git"))
+        origin.push(refspec=["master", "dev", "devel", "old"])
+        repo.delete_head("old")
+        origin.fetch()
+        yield repo
+        repo.close()
+
+    def test_plans_every_alias_from_one_snapshot(self, repo) -> None:
+        plan = BranchReconciliationPlan.build(
+            RefSnapshot.read(repo.working_tree_dir), BRANCHES
+        )
+
+        assert [step.describe() for step in plan.local_steps] == [
+            "rename 'master' → 'main'",
+            "rename 'dev' → 'develop'",
+            "merge 'devel' into 'develop'",
+        ]
+        assert [step.describe() for step in plan.get_remote_steps("origin")] == [
+            "push 'main' to origin",
+            "push 'develop' to origin",
+            "delete 'master' on origin",
+            "delete 'old' on origin",
+            "delete 'dev' on origin",
+            "delete 'devel' on origin",
+        ]
+
+    def test_conflict_error_is_raised_when_planning(self, repo) -> None:
+        repo.create_head("main")
+
+        with pytest.raises(ValueError, match="manual resolution"):
+            BranchReconciliationPlan.build(
+                RefSnapshot.read(repo.working_tree_dir),
+                {"main": {"aliases": ["master"], "on_alias_conflict": "error"}},
+            )
+
+    def test_operation_applies_the_whole_plan(
+        self, repo, tmp_path, monkeypatch
+    ) -> None:
+        from unittest.mock import Mock
+
+        from git import Repo
+
+        from wexample_filestate_git.operation.git_reconcile_branches_operation import (
+            GitReconcileBranchesOperation,
+        )
+        from wexample_filestate_git.repo.git_push_batcher import GitPushBatcher
+
+        pushes = []
+        push = GitPushBatcher.push
+        monkeypatch.setattr(
+            GitPushBatcher,
+            "push",
+            lambda batcher, remote_name, refspecs: pushes.append(refspecs)
+            or push(batcher, remote_name, refspecs),
+        )
+        plan = BranchReconciliationPlan.build(
+            RefSnapshot.read(repo.working_tree_dir), BRANCHES
+        )
+        target = Mock(get_path=lambda: tmp_path / "repo")
+
+        GitReconcileBranchesOperation(
+            option=Mock(), target=target, plan=plan, description="Reconcile"
+        ).apply_operation()
+
+        remote = Repo(tmp_path / "remote.git")
+        assert {head.name for head in remote.heads} == {"main", "develop"}
+        assert remote.heads.develop.commit.message == "Devel work"
+        remote.close()
+        assert {head.name for head in repo.heads} == {"main", "develop"}
+        # No hosting API to switch the default branch: one push does it all.
+        assert pushes == [
+            ["main:main", "develop:develop", ":master", ":old", ":dev", ":devel"]
+        ]
+        target.log.assert_not_called()
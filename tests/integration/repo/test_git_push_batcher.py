@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+
+from wexample_filestate_git.repo.git_push_batcher import GitPushBatcher
+from wexample_filestate_git.repo.push_ref_status import PushRefStatus
+
+
+class TestGitPushBatcher:
+    """Test cases for atomic multi-refspec pushes."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        from git import Repo
+
+        Repo.init(tmp_path / "remote.git", bare=True).close()
+        repo = Repo.init(tmp_path / "repo", initial_branch="main")
+        (tmp_path / "repo" / "README.md").write_text("readme")
+        repo.index.add(["README.md"])
+        repo.index.commit("Initial commit")
+        repo.create_remote("origin", str(tmp_path / "remote.git"))
+        repo.git.push("origin", "main", "main:old")
+        yield repo
+        repo.close()
+
+    def _get_remote_heads(self, tmp_path) -> set[str]:
+        from git import Repo
+
+        remote = Repo(tmp_path / "remote.git")
+        heads = {head.name for head in remote.heads}
+        remote.close()
+        return heads
+
+    def test_refspecs_are_pushed_in_one_batch(self, repo, tmp_path) -> None:
+        batcher = GitPushBatcher(repo=repo)
+        batcher.add_branch("origin", "main")
+        repo.create_head("new")
+        batcher.add_branch("origin", "new")
+        batcher.add_deletion("origin", "old")
+        batcher.add_branch("origin", "new")
+
+        assert batcher.get_pending("origin") == ["main:main", "new:new", ":old"]
+        statuses = batcher.flush("origin")
+
+        assert {(status.flag, status.to_ref) for status in statuses} == {
+            ("=", "refs/heads/main"),
+            ("*", "refs/heads/new"),
+            ("-", "refs/heads/old"),
+        }
+        assert self._get_remote_heads(tmp_path) == {"main", "new"}
+        assert batcher.get_pending("origin") == []
+        assert batcher.flush("origin") == []
+
+    def test_one_rejected_ref_rejects_the_whole_batch(self, repo, tmp_path) -> None:
+        repo.create_head("new")
+        # Rewrite main: the remote refuses a non fast-forward update.
+        repo.index.commit("Amended", parent_commits=[], head=True)
+
+        statuses = GitPushBatcher(repo=repo).push(
+            "origin", ["main:main", "new:new", ":old"]
+        )
+
+        assert all(status.is_rejected() for status in statuses)
+        assert self._get_remote_heads(tmp_path) == {"main", "old"}
+
+    def test_stale_tracking_ref_does_not_fail_the_batch(self, repo, tmp_path) -> None:
+        from git import Repo
+
+        from wexample_filestate_git.repo.ref_snapshot import RefSnapshot
+
+        repo.git.fetch("origin")
+        # Deleted upstream since the last fetch: the tracking ref is stale.
+        remote = Repo(tmp_path / "remote.git")
+        remote.delete_head("old", force=True)
+        remote.close()
+        repo.create_head("new")
+
+        statuses = GitPushBatcher(repo=repo).push("origin", ["new:new", ":old"])
+
+        assert [(status.flag, status.to_ref) for status in statuses] == [
+            ("*", "refs/heads/new")
+        ]
+        assert self._get_remote_heads(tmp_path) == {"main", "new"}
+        assert not RefSnapshot.read(repo.working_tree_dir).has_remote_head(
+            "origin", "old"
+        )
+
+    def test_push_which_cannot_run_raises(self, repo) -> None:
+        with pytest.raises(RuntimeError, match="missing"):
+            GitPushBatcher(repo=repo).push("missing", ["main:main"])
+
+    def test_porcelain_lines_are_parsed(self) -> None:
+        status = PushRefStatus.from_porcelain_line(
+            "!\trefs/heads/main:refs/heads/main\t[rejected] (fetch first)"
+        )
+
+        assert status.is_rejected()
+        assert status.summary == "[rejected]"
+        assert status.reason == "fetch first"
+        assert status.describe() == "'refs/heads/main' [rejected] (fetch first)"
+        assert PushRefStatus.from_porcelain_line("To /tmp/remote.git") is None
+        assert PushRefStatus.from_porcelain_line("Done") is None
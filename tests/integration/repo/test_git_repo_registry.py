@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from wexample_filestate_git.repo.git_repo_registry import GitRepoRegistry
+
+
+class TestGitRepoRegistry:
+    """Test cases for the shared GitPython Repo handles."""
+
+    @pytest.fixture(autouse=True)
+    def reset_registry(self):
+        GitRepoRegistry.reset()
+        yield
+        GitRepoRegistry.configure(max_size=64)
+        GitRepoRegistry.reset()
+
+    def _init_repo(self, path: Path) -> Path:
+        from git import Repo
+
+        repo = Repo.init(path)
+        (path / "README.md").write_text("readme")
+        repo.index.add(["README.md"])
+        repo.index.commit("Initial commit")
+        repo.close()
+        return path
+
+    def test_one_handle_per_work_tree(self, tmp_path) -> None:
+        path = self._init_repo(tmp_path / "repo")
+
+        repo = GitRepoRegistry.get_repo(path)
+
+        assert GitRepoRegistry.get_repo(str(path)) is repo
+        assert GitRepoRegistry.get_repo(tmp_path / "repo" / ".." / "repo") is repo
+        assert GitRepoRegistry.get_size() == 1
+
+    def test_evicted_handles_are_closed(self, tmp_path) -> None:
+        GitRepoRegistry.configure(max_size=2)
+        paths = [self._init_repo(tmp_path / f"repo-{i}") for i in range(3)]
+
+        first = GitRepoRegistry.get_repo(paths[0])
+        assert first.head.commit.message == "Initial commit"
+        assert first.git.cat_file_all is not None
+        GitRepoRegistry.get_repo(paths[1])
+        GitRepoRegistry.get_repo(paths[2])
+
+        assert GitRepoRegistry.get_size() == 2
+        # The persistent cat-file process of the evicted handle is stopped.
+        assert first.git.cat_file_all is None
+        assert GitRepoRegistry.get_repo(paths[0]) is not first
+
+    def test_applied_operations_invalidate_their_target(self, tmp_path) -> None:
+        from unittest.mock import Mock
+
+        from wexample_filestate_git.operation.git_remote_add_operation import (
+            GitRemoteAddOperation,
+        )
+
+        path = self._init_repo(tmp_path / "repo")
+        repo = GitRepoRegistry.get_repo(path)
+        operation = GitRemoteAddOperation(
+            option=Mock(),
+            target=Mock(get_path=lambda: path),
+            remotes=[{"name": "origin", "url": "https://example.com/repo.git"}],
+        )
+
+        operation.apply_operation()
+
+        fresh = GitRepoRegistry.get_repo(path)
+        assert fresh is not repo
+        assert [remote.name for remote in fresh.remotes] == ["origin"]
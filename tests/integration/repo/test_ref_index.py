@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import time
+
+from wexample_filestate_git.repo.ref_index import RefIndex
+
+
+class TestRefIndex:
+    """Test cases for the compact sorted ref index."""
+
+    def _build_refs(self, count: int) -> dict[str, str]:
+        refs = {}
+        for i in range(count):
+            kind = "remotes/origin" if i % 3 == 0 else "heads"
+            refs[f"refs/{kind}/feature/{i:06d}"] = f"{i:040x}"
+        return refs
+
+    def test_lookups_and_prefix_queries(self) -> None:
+        index = RefIndex.from_refs(
+            {
+                "refs/heads/main": "a" * 40,
+                "refs/heads/develop": "b" * 40,
+                "refs/heads/dev": "c" * 40,
+                "refs/remotes/origin/main": "a" * 40,
+                "refs/tags/v1.0.0": "d" * 40,
+                "refs/heads/broken": "not an object id",
+            }
+        )
+
+        assert len(index) == 5
+        assert "refs/heads/main" in index
+        assert "refs/heads/broken" not in index
+        assert index.get("refs/heads/dev") == "c" * 40
+        assert index.get("refs/heads/missing") is None
+        assert index.get_names("refs/heads/dev") == [
+            "refs/heads/dev",
+            "refs/heads/develop",
+        ]
+        assert index.get_names("refs/remotes/") == ["refs/remotes/origin/main"]
+
+    def test_sha256_object_ids(self) -> None:
+        index = RefIndex.from_refs({"refs/heads/main": "e" * 64})
+
+        assert index.get("refs/heads/main") == "e" * 64
+
+    def test_stays_compact_and_fast_at_100k_refs(self) -> None:
+        refs = self._build_refs(100_000)
+        index = RefIndex.from_refs(refs)
+        names = list(refs)[::997]
+
+        started = time.perf_counter()
+        for name in names:
+            assert index.get(name) == refs[name]
+        elapsed = (time.perf_counter() - started) / len(names)
+
+        assert len(index) == 100_000
+        assert index.get_memory_size() < 6 * 1024 * 1024
+        assert elapsed < 0.001
+        assert len(index.get_names("refs/remotes/origin/feature/001")) == 333
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from wexample_filestate_git.repo.ref_snapshot import RefSnapshot
+
+
+class TestRefSnapshot:
+    """Test cases for reading refs and remotes without git subprocesses."""
+
+    @pytest.fixture(autouse=True)
+    def reset_snapshots(self):
+        RefSnapshot.reset()
+        yield
+        RefSnapshot.reset()
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        from git import Repo
+
+        repo = Repo.init(tmp_path / "repo", initial_branch="main")
+        (tmp_path / "repo" / "README.md").write_text("readme")
+        repo.index.add(["README.md"])
+        commit = repo.index.commit("Initial commit")
+        repo.create_head("develop")
+        repo.create_head("feature/nested")
+        repo.create_tag("v1.0.0")
+        repo.create_remote("origin", "git@example.com:group/repo.git")
+        repo.create_remote("upstream", "https://example.com/group/repo.git")
+        for ref in ("origin/main", "origin/legacy", "upstream/main"):
+            repo.git.update_ref(f"refs/remotes/{ref}", commit.hexsha)
+        repo.git.symbolic_ref("refs/remotes/origin/HEAD", "refs/remotes/origin/main")
+        # Half of the refs packed, the other half loose.
+        repo.git.pack_refs("--all")
+        repo.create_head("hotfix")
+        repo.git.update_ref("refs/remotes/origin/hotfix", commit.hexsha)
+        yield repo
+        repo.close()
+
+    def test_matches_gitpython(self, repo) -> None:
+        snapshot = RefSnapshot.read(repo.working_tree_dir)
+
+        assert set(snapshot.get_branch_names()) == {h.name for h in repo.heads}
+        assert snapshot.refs.get("refs/heads/hotfix") == repo.heads.hotfix.commit.hexsha
+        assert snapshot.get_head_branch() == "main"
+        assert snapshot.get_remote_names() == [r.name for r in repo.remotes]
+        for remote in repo.remotes:
+            assert snapshot.get_remote_urls(remote.name) == list(remote.urls)
+            assert set(snapshot.get_remote_heads(remote.name)) == {
+                ref.remote_head for ref in remote.refs if ref.remote_head != "HEAD"
+            }
+        assert snapshot.has_remote_head("origin", "legacy")
+        assert not snapshot.has_remote_head("upstream", "legacy")
+        assert snapshot.refs.get_names("refs/tags/") == ["refs/tags/v1.0.0"]
+
+    def test_snapshots_are_memoized_until_refs_change(self, repo) -> None:
+        path = repo.working_tree_dir
+        snapshot = RefSnapshot.read(path)
+
+        assert RefSnapshot.read(path) is snapshot
+
+        repo.create_head("release")
+        changed = RefSnapshot.read(path)
+        assert changed is not snapshot
+        assert changed.has_branch("release")
+
+        repo.git.pack_refs("--all")
+        repo.delete_remote(repo.remote("upstream"))
+        assert RefSnapshot.read(path).get_remote_names() == ["origin"]
+
+    def test_reads_without_git_subprocess(self, repo, monkeypatch) -> None:
+        import subprocess
+
+        def forbidden(*args, **kwargs):
+            raise AssertionError("git subprocess started")
+
+        monkeypatch.setattr(subprocess, "Popen", forbidden)
+
+        assert RefSnapshot.read(repo.working_tree_dir).has_branch("develop")
+        assert RefSnapshot.read(Path(repo.working_tree_dir) / "README.md") is None